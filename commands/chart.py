@@ -0,0 +1,47 @@
+import io
+
+import discord
+from discord.ext import commands
+
+from utils.chart_utils import points_chart
+from utils.common_utils import normalize_key, match_key
+from utils.snapshot_utils import get_snapshot
+
+DEFAULT_CHART_DRIVERS = 5
+
+@commands.command(name="chart", help="Plot cumulative points per round. Usage: !chart F1 [drivers...]")
+async def chart_command(ctx, league: str = None, *drivers: str):
+    if not league:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!chart F1` or `!chart F1 Max Lewis`", color=discord.Color.red()))
+        return
+
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
+
+        league = league.upper()
+        progression = snapshot.results.points_progression(league)
+        if progression.empty:
+            await ctx.send(embed=discord.Embed(description=f"❌ No race results found for `{league}`.", color=discord.Color.red()))
+            return
+
+        if drivers:
+            names = {normalize_key(name): name for name in progression.columns}
+            selected = []
+            for driver in drivers:
+                key = match_key(driver, names)
+                if key is None:
+                    await ctx.send(embed=discord.Embed(description=f"❌ Driver `{driver}` has no {league} results.", color=discord.Color.red()))
+                    return
+                selected.append(names[key])
+        else:
+            selected = progression.iloc[-1].sort_values(ascending=False).index[:DEFAULT_CHART_DRIVERS].tolist()
+
+        async with ctx.typing():
+            png = await points_chart(snapshot, league, tuple(sorted(set(selected))))
+        await ctx.send(file=discord.File(io.BytesIO(png), filename=f"{league}_points.png"))
+
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error drawing the chart: {str(e)}", color=discord.Color.red()))
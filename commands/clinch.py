@@ -0,0 +1,67 @@
+import discord
+from discord.ext import commands
+
+from commands.race import BASE_RACE_START_DATES, TOTAL_ROUNDS
+from utils.clinch_utils import POINTS_SYSTEM, title_contenders
+from utils.render_cache import cached_render, send_payload
+from utils.snapshot_utils import get_snapshot
+from utils.standings_utils import standings_table
+
+def describe_contenders(contenders: list[dict], remaining: int, slots: int) -> str:
+    if not contenders:
+        return "No standings available."
+    leader = contenders[0]
+    if len(contenders) == 1:
+        return f"🏆 **{leader['name']}** has clinched the title ({leader['points']} pts)"
+
+    lines = []
+    for contender in contenders:
+        if contender["gap"] == 0:
+            margin = contender["points"] - max(c["points"] for c in contenders if c is not contender)
+            needed = contender["to_clinch"]
+            if needed > remaining * sum(POINTS_SYSTEM[:slots]):
+                clinch = "cannot clinch on their own results"
+            else:
+                clinch = f"clinches with {needed} more pts (beating the runner-up's max of {contender['points'] + needed - 1})"
+            lead = f"leads by {margin}" if margin else "level on points"
+            lines.append(f"👑 **{contender['name']}** - {contender['points']} pts | {lead}, {clinch}")
+        else:
+            line = (f"**{contender['name']}** - {contender['points']} pts (max {contender['max_points']}) | "
+                    f"must outscore {leader['name']} by {contender['gap']} over {remaining} rounds")
+            if not contender["confirmed"]:
+                line += " ⚠️ needs very specific results"
+            lines.append(line)
+    return "\n".join(lines)
+
+def render_clinch(snapshot, league: str) -> list[dict]:
+    remaining = max(TOTAL_ROUNDS - snapshot.results.completed_rounds(league), 0)
+    embed = discord.Embed(
+        title=f"🧮 {league} Title Fight - {remaining} rounds left",
+        color=discord.Color.gold()
+    )
+    for kind, label, slots in (("driver", "Drivers", 1), ("constructor", "Constructors", 2)):
+        table = standings_table(snapshot.sheets, league, kind)
+        standings = list(zip(table["Name"], table["Points"].astype(int)))
+        contenders = title_contenders(standings, remaining, slots)
+        embed.add_field(name=label, value=describe_contenders(contenders, remaining, slots)[:1024], inline=False)
+    embed.set_footer(text=f"Points per race: {'-'.join(str(p) for p in POINTS_SYSTEM)}")
+    return [{"embed": embed}]
+
+@commands.command(name="clinch", help="Who can still win the drivers' and constructors' titles. Usage: !clinch F1")
+async def clinch_command(ctx, league: str = None):
+    league = (league or "").upper()
+    if league.lower() not in BASE_RACE_START_DATES:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!clinch F1`, `!clinch F2` or `!clinch F3`", color=discord.Color.red()))
+        return
+
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
+
+        payload = cached_render("clinch", (league,), snapshot.version, lambda: render_clinch(snapshot, league))
+        await send_payload(ctx, payload)
+
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error calculating the title fight: {str(e)}", color=discord.Color.red()))
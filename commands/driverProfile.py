@@ -0,0 +1,42 @@
+import discord
+from discord.ext import commands
+
+from utils.snapshot_utils import get_snapshot
+
+@commands.command(name="driver", help="Show a driver's standings, infractions and number across all leagues. Usage: !driver <name>")
+async def driver_profile(ctx, *, name: str = None):
+    if not name:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!driver <name>`", color=discord.Color.red()))
+        return
+
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
+
+        profile = snapshot.drivers.find(name)
+        if profile is None:
+            await ctx.send(embed=discord.Embed(description=f"❌ Driver `{name}` not found.", color=discord.Color.red()))
+            return
+
+        title = f"🏎️ {profile['name']}" + (f" #{profile['number']}" if profile["number"] is not None else "")
+        embed = discord.Embed(title=title, color=discord.Color.gold())
+
+        standings = "\n".join(
+            f"**{league}** - P{position} | {points} pts"
+            for league, (position, points) in profile["standings"].items()
+        )
+        embed.add_field(name="Standings", value=standings or "Not classified", inline=False)
+
+        for category, label in (("PP", "Penalty Points"), ("LW", "Lag Warnings"), ("REP", "Reprimands")):
+            per_league = profile[category]
+            value = f"**{sum(per_league.values())}**"
+            if per_league:
+                value += " (" + ", ".join(f"{league}: {count}" for league, count in per_league.items()) + ")"
+            embed.add_field(name=label, value=value, inline=True)
+
+        await ctx.send(embed=embed)
+
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error fetching driver profile: {str(e)}", color=discord.Color.red()))
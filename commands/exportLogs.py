@@ -0,0 +1,106 @@
+import asyncio
+import csv
+import os
+import shutil
+from datetime import date, timedelta
+
+import discord
+from discord.ext import commands
+
+from commands.trainees import CSV_FILE as TRAINEE_CSV_FILE
+from utils.export_utils import EXPORT_FORMATS, export_rows
+from utils.penalty_log_utils import EXPORT_COLUMNS, iter_penalties
+
+# Get server IDs as a set of integers
+ALLOWED_SERVER_IDS = set(
+    int(id.strip()) for id in os.getenv("ALLOWED_SERVER_IDS", "").split(",") if id.strip()
+)
+
+TRAINEE_COLUMNS = ["Trainee", "Suggestion", "Thread Link", "Status", "Timestamp"]
+
+def iter_trainee_suggestions(start: str = None, end: str = None):
+    """Yield trainee suggestion rows one line at a time, filtered by timestamp."""
+    if not os.path.exists(TRAINEE_CSV_FILE):
+        return
+    with open(TRAINEE_CSV_FILE, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        for row in reader:
+            timestamp = row[4] if len(row) > 4 else ""
+            if (start and timestamp < start) or (end and timestamp >= end):
+                continue
+            yield row
+
+def parse_export_args(args: tuple[str, ...]) -> dict:
+    """
+    Sort the free-form arguments of !exportLogs: a format, up to two dates (from, to),
+    'trainees' for the suggestion log, anything else is the league.
+    :raises ValueError: On an argument that cannot be placed.
+    """
+    options = {"source": "penalties", "league": None, "dates": [], "format": "csv"}
+    for arg in args:
+        lowered = arg.lower().removeprefix("format=")
+        if lowered in EXPORT_FORMATS:
+            options["format"] = lowered
+        elif lowered in ("trainees", "trainee", "suggestions"):
+            options["source"] = "trainees"
+        elif arg[:1].isdigit():
+            options["dates"].append(date.fromisoformat(arg))
+        elif options["league"] is None:
+            options["league"] = arg
+        else:
+            raise ValueError(f"Unexpected argument `{arg}`")
+    if len(options["dates"]) > 2:
+        raise ValueError("Give at most two dates: from and to.")
+    return options
+
+@commands.command(name="exportLogs", help="Export penalty or trainee logs. Usage: !exportLogs [league|trainees] [from] [to] [csv|json|xlsx]")
+async def export_logs(ctx, *args: str):
+    if ctx.guild.id not in ALLOWED_SERVER_IDS:
+        await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
+        return
+
+    # ✅ Role check
+    allowed_roles = ["Admin", "Steward"]
+    user_roles = [role.name for role in ctx.author.roles]
+
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
+
+    try:
+        options = parse_export_args(args)
+    except ValueError as e:
+        await ctx.send(embed=discord.Embed(
+            description=f"❌ {e}\n**Usage:** `!exportLogs [league|trainees] [2025-06-01] [2025-06-30] [csv|json|xlsx]`",
+            color=discord.Color.red()
+        ))
+        return
+
+    dates = options["dates"]
+    start = dates[0].isoformat() if dates else None
+    end = (dates[1] + timedelta(days=1)).isoformat() if len(dates) > 1 else None  # "to" is inclusive
+
+    if options["source"] == "trainees":
+        rows, header, basename = iter_trainee_suggestions(start, end), TRAINEE_COLUMNS, "trainee_suggestions"
+    else:
+        rows, header = iter_penalties(options["league"], start, end), EXPORT_COLUMNS
+        basename = f"penalty_log_{options['league']}" if options["league"] else "penalty_log"
+
+    directory = None
+    try:
+        async with ctx.typing():
+            directory, paths = await asyncio.to_thread(
+                export_rows, rows, header, options["format"], basename, ctx.guild.filesize_limit
+            )
+        if not paths:
+            await ctx.send("⚠️ No records match these filters.")
+            return
+        for number, path in enumerate(paths, 1):
+            content = f"📦 Part {number}/{len(paths)}" if len(paths) > 1 else None
+            await ctx.send(content, file=discord.File(path))
+    except Exception as e:
+        await ctx.send(f"❌ Failed to export logs: {e}")
+    finally:
+        if directory:
+            shutil.rmtree(directory, ignore_errors=True)
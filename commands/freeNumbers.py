@@ -1,26 +1,24 @@
 import discord
 from discord.ext import commands
-from openpyxl import load_workbook
 
-@commands.command(name="freeNumbers", aliases=["fr"])
-async def free_numbers(ctx):
-    # Load workbook and sheet
-    wb = load_workbook("Formula V SuperLicense.xlsx", read_only=True, data_only=True)
-    sheet = wb["Drivers"]
+from utils.snapshot_utils import get_snapshot
 
-    unassigned = []
+async def get_roster(ctx):
+    snapshot = get_snapshot()
+    if snapshot is None:
+        await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+        return None
+    return snapshot.numbers
 
-    # Loop through rows 8 to 106 (inclusive)
-    for row in range(8, 107):
-        number = sheet.cell(row=row, column=37).value  # AK
-        name = sheet.cell(row=row, column=38).value    # AL
-
-        if number is not None and (name is None or str(name).strip() == ""):
-            unassigned.append(int(number))
+@commands.command(name="freeNumbers", aliases=["fr"])
+async def free_numbers(ctx):
+    roster = await get_roster(ctx)
+    if roster is None:
+        return
 
     # Format the message
+    unassigned = roster.free_numbers()
     if unassigned:
-        unassigned.sort()
         numbers_str = ", ".join(str(n) for n in unassigned)
     else:
         numbers_str = "All numbers are assigned."
@@ -32,3 +30,35 @@ async def free_numbers(ctx):
         color=discord.Color.blue()
     )
     await ctx.send(embed=embed)
+
+@commands.command(name="number", aliases=["nr"])
+async def number_check(ctx, number: int):
+    roster = await get_roster(ctx)
+    if roster is None:
+        return
+
+    if roster.is_free(number):
+        embed = discord.Embed(description=f"✅ **#{number}** is free.", color=discord.Color.green())
+    elif number in roster.owners:
+        embed = discord.Embed(description=f"❌ **#{number}** is taken by **{roster.owners[number]}**.", color=discord.Color.red())
+    else:
+        embed = discord.Embed(description=f"⚠️ **#{number}** is not on the number list.", color=discord.Color.orange())
+    await ctx.send(embed=embed)
+
+@commands.command(name="suggestnumber", aliases=["sn"])
+async def suggest_number(ctx, preferred: int):
+    roster = await get_roster(ctx)
+    if roster is None:
+        return
+
+    if roster.is_free(preferred):
+        await ctx.send(embed=discord.Embed(description=f"✅ **#{preferred}** is free, grab it!", color=discord.Color.green()))
+        return
+
+    suggestions = roster.nearest_free(preferred)
+    embed = discord.Embed(
+        title=f"🔢 #{preferred} is not available",
+        description=("Closest free numbers: " + ", ".join(f"**{n}**" for n in suggestions)) if suggestions else "All numbers are assigned.",
+        color=discord.Color.blue()
+    )
+    await ctx.send(embed=embed)
@@ -0,0 +1,48 @@
+import discord
+from discord.ext import commands
+
+from utils.snapshot_utils import get_snapshot
+
+@commands.command(name="h2h", help="Compare two drivers across all race results. Usage: !h2h <driver A> <driver B> [league] (quote names with spaces)")
+async def h2h_command(ctx, driver_a: str = None, driver_b: str = None, league: str = None):
+    if not driver_a or not driver_b:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!h2h <driver A> <driver B> [league]`", color=discord.Color.red()))
+        return
+
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
+
+        h2h = snapshot.results.head_to_head(driver_a, driver_b, league)
+        if h2h is None:
+            await ctx.send(embed=discord.Embed(description=f"❌ No race results found for `{driver_a}` or `{driver_b}`.", color=discord.Color.red()))
+            return
+
+        name_a, name_b = h2h["names"]
+        if h2h["races"] == 0:
+            where = f" in {league.upper()}" if league else ""
+            await ctx.send(embed=discord.Embed(description=f"❌ **{name_a}** and **{name_b}** have not raced each other{where}.", color=discord.Color.red()))
+            return
+
+        def row(label, values, fmt=str):
+            return f"**{label}:** {fmt(values[0])} - {fmt(values[1])}"
+
+        lines = [
+            row("Finished ahead", h2h["ahead"]),
+            row("Best finish", h2h["best"], lambda p: f"P{p}" if p else "-"),
+            row("Points", h2h["points"]),
+            row("Fastest laps", h2h["fastest_laps"]),
+            row("Penalties", h2h["penalties"]),
+        ]
+        embed = discord.Embed(
+            title=f"⚔️ {name_a} vs {name_b}" + (f" ({league.upper()})" if league else ""),
+            description="\n".join(lines),
+            color=discord.Color.gold()
+        )
+        embed.set_footer(text=f"{h2h['races']} shared races")
+        await ctx.send(embed=embed)
+
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error comparing drivers: {str(e)}", color=discord.Color.red()))
@@ -73,7 +73,8 @@ async def show_help(ctx):
             "`!fastestLap (track)` - Fastest lap on selected track\n"
             "`!lapCount (time)` / `!lc (time)` - Lap count for a set time\n"
             "`!getStarted` - How to get started after being approved\n"
-            "`!signup` - How to get started before being approved\n",
+            "`!signup` - How to get started before being approved\n"
+            "`!freeNumbers` / `!number <n>` / `!suggestnumber <n>` - Driver numbers\n",
             "General"
         ),
         (
@@ -86,9 +87,17 @@ async def show_help(ctx):
         (
             "Results",
             "`!results <race>` - Race results summary\n"
-            "Examples: `!results F1_R1`, `!results F2_R3`\n"
+            "Examples: `!results F1_R1`, `!results f2 r3`\n"
+            "`!results driver <name>` - A driver's whole season\n"
             "`!standings <F1><c>` - Standings (c for constructor)\n"
-            "Example: `!standings F2c`",
+            "Example: `!standings F2c`\n"
+            "`!standings F1 @round5` / `@2025-06-01` - Past standings\n"
+            "`!driver <name>` - Driver profile across all leagues\n"
+            "`!h2h <driver A> <driver B> [league]` - Head-to-head comparison\n"
+            "`!seasonstats [league][c] [sort]` - Wins, podiums, DNFs... (sort: wins, avg, fl, ppr)\n"
+            "`!clinch <league>` - Who can still win the titles\n"
+            "`!chart <league> [drivers...]` - Points progression chart\n"
+            "`!refreshsheet` - Download the spreadsheet now",
             "Results"
         ),
         (
@@ -96,7 +105,8 @@ async def show_help(ctx):
             "`!pp [league]` - Driver penalty points\n"
             "`!lw [league]` - Lag warnings\n"
             "`!rep [league]` - Reprimands\n"
-            "`!pens` - Summary of all penalties across leagues",
+            "`!pens` - Summary of all penalties across leagues\n"
+            "`!sanctions` - Pending sanctions from PP/LW/REP thresholds",
             "Pen recs"
         ),
         (
@@ -116,16 +126,20 @@ async def show_help(ctx):
         ),
         (
             "FIA Penalties",
-            "`!rpo [sprint]` - Start timer (60/90min)\n"
-            "`!cancel` - Cancel timer\n"
+            "`!rpo <league> [sprint]` - Start timer (60/90min), one per league\n"
+            "`!cancel [league]` - Cancel timer\n"
+            "`!penreport [league]` - Post the window's penalty report now\n"
             "`!pen sug`, `!pen pov <name>` - Rename thread\n"
-            "`!pen <type> <name> <reason>` - Apply verdict",
+            "`!pen <type> <name> <reason>` - Apply verdict\n"
+            "`!stewardstats [league] [days]` - Decided threads, turnaround, open threads\n"
+            "`!incidents <driver> [league]` - Every thread involving a driver",
             "Concluding"
         ),
         (
             "Logs",
-            "`!pen getLogs`, `!pen clearLogs` - Logs\n"
-            "`!pen filterLogs`, `!pen sortLogs` - Organize logs",
+            "`!getLogs [league]`, `!clearLogs` - Penalty log as CSV\n"
+            "`!filterLogs [league]` - Latest decision of every thread\n"
+            "`!exportLogs [league|trainees] [from] [to] [csv|json|xlsx]` - Filtered, compressed export",
             "Logs"
         ),
         (
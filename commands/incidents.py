@@ -0,0 +1,57 @@
+import os
+
+import discord
+from discord.ext import commands
+
+from utils.embed_utils import embeds_from_lines, send_embeds
+
+# Get server IDs as a set of integers
+ALLOWED_SERVER_IDS = set(
+    int(id.strip()) for id in os.getenv("ALLOWED_SERVER_IDS", "").split(",") if id.strip()
+)
+
+LEAGUES = {"f1", "f2", "f3", "general", "motovgp", "indy", "fvec", "fr"}
+
+@commands.command(name="incidents", help="Find every penalty thread involving a driver. Usage: !incidents <driver> [league]")
+async def incidents_command(ctx, *, query: str = None):
+    if ctx.guild.id not in ALLOWED_SERVER_IDS:
+        await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
+        return
+
+    # ✅ Role check
+    allowed_roles = ["Admin", "Steward", "League Director", "Trainee Steward"]
+    user_roles = [role.name for role in ctx.author.roles]
+
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
+
+    if not query:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!incidents <driver> [league]`", color=discord.Color.red()))
+        return
+
+    # A trailing league name narrows the search
+    words = query.split()
+    league = words.pop() if len(words) > 1 and words[-1].lower() in LEAGUES else None
+    query = " ".join(words)
+
+    cog = ctx.bot.get_cog('PenaltyCog')
+    if cog is None:
+        await ctx.send("❌ The penalty system is not loaded.")
+        return
+
+    results = cog.incidents.search(query, league)
+    if not results:
+        await ctx.send(embed=discord.Embed(description=f"❌ No incidents found for `{query}`" + (f" in {league.upper()}" if league else "") + ".", color=discord.Color.red()))
+        return
+
+    lines = []
+    for thread_id, thread in results:
+        number = thread["thread"] if thread["thread"] is not None else "?"
+        title = f" {thread['title']}" if thread["title"] else ""
+        outcome = " / ".join(thread["outcomes"]) if thread["outcomes"] else "Pending"
+        lines.append(f"[**{thread['league']} {number})**{title}](https://discord.com/channels/{ctx.guild.id}/{thread_id})\n↳ {outcome}")
+
+    embeds = embeds_from_lines(lines, f"🔎 Incidents: {query}" + (f" ({league.upper()})" if league else ""), discord.Color.gold())
+    embeds[-1].set_footer(text=f"{len(results)} threads")
+    await send_embeds(ctx, embeds)
@@ -1,13 +1,21 @@
 import asyncio
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 import os
-import csv
 
 import discord
 from discord.ext import commands
 
+from models.penalty import PenCommand, PenaltyWindow
+from utils.embed_utils import embeds_from_lines, send_embeds
+from utils.incident_utils import THREAD_PREFIX_PATTERN, IncidentIndex, build_incident_index
+from utils.penalty_log_utils import parse_thread_name, record_decision, add_summary_line, thread_summary, \
+    rebuild_summaries, crossed_threshold, record_thread, record_thread_title, incident_documents, window_report, SummaryCache, \
+    import_legacy_log, LEGACY_CSV, WAITING_FOR_POV, WAITING_FOR_SUGGESTION
+from utils.penalty_utils import parse_pen_command
+from utils.rename_utils import rename_thread, desired_thread_name
 from utils.weather_utils import to_discord_timestamp
+from utils.window_utils import REPORTS_FILE, WindowSchedule, load_windows, save_windows
 
 # Get server IDs as a set of integers
 ALLOWED_SERVER_IDS = set(
@@ -15,14 +23,9 @@ ALLOWED_SERVER_IDS = set(
 )
 
 # Global variables
-timer_message = None
-timer_task = None
-thread_counter = 1
-penalty_summary = {}
-auto_rename_threads = False
+penalty_summary = SummaryCache()
 
 LOG_FILE = "penalty_log.txt"
-CSV_LOG_FILE = "penalty_log.csv"
 
 def log_penalty(user: str, action: str, thread_name: str):
     """Append penalty details to a log file."""
@@ -30,18 +33,30 @@ def log_penalty(user: str, action: str, thread_name: str):
     with open(LOG_FILE, "a", encoding="utf-8") as f:
         f.write(log_entry)
 
-def log_penalty_csv(user: str, action_list: list[str], thread_name: str, league: str = "?"):
-    try:
-        match = re.match(r"(\w+)\s+(\d+)\)", thread_name)
-        league_from_name, thread_num = match.groups() if match else (league, "?")
-    except Exception:
-        league_from_name, thread_num = league, "?"
-
-    combined_actions = "/".join(action_list)
-
-    with open(CSV_LOG_FILE, "a", newline='', encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([league_from_name, thread_num, combined_actions, user])
+def rename_note(wait: float) -> str:
+    """Tell the steward when a queued thread rename will show up."""
+    if not wait:
+        return ""
+    return f"\n\n⏳ Discord limits thread renames; the new name applies {to_discord_timestamp(datetime.now() + timedelta(seconds=wait), 'R')}."
+
+async def add_summary(thread_id: int, line: str):
+    await asyncio.to_thread(add_summary_line, thread_id, line)
+    penalty_summary.extend(thread_id, [line])
+
+def counter_lines(counters: list[tuple]) -> str:
+    """One line per counted infraction, flagging the ones that earn a sanction."""
+    lines = []
+    for driver, type_, before, after in counters:
+        line = f"**{driver}**: {after} {type_.value}"
+        sanction = crossed_threshold(type_, before, after)
+        if sanction:
+            line += f" 🚨 **{ordinal(after)} {type_.value} = {sanction}**"
+        lines.append(line)
+    return "\n".join(lines)
+
+def ordinal(n: int) -> str:
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
 
 def add_tick_to_name(name: str) -> str:
     """Add ✅ at the start if not already present."""
@@ -52,16 +67,144 @@ ALLOWED_CHANNEL_IDS = {1324562135803494520 , 1324565883120521216, 13139824523558
 class PenaltyCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.auto_rename_threads = False
-        self.thread_counter = 1
-        self.current_league = None  
+        self.schedule = WindowSchedule()
+        self.wakeup = asyncio.Event()
+        self.scheduler_task = None
+        self.incidents = IncidentIndex()
+        self.awaiting_reports = []  # closed windows whose threads are not all decided yet
+        self.report_lock = asyncio.Lock()
+
+    async def cog_load(self):
+        imported = await asyncio.to_thread(import_legacy_log)
+        if imported:
+            print(f"[✓] Imported {imported} penalties from the old {LEGACY_CSV}")
+        restored = await asyncio.to_thread(rebuild_summaries)
+        if restored:
+            print(f"[✓] Rebuilt {restored} penalty summary lines from the penalty log")
+        self.incidents = build_incident_index(*await asyncio.to_thread(incident_documents))
+        self.schedule = WindowSchedule(await asyncio.to_thread(load_windows))
+        self.awaiting_reports = await asyncio.to_thread(load_windows, REPORTS_FILE)
+        self.scheduler_task = asyncio.create_task(self.run_windows())
+
+    async def cog_unload(self):
+        if self.scheduler_task:
+            self.scheduler_task.cancel()
+
+    def forget_penalties(self):
+        """Drop what is cached from the penalty store after it was cleared."""
+        penalty_summary.entries.clear()
+        self.incidents = IncidentIndex()
+
+    def save(self):
+        save_windows(list(self.schedule.windows.values()))
+
+    def open_window(self, window: PenaltyWindow):
+        self.schedule.add(window)
+        self.save()
+        self.wakeup.set()
+
+    def cancel_window(self, key: tuple[str, int]) -> PenaltyWindow | None:
+        window = self.schedule.remove(key)
+        if window:
+            self.save()
+            self.wakeup.set()
+        return window
+
+    async def check_reports(self, force_channel_id: int = None, force_league: str = None,
+                            league: str = None, channel_id: int = None) -> int:
+        """
+        Post the report of every closed window whose threads are all decided.
+        :param force_channel_id: Post the reports of this channel's windows even if threads are pending.
+        :param force_league: With force_channel_id, only this league's window.
+        :param league: Only check windows of this league or channel_id, i.e. the one a decision was made in.
+        :param channel_id: See league.
+        :return: Number of reports posted.
+        """
+        async with self.report_lock:
+            posted = 0
+            for window in list(self.awaiting_reports):
+                if (league or channel_id) and window.channel_id != channel_id and (
+                        league is None or window.league.lower() != league.lower()):
+                    continue
+                forced = window.channel_id == force_channel_id and (
+                    force_league is None or window.league.lower() == force_league.lower())
+                threads = await asyncio.to_thread(window_report, window.league, window.opened_at, window.end_time)
+                if not forced and not all(thread["decided"] for thread in threads):
+                    continue
+                try:
+                    await post_report(self.bot, window, threads)
+                except Exception as e:
+                    print(f"[!] Could not post the {window.league} penalty report: {e}")
+                    continue
+                self.awaiting_reports.remove(window)
+                posted += 1
+            if posted:
+                await asyncio.to_thread(save_windows, list(self.awaiting_reports), REPORTS_FILE)
+        return posted
+
+    def league_for_thread(self, channel_id: int, thread_name: str) -> str | None:
+        """League of the open window a thread belongs to, if it can be told."""
+        window = self.schedule.for_thread(channel_id, thread_name)
+        return window.league if window else None
+
+    async def run_windows(self):
+        """Close every window when its time comes, including windows that were open before a restart."""
+        await self.bot.wait_until_ready()
+        while True:
+            due = self.schedule.pop_due(datetime.now())
+            for window in due:
+                self.save()
+                try:
+                    await close_window(self.bot, window)
+                except Exception as e:
+                    print(f"[!] Could not close the {window.league} penalty window: {e}")
+                self.awaiting_reports.append(window)
+                await asyncio.to_thread(save_windows, list(self.awaiting_reports), REPORTS_FILE)
+            if due:
+                await self.check_reports()
+
+            deadline = self.schedule.next_deadline()
+            timeout = None if deadline is None else max(0.0, (deadline - datetime.now()).total_seconds())
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
     @commands.Cog.listener()
     async def on_thread_create(self, thread):
-        if self.auto_rename_threads and thread.parent_id in ALLOWED_CHANNEL_IDS:
-            new_thread_name = f"{self.current_league} {self.thread_counter}) {thread.name}"
-            await thread.edit(name=new_thread_name)
-            self.thread_counter += 1
+        if thread.parent_id not in ALLOWED_CHANNEL_IDS:
+            return
+        await asyncio.to_thread(record_thread_title, thread.id, thread.name)
+        window = self.schedule.for_thread(thread.parent_id, thread.name)
+        if window is None:
+            # No window, or several leagues open and the name does not say which: left unnumbered
+            league, number = parse_thread_name(thread.name)
+            self.incidents.add_thread(thread.id, league, number, thread.name)
+            await asyncio.to_thread(record_thread, thread.id, league, number, thread.created_at or datetime.now(dt_timezone.utc))
+            return
+        # Threads opened by !rpo itself are numbered already
+        numbered = re.match(rf"{re.escape(window.league)} (\d+)\)", thread.name)
+        if numbered:
+            number = int(numbered.group(1))
+        else:
+            number = window.next_thread_number()
+            self.save()
+            rename_thread(thread, f"{window.league} {number}) {thread.name}")
+        self.incidents.add_thread(thread.id, window.league, number, thread.name)
+        await asyncio.to_thread(record_thread, thread.id, window.league, number, thread.created_at or datetime.now(dt_timezone.utc))
+
+    @commands.Cog.listener()
+    async def on_thread_update(self, before, after):
+        if after.parent_id not in ALLOWED_CHANNEL_IDS or before.name == after.name:
+            return
+        await asyncio.to_thread(record_thread_title, after.id, after.name)
+        self.incidents.add_thread(after.id, *parse_thread_name(after.name), after.name)
+
+def window_embed(description: str) -> discord.Embed:
+    embed = discord.Embed(title="FIA", description=description, color=discord.Color.gold())
+    embed.set_thumbnail(url="https://i.ibb.co/GVs75Rk/FV-trans-Square.png")
+    return embed
 
 @commands.command(name='rpo', help='Start a timer and display the status (can specify duration).')
 async def start_timer(ctx, league: str = None, sprint: str = None, duration: int = 60):
@@ -76,8 +219,6 @@ async def start_timer(ctx, league: str = None, sprint: str = None, duration: int
     if not any(role in user_roles for role in allowed_roles):
         await ctx.send("🚫 You do not have permission to use this command.")
         return
-    
-    global timer_message, timer_task, auto_rename_threads, thread_counter
 
     # Modify league check to include F3 and General
     if league not in ["F1", "F2", "F3", "general", "MotoVGP", "Indy", "FVEC", "FR"]:
@@ -85,12 +226,9 @@ async def start_timer(ctx, league: str = None, sprint: str = None, duration: int
         return
 
     cog = ctx.bot.get_cog('PenaltyCog')
-    if cog:
-        cog.thread_counter = 1
-        cog.auto_rename_threads = True
-        cog.current_league = league
-    thread_counter = 1
-    auto_rename_threads = True
+    if cog is None:
+        await ctx.send("❌ The penalty system is not loaded.")
+        return
 
     # Allow the user to set the duration (in minutes). Default is 60, otherwise 90 if sprint is provided.
     if sprint and sprint.lower() == "sprint":
@@ -108,75 +246,69 @@ async def start_timer(ctx, league: str = None, sprint: str = None, duration: int
     end_time_str = to_discord_timestamp(end_time, 't')
     countdown_str = to_discord_timestamp(end_time, 'R')
 
-    embed = discord.Embed(
-        title="FIA",
-        description=(f"Penalty Submission window is now OPEN!\n\n"
-                     ":white_small_square: Describe the incidents in the title\n"
-                     ":white_small_square: Open the thread within the submission window\n"
-                     ":white_small_square: @ all involved drivers\n"
-                     ":white_small_square: Submit all evidence within 24h\n"
-                     ":white_small_square: Leave the investigation to the FIA\n\n\n"
-                     f"The submission window closes {countdown_str} at {end_time_str}"),
-        color=discord.Color.gold()
-    )
-    embed.set_thumbnail(url="https://i.ibb.co/GVs75Rk/FV-trans-Square.png")
+    embed = window_embed(f"Penalty Submission window is now OPEN!\n\n"
+                         ":white_small_square: Describe the incidents in the title\n"
+                         ":white_small_square: Open the thread within the submission window\n"
+                         ":white_small_square: @ all involved drivers\n"
+                         ":white_small_square: Submit all evidence within 24h\n"
+                         ":white_small_square: Leave the investigation to the FIA\n\n\n"
+                         f"The submission window closes {countdown_str} at {end_time_str}")
     timer_message = await ctx.send(embed=embed)
-    timer_task = asyncio.create_task(wait_and_close_timer(ctx, end_time))
-    thread = await ctx.channel.create_thread(name=f"{league} {thread_counter})")
-    thread_counter += 1
 
-async def wait_and_close_timer(ctx, end_time):
-    global auto_rename_threads
-    await asyncio.sleep((end_time - datetime.now()).total_seconds())
-    cog = ctx.bot.get_cog('PenaltyCog')
-    if cog:
-        cog.auto_rename_threads = False
-    auto_rename_threads = False
-    await update_timer_message()
-    await close_timer(ctx, end_time)
-
-async def update_timer_message():
-    global timer_message
-    if timer_message:
-        embed = discord.Embed(
-            title="FIA",
-            description="Penalty Submission window is now OPEN!",
-            color=discord.Color.gold()
-        )
-        embed.set_thumbnail(url="https://i.ibb.co/GVs75Rk/FV-trans-Square.png")
-        await timer_message.edit(embed=embed)
-
-async def close_timer(ctx, end_time):
-    global thread_counter, auto_rename_threads
-    cog = ctx.bot.get_cog('PenaltyCog')
-    if cog:
-        cog.thread_counter = 1
-        cog.auto_rename_threads = False
-    auto_rename_threads = False
-    thread_counter = 1
-
-    embed = discord.Embed(
-        title="FIA",
-        description=(f"Penalty Submission window is now CLOSED!\n\n"
-                     "Abbreviations:\n"
-                     ":white_small_square: TLW - Track limit warning (4th = penalty)\n"
-                     ":white_small_square: LW - Lag warning (3rd = penalty)\n"
-                     ":white_small_square: LI - Incident involving lag was judged by the stewards not worth a penalty\n"
-                     ":white_small_square: REP - Reprimand (3rd = grid drop)\n"
-                     ":white_small_square: Xs - Time penalty\n"
-                     ":white_small_square: GD - Grid drop\n"
-                     ":white_small_square: NFA - Evidence provided but not worthy for steward action\n"
-                     ":white_small_square: NFI - No evidence provided to the FIA\n"
-                     ":white_small_square: RI - Incident was judged by the stewards not worth a penalty\n"
-                     ":white_small_square: SSIR - Incident was self-served in race\n\n"
-                     f"The submission window closed at {to_discord_timestamp(end_time, 't')}"),
-        color=discord.Color.gold()
-    )
-    embed.set_thumbnail(url="https://i.ibb.co/GVs75Rk/FV-trans-Square.png")
-    await ctx.send(embed=embed)
+    # Reopening a league's window in this channel replaces it; other leagues keep their own
+    window = PenaltyWindow(league, ctx.channel.id, timer_message.id, end_time)
+    cog.open_window(window)
+    await ctx.channel.create_thread(name=f"{league} {window.next_thread_number()})")
+    cog.save()
 
-@commands.command(name='cancel', help='Cancel the ongoing timer.')
-async def cancel_timer(ctx):
+async def close_window(bot, window: PenaltyWindow):
+    channel = bot.get_channel(window.channel_id) or await bot.fetch_channel(window.channel_id)
+
+    # Drop the countdown from the opening message
+    try:
+        timer_message = await channel.fetch_message(window.message_id)
+        await timer_message.edit(embed=window_embed("Penalty Submission window is now OPEN!"))
+    except discord.HTTPException:
+        pass
+
+    await channel.send(embed=window_embed(
+        f"{window.league} Penalty Submission window is now CLOSED!\n\n"
+        "Abbreviations:\n"
+        ":white_small_square: TLW - Track limit warning (4th = penalty)\n"
+        ":white_small_square: LW - Lag warning (3rd = penalty)\n"
+        ":white_small_square: LI - Incident involving lag was judged by the stewards not worth a penalty\n"
+        ":white_small_square: REP - Reprimand (3rd = grid drop)\n"
+        ":white_small_square: Xs - Time penalty\n"
+        ":white_small_square: GD - Grid drop\n"
+        ":white_small_square: NFA - Evidence provided but not worthy for steward action\n"
+        ":white_small_square: NFI - No evidence provided to the FIA\n"
+        ":white_small_square: RI - Incident was judged by the stewards not worth a penalty\n"
+        ":white_small_square: SSIR - Incident was self-served in race\n\n"
+        f"The submission window closed at {to_discord_timestamp(window.end_time, 't')}"
+    ))
+
+async def post_report(bot, window: PenaltyWindow, threads: list[dict]):
+    """One message with every thread of a closed window and where it stands."""
+    channel = bot.get_channel(window.channel_id) or await bot.fetch_channel(window.channel_id)
+    lines = []
+    for thread in threads:
+        number = thread["thread"] if thread["thread"] is not None else "?"
+        title = THREAD_PREFIX_PATTERN.sub("", thread["title"])
+        link = f"https://discord.com/channels/{channel.guild.id}/{thread['thread_id']}"
+        header = f"[**{window.league} {number})**{' ' + title if title else ''}]({link})"
+        if thread["decided"]:
+            lines.append(f"{header}\n↳ " + " / ".join(thread["decisions"]))
+        else:
+            lines.append(f"{header}\n↳ ⏳ {thread['state'] or 'Undecided'}")
+    if not lines:
+        lines = ["No incidents were reported in this window."]
+
+    embeds = embeds_from_lines(lines, f"📋 {window.league} Penalty Report", discord.Color.gold())
+    embeds[-1].set_footer(text=f"Window closed {window.end_time:%Y-%m-%d %H:%M} | {len(threads)} threads")
+    await send_embeds(channel, embeds)
+
+@commands.command(name='cancel', help='Cancel the ongoing timer. Usage: !cancel [league]')
+async def cancel_timer(ctx, league: str = None):
     if ctx.guild.id not in ALLOWED_SERVER_IDS:
         await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
         return
@@ -188,19 +320,40 @@ async def cancel_timer(ctx):
         await ctx.send("🚫 You do not have permission to use this command.")
         return    
     
-    global timer_task, timer_message, auto_rename_threads, thread_counter
-    if timer_task and not timer_task.done():
-        timer_task.cancel()
-        cog = ctx.bot.get_cog('PenaltyCog')
-        if cog:
-            cog.thread_counter = 1
-            cog.auto_rename_threads = False
-        auto_rename_threads = False
-        thread_counter = 1
-        embed = discord.Embed(title="Timer Cancelled", description="The penalty submission timer has been cancelled.", color=discord.Color.red())
+    cog = ctx.bot.get_cog('PenaltyCog')
+    windows = cog.schedule.in_channel(ctx.channel.id) if cog else []
+    if league:
+        windows = [w for w in windows if w.league.lower() == league.lower()]
+
+    if len(windows) == 1:
+        cog.cancel_window(windows[0].key)
+        embed = discord.Embed(title="Timer Cancelled", description=f"The {windows[0].league} penalty submission timer has been cancelled.", color=discord.Color.red())
+        await ctx.send(embed=embed)
+    elif windows:
+        leagues = ", ".join(f"`{w.league}`" for w in windows)
+        embed = discord.Embed(title="Several Timers", description=f"Several windows are open here ({leagues}). Use `!cancel <league>`.", color=discord.Color.orange())
         await ctx.send(embed=embed)
     else:
-        embed = discord.Embed(title="No Active Timer", description="There is no ongoing timer to cancel.", color=discord.Color.orange())
+        description = f"There is no {league} timer running here." if league else "There is no ongoing timer to cancel."
+        embed = discord.Embed(title="No Active Timer", description=description, color=discord.Color.orange())
+        await ctx.send(embed=embed)
+
+@commands.command(name='penreport', help='Post the penalty report of a closed window now, even with threads pending. Usage: !penreport [league]')
+async def penalty_report(ctx, league: str = None):
+    if ctx.guild.id not in ALLOWED_SERVER_IDS:
+        await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
+        return
+    # ✅ Role check
+    allowed_roles = ["Admin", "Steward", "League Director"]
+    user_roles = [role.name for role in ctx.author.roles]
+
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
+
+    cog = ctx.bot.get_cog('PenaltyCog')
+    if cog is None or not await cog.check_reports(ctx.channel.id, league):
+        embed = discord.Embed(title="No Pending Report", description="No closed penalty window in this channel is waiting for its report.", color=discord.Color.orange())
         await ctx.send(embed=embed)
 
 @commands.command(name='pen', help='Apply a penalty to the current thread.')
@@ -216,124 +369,61 @@ async def pen_command(ctx, *, action: str):
         await ctx.send("🚫 You do not have permission to use this command.")
         return    
     
-    global penalty_summary
     if not isinstance(ctx.channel, discord.Thread):
         await ctx.send(embed=discord.Embed(title="Invalid Channel", description="This command can only be used in a thread.", color=discord.Color.orange()))
         return
 
-    thread_name = ctx.channel.name
+    thread_name = desired_thread_name(ctx.channel)
     user = str(ctx.author)
     cog = ctx.bot.get_cog('PenaltyCog')
-    league = cog.current_league if cog else "?"
-
-    no_reason_actions = ["NFA", "NFI", "LI", "RI", "NFH", "SSIR"]
-    name_reason_actions = ["TLW", "LW", "REP", "DSQ", "BOTG"]
-    if action.lower().startswith("pov "):
-        parts = action.split(maxsplit=1)
-        if len(parts) < 2:
-            await ctx.send(embed=discord.Embed(description="Invalid format. Use `!pen pov <name>`.", color=discord.Color.red()))
-            return
-        pov_name = parts[1]
-        thread_name_parts = ctx.channel.name.split(") ", 1)
-        prefix = thread_name_parts[0] if len(thread_name_parts) > 1 else f"{league} ?"
-        new_thread_name = f"{prefix}) Waiting for POV {pov_name}"
-        try:
-            await ctx.channel.edit(name=new_thread_name)
-        except discord.HTTPException as e:
-            if e.status == 429:
-                await ctx.send("⚠️ Discord is rate limiting thread renames. Please wait a moment.")
-                await asyncio.sleep(10)
-            else:
-                raise
-        penalty_summary.setdefault(ctx.channel.id, []).append(f"Waiting for POV {pov_name}")
-        await ctx.send(embed=discord.Embed(description=f"POV requested from **{pov_name}**.", color=discord.Color.green()))
+    league = (cog.league_for_thread(ctx.channel.parent_id, thread_name) if cog else None) or "?"
+
+    # Validate the whole command before renaming or logging anything
+    try:
+        command = parse_pen_command(action)
+    except ValueError as e:
+        await ctx.send(embed=discord.Embed(description=str(e), color=discord.Color.red()))
         return
 
-    if action.lower().strip() == "sug":
-        thread_name_parts = ctx.channel.name.split(") ", 1)
+    if command.kind == PenCommand.POV:
+        thread_name_parts = thread_name.split(") ", 1)
         prefix = thread_name_parts[0] if len(thread_name_parts) > 1 else f"{league} ?"
-        new_thread_name = f"{prefix}) Waiting for a suggestion"
-        try:
-            await ctx.channel.edit(name=new_thread_name)
-        except discord.HTTPException as e:
-            if e.status == 429:
-                await ctx.send("⚠️ Discord is rate limiting thread renames. Please wait a moment.")
-                await asyncio.sleep(10)
-            else:
-                raise
-        penalty_summary.setdefault(ctx.channel.id, []).append("Waiting for a suggestion")
-        await ctx.send(embed=discord.Embed(description="Thread renamed: **Waiting for a suggestion**", color=discord.Color.green()))
+        state = WAITING_FOR_POV.format(driver=command.pov_driver)
+        wait = rename_thread(ctx.channel, f"{prefix}) {state}")
+        await add_summary(ctx.channel.id, state)
+        await ctx.send(embed=discord.Embed(description=f"POV requested from **{command.pov_driver}**." + rename_note(wait), color=discord.Color.green()))
         return
 
-    penalties = [p.strip() for p in action.split(',') if p.strip()]
-    applied_penalties = []
-
-    for penalty in penalties:
-        match = re.match(r"(\+?\d+)(s|gd)\s+(\w+)(?:\s+(.*))?", penalty, re.IGNORECASE)
-        if match:
-            amount = match.group(1)
-            type_ = match.group(2).lower()
-            name = match.group(3)
-            reason = match.group(4).strip() if match.group(4) else None
-
-            if type_ == "s" and not (1 <= int(amount.lstrip('+')) <= 30):
-                await ctx.send(embed=discord.Embed(description=f"Time penalty for {name} must be between 1 and 30 seconds.", color=discord.Color.red()))
-                return
-            if type_ == "gd" and not (1 <= int(amount) <= 30):
-                await ctx.send(embed=discord.Embed(description=f"Grid drop for {name} must be between 1 and 30 positions.", color=discord.Color.red()))
-                return
-
-            full = f"{amount}{type_} {name}" + (f" - {reason}" if reason else "")
-            applied_penalties.append(full)
-            log_penalty_csv(user, applied_penalties, thread_name, cog.current_league if cog else "?")
-            continue
-
-        match_tlw = re.match(r"(\d+)\s+TLW\s+(\w+)", penalty, re.IGNORECASE)
-        if match_tlw:
-            amount = int(match_tlw.group(1))
-            name = match_tlw.group(2)
-            if not (1 <= amount <= 10):
-                await ctx.send(embed=discord.Embed(description=f"TLW penalty for {name} must be between 1 and 10.", color=discord.Color.red()))
-                return
-            full = f"{amount} TLW {name}"
-            applied_penalties.append(full)
-            log_penalty_csv(user, applied_penalties, thread_name, cog.current_league if cog else "?")
-            continue
-
-        parts = penalty.split(maxsplit=2)
-        if len(parts) >= 2 and parts[0].upper() in name_reason_actions:
-            pen = parts[0].upper()
-            name = parts[1]
-            reason = parts[2] if len(parts) == 3 else None
-            full = f"{pen} {name}" + (f" - {reason}" if reason else "")
-            applied_penalties.append(full)
-            log_penalty_csv(user, applied_penalties, thread_name, cog.current_league if cog else "?")
-
-            continue
-
-        if penalty.upper() in no_reason_actions:
-            applied_penalties.append(penalty.upper())
-            log_penalty_csv(user, applied_penalties, thread_name, cog.current_league if cog else "?")
-
-            continue
-
-        await ctx.send(embed=discord.Embed(description=f"Invalid penalty format: `{penalty}`", color=discord.Color.red()))
+    if command.kind == PenCommand.SUGGESTION:
+        thread_name_parts = thread_name.split(") ", 1)
+        prefix = thread_name_parts[0] if len(thread_name_parts) > 1 else f"{league} ?"
+        wait = rename_thread(ctx.channel, f"{prefix}) {WAITING_FOR_SUGGESTION}")
+        await add_summary(ctx.channel.id, WAITING_FOR_SUGGESTION)
+        await ctx.send(embed=discord.Embed(description=f"Thread renamed: **{WAITING_FOR_SUGGESTION}**" + rename_note(wait), color=discord.Color.green()))
         return
 
-    prefix = ctx.channel.name.split(") ", 1)[0]
-    new_thread_name = f"✅ {prefix}) " + ", ".join([p.split(" - ")[0] for p in applied_penalties])
-    try:
-        await ctx.channel.edit(name=new_thread_name)
-    except discord.HTTPException as e:
-        if e.status == 429:
-            await ctx.send("⚠️ Discord is rate limiting thread renames. Please wait a moment.")
-            await asyncio.sleep(10)
-        else:
-            raise
-    penalty_summary.setdefault(ctx.channel.id, []).extend(applied_penalties)
-    embed = discord.Embed(description="\n".join([f"Penalty applied: **{pen}**" for pen in applied_penalties]), color=discord.Color.green())
+    # The whole decision is logged in one transaction
+    thread_league, thread_num = parse_thread_name(thread_name, league)
+    counters = await asyncio.to_thread(record_decision, ctx.message.id, thread_league, thread_num, ctx.channel.id, user,
+                                       command.penalties, thread_created_at=ctx.channel.created_at)
+    if cog:
+        cog.incidents.add_penalties(ctx.channel.id, thread_league, thread_num, command.penalties)
+
+    prefix = thread_name.split(") ", 1)[0].lstrip("✅ ")
+    new_thread_name = f"✅ {prefix}) " + ", ".join(p.short for p in command.penalties)
+    wait = rename_thread(ctx.channel, new_thread_name)
+    penalty_summary.extend(ctx.channel.id, [p.text for p in command.penalties])
+    embed = discord.Embed(description="\n".join([f"Penalty applied: **{p.text}**" for p in command.penalties]) + rename_note(wait), color=discord.Color.green())
+    if counters:
+        embed.add_field(name=f"Running totals ({thread_league})", value=counter_lines(counters), inline=False)
+        if any(crossed_threshold(type_, before, after) for _, type_, before, after in counters):
+            embed.color = discord.Color.red()
     await ctx.send(embed=embed)
 
+    # This may have been the last open thread of a closed window of this league or channel
+    if cog and cog.awaiting_reports:
+        await cog.check_reports(league=thread_league, channel_id=ctx.channel.parent_id)
+
 @commands.command(name='psum', help='Display the penalty summary for this thread.')
 async def pen_summary(ctx):
     if ctx.guild.id not in ALLOWED_SERVER_IDS:
@@ -342,10 +432,14 @@ async def pen_summary(ctx):
     if not isinstance(ctx.channel, discord.Thread):
         await ctx.send(embed=discord.Embed(title="Invalid Channel", description="This command can only be used in a thread.", color=discord.Color.orange()))
         return
-    if ctx.channel.id not in penalty_summary or not penalty_summary[ctx.channel.id]:
+    lines = penalty_summary.get(ctx.channel.id)
+    if lines is None:
+        lines = await asyncio.to_thread(thread_summary, ctx.channel.id)
+        penalty_summary.put(ctx.channel.id, lines)
+    if not lines:
         await ctx.send(embed=discord.Embed(title="No Penalties", description="No penalties applied to this thread yet.", color=discord.Color.orange()))
         return
-    summary = "\n".join(penalty_summary[ctx.channel.id])
+    summary = "\n".join(lines)
     embed = discord.Embed(title="Penalty Summary", description=summary, color=discord.Color.blue())
     await ctx.send(embed=embed)
 
@@ -1,8 +1,13 @@
 import discord
 from discord.ext import commands
-import pandas as pd
 import os
 
+from utils.embed_utils import send_embeds
+from utils.render_cache import cached_render, send_payload
+from utils.sanctions_utils import SANCTION_RULES, sanction_line
+from utils.snapshot_utils import get_snapshot
+from utils.standings_utils import INFRACTION_COLUMNS, infraction_table
+
 ALLOWED_SERVER_IDS = set(
     int(id.strip()) for id in os.getenv("ALLOWED_SERVER_IDS", "").split(",") if id.strip()
 )
@@ -23,296 +28,152 @@ async def driver_stats(ctx):
         return
 
     try:
-        excel_path = "Formula V SuperLicense.xlsx"
-        df_all = pd.read_excel(excel_path, sheet_name="Calendar and Standings", header=None)
-
-        data_config = {
-            "PP": {"rows": (86, 105), "cols": {"F1": 20, "F2": 35, "F3": 48}},
-            "LW": {"rows": (113, 131), "cols": {"F1": 20, "F2": 35, "F3": 48}},
-            "REP": {"rows": (140, 158), "cols": {"F1": 20, "F2": 35, "F3": 48}},
-        }
-
-        from collections import defaultdict
-        totals = defaultdict(lambda: {"PP": 0, "LW": 0, "REP": 0})
-        found_names = set()
-
-        for category, cfg in data_config.items():
-            start_row, end_row = cfg["rows"]
-            for league, col_start in cfg["cols"].items():
-                df = df_all.iloc[start_row:end_row + 1, col_start:col_start + 2]
-                df.columns = ["Driver", "Value"]
-                df = df.dropna()
-                df["Value"] = pd.to_numeric(df["Value"], errors="coerce").fillna(0).astype(int)
-                for _, row in df.iterrows():
-                    driver = str(row["Driver"]).strip()
-                    totals[driver][category] += row["Value"]
-                    found_names.add(driver)
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send("❌ The spreadsheet has not been downloaded yet.")
+            return
 
-        if not totals:
+        totals = snapshot.infraction_totals
+        if totals.empty:
             await ctx.send("No data found in the specified rows/columns.")
             return
 
-        # Break into multiple embeds if needed
-        drivers_sorted = sorted(totals.items(), key=lambda x: (x[1]["PP"], x[1]["LW"], x[1]["REP"]), reverse=True)
-        chunks = [drivers_sorted[i:i + 25] for i in range(0, len(drivers_sorted), 25)]
+        if not snapshot.sanctions:
+            await ctx.send(embed=discord.Embed(description="✅ No driver is over a PP, LW or REP threshold.", color=discord.Color.green()))
+            return
 
+        # 25 fields per embed, send_embeds packs them into as few messages as possible
+        drivers = list(snapshot.sanctions.items())
+        chunks = [drivers[i:i + 25] for i in range(0, len(drivers), 25)]
+        embeds = []
         for i, chunk in enumerate(chunks):
             embed = discord.Embed(
-                title=f"Driver Infractions Summary (All Leagues) {f'(Part {i+1})' if len(chunks) > 1 else ''}",
+                title=f"Drivers Over Sanction Thresholds (All Leagues) {f'(Part {i+1})' if len(chunks) > 1 else ''}",
                 color=discord.Color.red()
             )
-            for driver, stats in chunk:
+            for driver, categories in chunk:
+                reasons = ", ".join(SANCTION_RULES[category]["sanction"] for category in categories)
+                stats = totals.loc[driver]
                 embed.add_field(
                     name=driver,
-                    value=f"PP: {stats['PP']}, LW: {stats['LW']}, REP: {stats['REP']}",
+                    value=f"{reasons}\nPP: {stats['PP']}, LW: {stats['LW']}, REP: {stats['REP']}",
                     inline=False
                 )
-            #await ctx.send(embed=embed)
+            embeds.append(embed)
 
-        # Send ban warning(s)
-        for driver, stats in totals.items():
-            messages = []
-            if stats["PP"] >= 12:
-                messages.append("SHOULD BE BANNED 🚨")
-            if stats["LW"] >= 3:
-                messages.append("SHOULD GET A 5s PENALTY ⏱️")
-            if stats["REP"] >= 3:
-                messages.append("SHOULD GET 10 GD PENALTY 🔟")
-
-            if messages:
-                joined_messages = ", ".join(messages)
-                await ctx.send(f"**{driver}** {joined_messages} (PP: {stats['PP']}, LW: {stats['LW']}, REP: {stats['REP']})")
+        await send_embeds(ctx, embeds)
 
     except Exception as e:
         await ctx.send(f"❌ Error: {str(e)}")
 
-@commands.command(name="pp",aliases=['Pp','pP', 'PP'], help="Get penalty points. Usage: !pp or !pp F1/F2/F3")
-async def penalty_points(ctx, league: str = None):
-    try:
-        # Define league-specific slicing info (start row is 86 for U87 etc.)
-        leagues = {
-            "F1": {"cols": [20, 21], "rows": (86, 105)},  # U87:V105
-            "F2": {"cols": [35, 36], "rows": (86, 105)},  # AJ87:AK105
-            "F3": {"cols": [48, 49], "rows": (86, 105)},  # AW87:AX105
-        }
+@commands.command(name="sanctions", help="List pending PP, LW and REP sanctions across all leagues.")
+async def sanctions_command(ctx):
+    if ctx.guild.id not in ALLOWED_SERVER_IDS:
+        await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
+        return
 
-        excel_path = "Formula V SuperLicense.xlsx"
-        messages = []
+    # ✅ Role check
+    allowed_roles = ["Admin", "Steward", "League Director"]
+    user_roles = [role.name for role in ctx.author.roles]
 
-        # Load entire sheet once
-        df_all = pd.read_excel(excel_path, sheet_name="Calendar and Standings", header=None)
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
 
+    snapshot = get_snapshot()
+    if snapshot is None:
+        await ctx.send("❌ The spreadsheet has not been downloaded yet.")
+        return
+
+    embed = discord.Embed(title="⚖️ Pending Sanctions", color=discord.Color.red())
+    for category, rule in SANCTION_RULES.items():
+        drivers = [
+            f"**{driver}** ({snapshot.infraction_totals.at[driver, category]} {category})"
+            for driver, categories in snapshot.sanctions.items() if category in categories
+        ]
+        embed.add_field(name=f"{rule['sanction']} ({category} ≥ {rule['threshold']})",
+                        value="\n".join(drivers)[:1024] or "None", inline=False)
+    await ctx.send(embed=embed)
+
+# Per-category display settings for !pp, !lw and !rep
+INFRACTION_DISPLAY = {
+    "PP": {"title": "Penalty Points", "unit": "points", "color": discord.Color.red()},
+    "LW": {"title": "Lag Warnings", "unit": "warnings", "color": discord.Color.orange()},
+    "REP": {"title": "Reprimands", "unit": "reprimands", "color": discord.Color.purple()},
+}
+
+def render_infractions(snapshot, category: str, league: str = None) -> list[dict]:
+    """
+    Build the !pp / !lw / !rep output for one league, or for all of them when league is None.
+    Sanctions come from the snapshot's all-league totals, the same ones the sanctions channel is
+    alerted from; the command lists them but does not announce them again.
+    """
+    display = INFRACTION_DISPLAY[category]
+    payload = []
+
+    for lg in ([league] if league else INFRACTION_COLUMNS):
+        df = infraction_table(snapshot.sheets, category, lg).sort_values(by="Value", ascending=False)
+
+        embed = discord.Embed(
+            title=f"{lg} {display['title']}",
+            color=display["color"]
+        )
+        for driver, value in zip(df["Driver"], df["Value"]):
+            embed.add_field(name=driver, value=f"{value} {display['unit']}", inline=True)
+        payload.append({"embed": embed})
+
+    drivers = set(infraction_table(snapshot.sheets, category, league)["Driver"]) if league else None
+    lines = [
+        sanction_line(snapshot.infraction_totals, driver, category)
+        for driver, categories in snapshot.sanctions.items()
+        if category in categories and (drivers is None or driver in drivers)
+    ]
+    if lines:
+        payload.append({"embed": discord.Embed(
+            title=f"⚖️ Pending sanctions ({category} ≥ {SANCTION_RULES[category]['threshold']}, all leagues)",
+            description="\n".join(lines)[:4096],
+            color=display["color"]
+        )})
+    return payload
+
+def prewarm_infractions(snapshot):
+    for category in INFRACTION_DISPLAY:
+        for league in [None, *INFRACTION_COLUMNS]:
+            cached_render(category, (league,), snapshot.version, lambda: render_infractions(snapshot, category, league))
+
+async def send_infractions(ctx, category: str, league: str = None):
+    try:
         if league:
             league = league.upper()
-            if league not in leagues:
+            if league not in INFRACTION_COLUMNS:
                 await ctx.send(embed=discord.Embed(
                     description="❌ Invalid league! Use `F1`, `F2`, or `F3`.",
                     color=discord.Color.red()
                 ))
                 return
 
-            info = leagues[league]
-            start_row, end_row = info["rows"]
-            cols = info["cols"]
-            df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-            df.columns = ["Driver", "Points"]
-            df = df.dropna()
-            df["Points"] = df["Points"].astype(int)
-            df = df.sort_values(by="Points", ascending=False)
-
-            embed = discord.Embed(
-                title=f"{league} Penalty Points",
-                color=discord.Color.red()
-            )
-            for _, row in df.iterrows():
-                embed.add_field(name=row["Driver"], value=f"{row['Points']} points", inline=True)
-                if row["Points"] >= 12:
-                    messages.append(f"🚨 {league}: **{row['Driver']}** SHOULD BE BANNED FOR THIS WEEK!")
-
-            await ctx.send(embed=embed)
-            for msg in messages:
-                await ctx.send(msg)
-
-        else:
-            for lg, info in leagues.items():
-                start_row, end_row = info["rows"]
-                cols = info["cols"]
-                df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-                df.columns = ["Driver", "Points"]
-                df = df.dropna()
-                df["Points"] = df["Points"].astype(int)
-                df = df.sort_values(by="Points", ascending=False)
-
-                embed = discord.Embed(
-                    title=f"{lg} Penalty Points",
-                    color=discord.Color.red()
-                )
-                for _, row in df.iterrows():
-                    embed.add_field(name=row["Driver"], value=f"{row['Points']} points", inline=True)
-                    if row["Points"] >= 12:
-                        messages.append(f"🚨 {lg}: **{row['Driver']}** SHOULD BE BANNED FOR THIS WEEK!")
-
-                await ctx.send(embed=embed)
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
 
-            for msg in messages:
-                await ctx.send(msg)
+        payload = cached_render(category, (league,), snapshot.version, lambda: render_infractions(snapshot, category, league))
+        await send_payload(ctx, payload)
 
     except Exception as e:
         await ctx.send(embed=discord.Embed(
-            description=f"❌ Error reading penalty points: {str(e)}",
+            description=f"❌ Error reading {INFRACTION_DISPLAY[category]['title'].lower()}: {str(e)}",
             color=discord.Color.red()
         ))
 
+@commands.command(name="pp",aliases=['Pp','pP', 'PP'], help="Get penalty points. Usage: !pp or !pp F1/F2/F3")
+async def penalty_points(ctx, league: str = None):
+    await send_infractions(ctx, "PP", league)
+
 @commands.command(name="lw", aliases=["lagwarning", "Lw","lW","LW"], help="Get lag warnings. Usage: !lw or !lw F1/F2/F3")
 async def lag_warnings(ctx, league: str = None):
-    try:
-        leagues = {
-            "F1": {"cols": [20, 21], "rows": (113, 131)},  # U114:V132
-            "F2": {"cols": [35, 36], "rows": (113, 131)},  # AJ114:AK132
-            "F3": {"cols": [48, 49], "rows": (113, 131)},   # AW114:AX132
-        }
-
-        excel_path = "Formula V SuperLicense.xlsx"
-        messages = []
-        df_all = pd.read_excel(excel_path, sheet_name="Calendar and Standings", header=None)
-
-        if league:
-            league = league.upper()
-            if league not in leagues:
-                await ctx.send(embed=discord.Embed(
-                    description="❌ Invalid league! Use `F1`, `F2`, or `F3`.",
-                    color=discord.Color.red()
-                ))
-                return
-
-            info = leagues[league]
-            start_row, end_row = info["rows"]
-            cols = info["cols"]
-            df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-            df.columns = ["Driver", "Warnings"]
-            df = df.dropna()
-            df["Warnings"] = df["Warnings"].astype(int)
-            df = df.sort_values(by="Warnings", ascending=False)
-
-            embed = discord.Embed(
-                title=f"{league} Lag Warnings",
-                color=discord.Color.orange()
-            )
-            for _, row in df.iterrows():
-                embed.add_field(name=row["Driver"], value=f"{row['Warnings']} warnings", inline=True)
-                if row["Warnings"] >= 3:
-                    messages.append(f"🚨 {league}: **{row['Driver']}** has {row['Warnings']} lag warnings!")
-
-            await ctx.send(embed=embed)
-            for msg in messages:
-                await ctx.send(msg)
-
-        else:
-            for lg, info in leagues.items():
-                start_row, end_row = info["rows"]
-                cols = info["cols"]
-                df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-                df.columns = ["Driver", "Warnings"]
-                df = df.dropna()
-                df["Warnings"] = df["Warnings"].astype(int)
-                df = df.sort_values(by="Warnings", ascending=False)
-
-                embed = discord.Embed(
-                    title=f"{lg} Lag Warnings",
-                    color=discord.Color.orange()
-                )
-                for _, row in df.iterrows():
-                    embed.add_field(name=row["Driver"], value=f"{row['Warnings']} warnings", inline=True)
-                    if row["Warnings"] >= 3:
-                        messages.append(f"🚨 {lg}: **{row['Driver']}** has {row['Warnings']} lag warnings!")
-                
-                await ctx.send(embed=embed)
-            
-            for msg in messages:
-                await ctx.send(msg)
-
-    except Exception as e:
-        await ctx.send(embed=discord.Embed(
-            description=f"❌ Error reading lag warnings: {str(e)}",
-            color=discord.Color.red()
-        ))
+    await send_infractions(ctx, "LW", league)
 
 @commands.command(name="rep", aliases=["reps", "reprimand", "reprimands", "REP", "Rep"], help="Get reprimands. Usage: !rep or !rep F1/F2/F3")
 async def reprimands(ctx, league: str = None):
-    try:
-        leagues = {
-            "F1": {"cols": [20, 21], "rows": (140, 158)},  # U141:V159
-            "F2": {"cols": [35, 36], "rows": (140, 158)},  # AJ141:AK159
-            "F3": {"cols": [48, 49], "rows": (140, 158)},   # AW141:AX159
-        }
-
-        excel_path = "Formula V SuperLicense.xlsx"
-        messages = []
-        df_all = pd.read_excel(excel_path, sheet_name="Calendar and Standings", header=None)
-
-        if league:
-            league = league.upper()
-            if league not in leagues:
-                await ctx.send(embed=discord.Embed(
-                    description="❌ Invalid league! Use `F1`, `F2`, or `F3`.",
-                    color=discord.Color.red()
-                ))
-                return
-
-            info = leagues[league]
-            start_row, end_row = info["rows"]
-            cols = info["cols"]
-            df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-            df.columns = ["Driver", "Reprimands"]
-            df = df.dropna()
-            df["Reprimands"] = df["Reprimands"].astype(int)
-            df = df.sort_values(by="Reprimands", ascending=False)
-
-            embed = discord.Embed(
-                title=f"{league} Reprimands",
-                color=discord.Color.purple()
-            )
-            for _, row in df.iterrows():
-                embed.add_field(name=row["Driver"], value=f"{row['Reprimands']} reprimands", inline=True)
-                if row["Reprimands"] >= 3:
-                    messages.append(f"🚨 {league}: **{row['Driver']}** has {row['Reprimands']} reprimands!")
-
-            await ctx.send(embed=embed)
-            for msg in messages:
-                await ctx.send(msg)
-
-        else:
-            for lg, info in leagues.items():
-                start_row, end_row = info["rows"]
-                cols = info["cols"]
-                df = df_all.iloc[start_row:end_row + 1, cols[0]:cols[1] + 1]
-
-                df.columns = ["Driver", "Reprimands"]
-                df = df.dropna()
-                df["Reprimands"] = df["Reprimands"].astype(int)
-                df = df.sort_values(by="Reprimands", ascending=False)
-
-                embed = discord.Embed(
-                    title=f"{lg} Reprimands",
-                    color=discord.Color.purple()
-                )
-                for _, row in df.iterrows():
-                    embed.add_field(name=row["Driver"], value=f"{row['Reprimands']} reprimands", inline=True)
-                    if row["Reprimands"] >= 3:
-                        messages.append(f"🚨 {lg}: **{row['Driver']}** has {row['Reprimands']} reprimands!")
-                
-                await ctx.send(embed=embed)
-            
-            for msg in messages:
-                await ctx.send(msg)
-
-    except Exception as e:
-        await ctx.send(embed=discord.Embed(
-            description=f"❌ Error reading reprimands: {str(e)}",
-            color=discord.Color.red()
-        ))
\ No newline at end of file
+    await send_infractions(ctx, "REP", league)
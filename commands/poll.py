@@ -149,10 +149,12 @@ class Poll(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.poll_counter = self.get_last_poll_id()  # Get the last poll ID from the CSV or set to 0
-        self.bot.loop.create_task(self.load_ongoing_polls())
 
+    async def cog_load(self):
+        self.bot.loop.create_task(self.load_ongoing_polls())
 
     async def load_ongoing_polls(self):
+        await self.bot.wait_until_ready()  # channels are not cached before the gateway is ready
         for filename in os.listdir("poll_results"):
             if filename.endswith(".json"):
                 with open(f"poll_results/{filename}", "r", encoding="utf-8") as f:
@@ -4,6 +4,9 @@ import json
 import os
 from datetime import datetime
 
+from utils.render_cache import cached_render, invalidate, send_payload
+from utils.rename_utils import rename_thread, desired_thread_name
+
 ALLOWED_SERVER_IDS = set(
     int(id.strip()) for id in os.getenv("ALLOWED_SERVER_IDS", "").split(",") if id.strip()
 )
@@ -26,6 +29,15 @@ def load_protests():
 def save_protests(data):
     with open(PROTESTS_FILE, "w") as f:
         json.dump(data, f, indent=4)
+    invalidate("protests")
+
+
+def protests_revision() -> str:
+    """Revision of protests.json, so cached renders notice edits made outside the bot too."""
+    if not os.path.exists(PROTESTS_FILE):
+        return "missing"
+    stat = os.stat(PROTESTS_FILE)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
 
 
 class ProtestView(discord.ui.View):
@@ -79,15 +91,12 @@ class ProtestView(discord.ui.View):
 
         if isinstance(self.ctx.channel, discord.Thread):
             import re
-            match = re.match(r"(?:✅\s*)?([A-Z0-9]+)\s+(\d+)\)", self.ctx.channel.name)
+            match = re.match(r"(?:✅\s*)?([A-Z0-9]+)\s+(\d+)\)", desired_thread_name(self.ctx.channel))
             if match:
                 league = match.group(1)
                 counter = match.group(2)
                 new_name = f"{league} {counter}) PROTEST ONGOING"
-                try:
-                    await self.ctx.channel.edit(name=new_name)
-                except discord.errors.HTTPException:
-                    await self.ctx.send("⚠️ Could not rename the thread due to rate limits or permissions.")
+                rename_thread(self.ctx.channel, new_name)
 
 
 @commands.command(name="protest", help="Submit a protest for a team.")
@@ -255,8 +264,7 @@ async def revert_protest_command(ctx, team: str):
             await ctx.send(embed=embed)
 
 
-@commands.command(name="protests", help="Show the current protest standings.")
-async def protests_command(ctx):
+def render_protests() -> list[dict]:
     protests = load_protests()
 
     if not protests:
@@ -264,8 +272,7 @@ async def protests_command(ctx):
             description="No protests have been submitted yet.",
             color=discord.Color.gold()
         )
-        await ctx.send(embed=embed)
-        return
+        return [{"embed": embed}]
 
     f1_embed = discord.Embed(title="📊 F1 Protest Standings", color=discord.Color.red())
     f2_embed = discord.Embed(title="📊 F2 Protest Standings", color=discord.Color.green())
@@ -285,6 +292,10 @@ async def protests_command(ctx):
         else:
             f1_embed.add_field(name=f"{team_key} - {len(entries)}/{MAX_PROTESTS}", value=value, inline=False)
 
-    await ctx.send(embed=f1_embed)
-    await ctx.send(embed=f2_embed)
-    await ctx.send(embed=f3_embed)
+    return [{"embed": f1_embed}, {"embed": f2_embed}, {"embed": f3_embed}]
+
+
+@commands.command(name="protests", help="Show the current protest standings.")
+async def protests_command(ctx):
+    payload = cached_render("protests", (), protests_revision(), render_protests)
+    await send_payload(ctx, payload)
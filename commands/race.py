@@ -15,6 +15,19 @@ MID_SEASON_BREAK = datetime(2025, 6, 20, 18, 0, tzinfo=dt_timezone.utc)
 MID_SEASON_ROUND_BREAK = 8
 TOTAL_ROUNDS = 13
 
+def scheduled_race_starts() -> list[datetime]:
+    """Start times of every scheduled F1/F2/F3 race this season, in order."""
+    starts = []
+    for series, base_start in BASE_RACE_START_DATES.items():
+        for round_number in range(1, TOTAL_ROUNDS + 1):
+            race_start = base_start + timedelta(weeks=round_number - 1)
+            if round_number >= MID_SEASON_ROUND_BREAK:
+                race_start += timedelta(weeks=1)
+            if f"r{round_number}" in SPRINT_RACES:
+                race_start -= timedelta(minutes=30)
+            starts.append(race_start)
+    return sorted(starts)
+
 async def send_embed(ctx, title, description, color):
     embed = discord.Embed(title=title, description=description, color=color)
     await ctx.send(embed=embed)
@@ -133,6 +133,16 @@ class RaceAttendance(commands.Cog):
 }
 
 
+    async def cog_load(self):
+        # Re-register the buttons of saved attendance messages so they work right after a restart
+        for category in self.attendance_files:
+            try:
+                with open(f"attendance_{category}_message.json", "r") as f:
+                    data = json.load(f)
+                self.bot.add_view(self.create_view(category), message_id=data["message_id"])
+            except FileNotFoundError:
+                continue
+
     def load_attendance(self, category):
         if os.path.exists(self.attendance_files[category]):
             with open(self.attendance_files[category], 'r') as f:
@@ -1,92 +1,53 @@
 import discord
 from discord.ext import commands
 import pandas as pd
-import datetime
-import os
 
-@commands.command(name="results", help="Get race results for a specific race (e.g., !results F1_R1)")
-async def results_command(ctx, race: str):
-    try:
-        # Load the Excel file directly
-        excel_path = "Formula V SuperLicense.xlsx"
-        excel_data = pd.ExcelFile(excel_path, engine='openpyxl')
+from utils.snapshot_utils import get_snapshot
 
-        # Check if the requested race sheet exists
-        if race not in excel_data.sheet_names:
+@commands.command(name="results", help="Get race results for a specific race (e.g., !results F1_R1) or a driver's season (e.g., !results driver Max)")
+async def results_command(ctx, race: str, *, rest: str = None):
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
             embed = discord.Embed(
-                description=f"❌ Race `{race}` not found in the spreadsheet.",
+                description="❌ The spreadsheet has not been downloaded yet.",
                 color=discord.Color.red()
             )
             await ctx.send(embed=embed)
             return
 
-        # Read race results (AQ78:AW97 -> zero-indexed: 76:97, 42:49)
-        df = excel_data.parse(race)
-        race_results = df.iloc[76:97, 43:50]  # 7 columns expected
-
-        # Define expected column names
-        expected_columns = ["Position", "Driver", "Team", "Pts", "Race Time", "Fast Lap", "Penalty"]
-        if race_results.shape[1] == 6:  
-            expected_columns.remove("Penalty")  # Adjust if missing
-
-        race_results.columns = expected_columns
-        race_results = race_results.dropna(subset=["Driver", "Team"])  # Keep all valid drivers
-
-        # Handle NaN values & conversion issues
-        race_results["Position"] = race_results["Position"].fillna(0).astype(int)
-        race_results["Pts"] = race_results["Pts"].fillna(0).astype(int)
-
-        # Function to format time correctly
-        def format_time(time_value):
-            if pd.isna(time_value):
-                return "N/A"
-            try:
-                if isinstance(time_value, datetime.time):
-                    # Convert to string and extract MM:SS.sss
-                    time_str = time_value.strftime("%H:%M:%S.%f")[:-3]  # Remove extra decimals
-                    return time_str[3:] if time_str.startswith("00:") else time_str  # Remove "00:"
-                elif isinstance(time_value, (pd.Timestamp, pd.Timedelta)):
-                    total_seconds = time_value.total_seconds()
-                    minutes = int(total_seconds // 60)
-                    seconds = total_seconds % 60
-                    return f"{minutes}:{seconds:06.3f}"  # MM:SS.sss format
-                elif isinstance(time_value, str) and ":" in time_value:
-                    parts = time_value.split(":")
-                    minutes, seconds = parts[-2], parts[-1]  # Keep last two parts
-                    return f"{minutes}:{float(seconds):06.3f}"
-                return f"{float(time_value):.3f}"  # Ensure three decimal places
-            except ValueError:
-                return str(time_value)  # Fallback for unexpected values
+        if race.lower() == "driver":
+            await send_driver_season(ctx, snapshot.results, rest)
+            return
 
-        # Find the driver with the fastest lap
-        fastest_lap_driver = None
-        fastest_lap_time = float("inf")  # Set to a very high value to find the minimum
+        # Allow "!results f1 r1" as well as "!results F1_R1"
+        sheet_name = snapshot.results.find_race(f"{race} {rest}" if rest else race)
+        if sheet_name is None:
+            embed = discord.Embed(
+                description=f"❌ Race `{race}` not found in the spreadsheet.",
+                color=discord.Color.red()
+            )
+            await ctx.send(embed=embed)
+            return
 
-        for _, row in race_results.iterrows():
-            if pd.notna(row['Fast Lap']) and row['Fast Lap'] != 'N/A' and row['Fast Lap'] != 'DNF':
-                # If the fast lap is a datetime.time object, convert it to total seconds
-                if isinstance(row['Fast Lap'], datetime.time):
-                    lap_time = row['Fast Lap'].minute * 60 + row['Fast Lap'].second + (row['Fast Lap'].microsecond / 1_000_000)
-                else:
-                    # Otherwise, it's already a string, so we handle it as before
-                    lap_time = float(row['Fast Lap'].split(":")[1]) + (float(row['Fast Lap'].split(":")[0]) * 60)  # Convert time to seconds
-                
-                if lap_time < fastest_lap_time:
-                    fastest_lap_time = lap_time
-                    fastest_lap_driver = row['Driver']
+        race_results = snapshot.results.races[sheet_name]
 
-        # Format race results with the star emoji for the fastest lap
-        results_text = "\n\n".join([
-            f"**{row['Position']}. {row['Driver']} ({row['Team']})**\n"
-            f"{row['Pts']} pts | ⏱ {format_time(row['Race Time'])} | Fast Lap: {format_time(row['Fast Lap'])}"
-            + (f" ⭐" if row['Driver'] == fastest_lap_driver else "")
-            + (f" | ⚠️ Penalty: {row['Penalty']}" if "Penalty" in race_results.columns and pd.notna(row['Penalty']) and str(row['Penalty']).strip() else "")
-            for _, row in race_results.iterrows()
-        ])
+        # Times were normalized at ingest, so every part of a line is a column operation
+        gap = race_results["Gap Seconds"].map(lambda seconds: f" (+{seconds:.3f})" if seconds > 0 else "")
+        penalty = race_results["Penalty"].astype(str).str.strip()
+        has_penalty = race_results["Penalty"].notna() & (penalty != "")
+        lines = (
+            "**" + race_results["Position"].astype(str) + ". " + race_results["Driver"] + " (" + race_results["Team"].astype(str) + ")**\n"
+            + race_results["Pts"].astype(str) + " pts | ⏱ " + race_results["Race Display"] + gap
+            + " | Fast Lap: " + race_results["Lap Display"]
+            + race_results["Fastest Lap"].map({True: " ⭐", False: ""})
+            + (" | ⚠️ Penalty: " + penalty).where(has_penalty, "")
+        )
+        results_text = "\n\n".join(lines)
 
         # Send embedded results
         embed = discord.Embed(
-            title=f"🏁 Race Results: {race}",
+            title=f"🏁 Race Results: {sheet_name}",
             description=results_text,
             color=discord.Color.blue()
         )
@@ -97,4 +58,29 @@ async def results_command(ctx, race: str):
             description=f"❌ Error fetching race results: {str(e)}",
             color=discord.Color.red()
         )
-        await ctx.send(embed=embed)
\ No newline at end of file
+        await ctx.send(embed=embed)
+
+async def send_driver_season(ctx, results, driver_name: str):
+    if not driver_name:
+        await ctx.send(embed=discord.Embed(description="❌ **Usage:** `!results driver <name>`", color=discord.Color.red()))
+        return
+
+    season = results.find_driver(driver_name)
+    if season is None:
+        await ctx.send(embed=discord.Embed(description=f"❌ Driver `{driver_name}` not found in any race results.", color=discord.Color.red()))
+        return
+
+    name, entries = season
+    lines = [
+        f"**{sheet}** - P{row['Position']} ({row['Team']}) | {row['Pts']} pts | Fast Lap: {row['Lap Display']}"
+        + (" ⭐" if row['Fastest Lap'] else "")
+        + (f" | ⚠️ {row['Penalty']}" if pd.notna(row['Penalty']) and str(row['Penalty']).strip() else "")
+        for sheet, row in entries
+    ]
+    embed = discord.Embed(
+        title=f"🏁 Season Results: {name}",
+        description="\n".join(lines),
+        color=discord.Color.blue()
+    )
+    embed.set_footer(text=f"{len(entries)} races | {sum(row['Pts'] for _, row in entries)} pts")
+    await ctx.send(embed=embed)
@@ -0,0 +1,55 @@
+import discord
+from discord.ext import commands
+import pandas as pd
+
+from utils.embed_utils import embeds_from_lines, group_embeds
+from utils.render_cache import cached_render, send_payload
+from utils.snapshot_utils import get_snapshot
+from utils.stats_utils import STAT_SORTS
+
+def format_finish(average) -> str:
+    return "-" if pd.isna(average) else f"P{average:.1f}"
+
+def render_season_stats(snapshot, league: str, is_constructor: bool, sort: str) -> list[dict]:
+    by = "Team" if is_constructor else "Driver"
+    column, ascending = STAT_SORTS[sort]
+    stats = snapshot.results.season_stats(league, by).sort_values([column, "Points"], ascending=[ascending, False])
+    if stats.empty:
+        return [{"embed": discord.Embed(description=f"❌ No race results found for `{league}`.", color=discord.Color.red())}]
+
+    lines = [
+        f"**{position}. {row[by]}** - {row['Points']} pts ({row['Pts/Race']:.1f}/race)\n"
+        f"🏆 {row['Wins']} | 🥇🥈🥉 {row['Podiums']} | Avg {format_finish(row['Avg Finish'])} | "
+        f"DNF {row['DNFs']} | ⭐ {row['Fastest Laps']} | {row['Races']} races"
+        for position, row in enumerate(stats.to_dict("records"), 1)
+    ]
+    embeds = embeds_from_lines(
+        lines,
+        f"📊 {league} {'Constructors' if is_constructor else 'Drivers'} Season Stats (by {sort})",
+        discord.Color.blue() if is_constructor else discord.Color.gold()
+    )
+    return [{"embeds": group} for group in group_embeds(embeds)]
+
+@commands.command(name="seasonstats", aliases=["stats"], help="Season stats per driver or team. Usage: !seasonstats [league][C] [points|wins|podiums|avg|dnf|fl|ppr]")
+async def season_stats_command(ctx, category: str = "F1", sort: str = "points"):
+    category, sort = category.upper(), sort.lower()
+    if sort not in STAT_SORTS:
+        await ctx.send(embed=discord.Embed(description=f"❌ Sort by one of: {', '.join(f'`{key}`' for key in STAT_SORTS)}.", color=discord.Color.red()))
+        return
+
+    try:
+        snapshot = get_snapshot()
+        if snapshot is None:
+            await ctx.send(embed=discord.Embed(description="❌ The spreadsheet has not been downloaded yet.", color=discord.Color.red()))
+            return
+
+        # Same convention as !standings: a trailing C asks for constructors, unless it is a league name
+        is_constructor = category.endswith("C") and category not in snapshot.results.table["League"].values
+        league = category[:-1] if is_constructor else category
+
+        payload = cached_render("seasonstats", (league, is_constructor, sort), snapshot.version,
+                                lambda: render_season_stats(snapshot, league, is_constructor, sort))
+        await send_payload(ctx, payload)
+
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error fetching season stats: {str(e)}", color=discord.Color.red()))
@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+import discord
+from discord.ext import commands
+
+from utils.penalty_log_utils import steward_stats
+
+# Get server IDs as a set of integers
+ALLOWED_SERVER_IDS = set(
+    int(id.strip()) for id in os.getenv("ALLOWED_SERVER_IDS", "").split(",") if id.strip()
+)
+
+MAX_OPEN_THREADS_SHOWN = 15
+FIELD_LIMIT = 1024  # Discord's limit on an embed field value
+
+def format_duration(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+def field_value(lines: list[str], empty: str, total: int = None) -> str:
+    """Join lines into one embed field value, cutting off with '...and N more' before it gets too long."""
+    total = len(lines) if total is None else total
+    shown = []
+    for line in lines:
+        more = total - len(shown) - 1
+        candidate = shown + [line] + ([f"...and {more} more"] if more else [])
+        if len("\n".join(candidate)) > FIELD_LIMIT:
+            break
+        shown.append(line)
+    if len(shown) < total:
+        shown.append(f"...and {total - len(shown)} more")
+    return "\n".join(shown) or empty
+
+@commands.command(name="stewardstats", help="Steward workload and turnaround. Usage: !stewardstats [league] [days]")
+async def steward_stats_command(ctx, league: str = None, days: int = 30):
+    if ctx.guild.id not in ALLOWED_SERVER_IDS:
+        await ctx.send("❌ This command is only allowed on the Formula V or test servers.")
+        return
+
+    # ✅ Role check
+    allowed_roles = ["Admin", "Steward", "League Director"]
+    user_roles = [role.name for role in ctx.author.roles]
+
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
+
+    # Allow "!stewardstats 7" for all leagues over a week
+    if league and league.isdigit():
+        league, days = None, int(league)
+
+    try:
+        stats = await asyncio.to_thread(steward_stats, league, days)
+    except Exception as e:
+        await ctx.send(embed=discord.Embed(description=f"❌ Error fetching steward stats: {str(e)}", color=discord.Color.red()))
+        return
+
+    embed = discord.Embed(
+        title=f"⚖️ Steward Stats{f' ({league.upper()})' if league else ''} - last {days} days",
+        color=discord.Color.gold()
+    )
+    embed.add_field(
+        name="Decisions",
+        value=field_value([f"**{steward}** - {count}" for steward, count in stats["stewards"]], "No decisions yet."),
+        inline=False
+    )
+    embed.add_field(
+        name="Median time to decision",
+        value=field_value([
+            f"**{row_league}** - {format_duration(seconds)} ({threads} threads)"
+            for row_league, (seconds, threads) in stats["turnaround"].items()
+        ], "No decided threads yet."),
+        inline=False
+    )
+
+    open_threads = stats["open"]
+    lines = [
+        f"<#{thread_id}> ({row_league} {thread if thread is not None else '?'}) - open for {format_duration(age)}"
+        for row_league, thread, thread_id, age in open_threads[:MAX_OPEN_THREADS_SHOWN]
+    ]
+    embed.add_field(name=f"Open threads ({len(open_threads)})", value=field_value(lines, "None 🎉", len(open_threads)),
+                    inline=False)
+    await ctx.send(embed=embed)
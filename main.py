@@ -5,30 +5,129 @@ from discord.ext import commands
 from dotenv import load_dotenv
 import aiohttp
 import asyncio
+import time
+from datetime import datetime, timezone as dt_timezone
 from discord.ext import tasks
 import requests
 
+from utils.changes_utils import diff_snapshots, build_change_embeds
+from utils.embed_utils import send_embeds, embeds_from_lines
+from utils.history_utils import ingest_snapshot
+from utils.polling_utils import next_poll_interval
+from utils.render_cache import invalidate
+from utils.sanctions_utils import new_crossings, mark_announced, sanction_line
+from utils.snapshot_utils import EXCEL_FILE_NAME, load_snapshot, get_snapshot
+
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+STARTED_AT = time.perf_counter()
+
 EXCEL_URL = os.getenv("ONEDRIVE_LINK")
-EXCEL_FILE_NAME = "Formula V SuperLicense.xlsx"
+CHANGES_CHANNEL_ID = int(os.getenv("STANDINGS_CHANGES_CHANNEL_ID", "0"))
+SANCTIONS_CHANNEL_ID = int(os.getenv("SANCTIONS_CHANNEL_ID", CHANGES_CHANNEL_ID))
+
+# Seconds before a stalled OneDrive download is given up until the next poll
+DOWNLOAD_TIMEOUT = 120
+
+unchanged_downloads = 0
+# Held for a whole download, so !refreshsheet never overlaps a loop iteration
+download_lock = asyncio.Lock()
+# The workbook was fetched during setup_hook, so the first loop iteration only loads it
+prefetched = False
 
-async def download_excel_file():
+def fetch_workbook():
+    """Download the workbook to disk. Blocking, run it in a thread from async code."""
+    response = requests.get(EXCEL_URL, timeout=DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    # Write next to the workbook and swap it in, so a concurrent load never sees half a file
+    with open(f"{EXCEL_FILE_NAME}.part", "wb") as f:
+        f.write(response.content)
+    os.replace(f"{EXCEL_FILE_NAME}.part", EXCEL_FILE_NAME)
+    print(f"[✓] Excel file updated: {EXCEL_FILE_NAME}")
+
+async def prefetch_workbook() -> bool:
+    """Start the first download during setup; the first loop iteration then loads it."""
     try:
-        response = requests.get(EXCEL_URL)
-        response.raise_for_status()
-        with open(EXCEL_FILE_NAME, "wb") as f:
-            f.write(response.content)
-        print(f"[✓] Excel file updated: {EXCEL_FILE_NAME}")
+        await asyncio.to_thread(fetch_workbook)
+        return True
     except Exception as e:
         print(f"[!] Failed to download Excel file: {e}")
+        return False
+
+async def download_excel_file(fetch: bool = True) -> bool:
+    """
+    Download the workbook and refresh the snapshot. Returns True if the content changed.
+    :param fetch: False to only load a workbook that was downloaded already.
+    """
+    async with download_lock:
+        return await _download_excel_file(fetch)
+
+async def _download_excel_file(fetch: bool) -> bool:
+    try:
+        previous = await asyncio.to_thread(get_snapshot)
+        if fetch:
+            await asyncio.to_thread(fetch_workbook)
+        snapshot = await asyncio.to_thread(load_snapshot)
+        if snapshot is not previous:
+            await asyncio.to_thread(prewarm_render_cache, snapshot)
+            await asyncio.to_thread(ingest_snapshot, snapshot)
+            await post_new_sanctions(snapshot)
+        if previous is not None and snapshot is not previous:
+            await post_standings_changes(previous, snapshot)
+        return snapshot is not previous
+    except Exception as e:
+        print(f"[!] Failed to download Excel file: {e}")
+        return False
+
+async def post_standings_changes(previous, snapshot):
+    """Post what changed between two snapshots to the configured channel."""
+    if not CHANGES_CHANNEL_ID:
+        return
+    try:
+        channel = bot.get_channel(CHANGES_CHANNEL_ID) or await bot.fetch_channel(CHANGES_CHANNEL_ID)
+    except discord.HTTPException as e:
+        print(f"[!] Standings changes channel {CHANGES_CHANNEL_ID} is not reachable: {e}")
+        return
+    lines = diff_snapshots(previous, snapshot)
+    await send_embeds(channel, build_change_embeds(lines))
+
+async def post_new_sanctions(snapshot):
+    """Alert only on drivers who crossed a sanction threshold since the last announcement."""
+    crossings = new_crossings(snapshot.sanctions)
+    if not crossings:
+        await asyncio.to_thread(mark_announced, snapshot.sanctions, [])
+        return
+    channel = bot.get_channel(SANCTIONS_CHANNEL_ID)
+    if channel is None:
+        # Keep them pending so they are posted once the channel is reachable
+        return
+    lines = [sanction_line(snapshot.infraction_totals, driver, category) for driver, category in crossings]
+    await send_embeds(channel, embeds_from_lines(lines, "⚖️ New sanctions", discord.Color.red()))
+    await asyncio.to_thread(mark_announced, snapshot.sanctions, crossings)
 
 @tasks.loop(minutes=60)
 async def download_excel_file_loop():
-    await download_excel_file()
+    global unchanged_downloads, prefetched
+    changed = await download_excel_file(fetch=not prefetched)
+    prefetched = False
+    unchanged_downloads = 0 if changed else unchanged_downloads + 1
+    minutes = next_poll_interval(datetime.now(dt_timezone.utc), scheduled_race_starts(), unchanged_downloads)
+    download_excel_file_loop.change_interval(minutes=minutes)
+    print(f"[i] Next spreadsheet download in {minutes:.0f} minutes")
+
+@download_excel_file_loop.before_loop
+async def before_download_loop():
+    # Change feeds and sanction alerts need the channel cache
+    await bot.wait_until_ready()
+
+def prewarm_render_cache(snapshot):
+    """Render every league's standings and PP/LW/REP tables so race-night queries are cache hits."""
+    invalidate()
+    prewarm_standings(snapshot)
+    prewarm_infractions(snapshot)
 
 # Bot commands
 intents = discord.Intents.default()
@@ -42,15 +141,15 @@ bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
 
 from commands.lapchecks import LapChecks
 from commands.weather import weather, rain
-from commands.race import race
-from commands.penalty import start_timer, cancel_timer, pen_command, pen_summary, PenaltyCog
+from commands.race import race, scheduled_race_starts
+from commands.penalty import start_timer, cancel_timer, pen_command, pen_summary, penalty_report, PenaltyCog
 from commands.help import show_help
 from commands.raceAttendance import RaceAttendance
 from commands.regs import regs
 from commands.respondToAMessege import downforce, spreadsheet, getStarted, signup
 from commands.protest import protest_command, protests_command, revert_protest_command
 from commands.nuke import delta
-from commands.standings import standings_command
+from commands.standings import standings_command, prewarm_standings
 from commands.results import results_command
 from commands.fastestLap import fastest_lap
 from commands.getLogs import GetLogs
@@ -61,7 +160,17 @@ from commands.penaltyPoints import penalty_points
 from commands.penaltyPoints import lag_warnings
 from commands.penaltyPoints import reprimands
 from commands.penaltyPoints import driver_stats
-from commands.freeNumbers import free_numbers
+from commands.penaltyPoints import sanctions_command
+from commands.penaltyPoints import prewarm_infractions
+from commands.freeNumbers import free_numbers, number_check, suggest_number
+from commands.driverProfile import driver_profile
+from commands.headToHead import h2h_command
+from commands.seasonStats import season_stats_command
+from commands.stewardStats import steward_stats_command
+from commands.exportLogs import export_logs
+from commands.incidents import incidents_command
+from commands.clinch import clinch_command
+from commands.chart import chart_command
 
 bot.add_command(delta)
 bot.add_command(weather)
@@ -72,6 +181,7 @@ bot.add_command(cancel_timer)
 bot.add_command(show_help)
 bot.add_command(pen_command)
 bot.add_command(pen_summary)
+bot.add_command(penalty_report)
 bot.add_command(regs)
 bot.add_command(downforce)
 bot.add_command(protest_command)
@@ -84,14 +194,46 @@ bot.add_command(penalty_points)
 bot.add_command(reprimands)
 bot.add_command(lag_warnings)
 bot.add_command(driver_stats)
+bot.add_command(sanctions_command)
 bot.add_command(spreadsheet)
 bot.add_command(getStarted)
 bot.add_command(signup)
 bot.add_command(free_numbers)
+bot.add_command(number_check)
+bot.add_command(suggest_number)
+bot.add_command(driver_profile)
+bot.add_command(h2h_command)
+bot.add_command(season_stats_command)
+bot.add_command(steward_stats_command)
+bot.add_command(export_logs)
+bot.add_command(incidents_command)
+bot.add_command(clinch_command)
+bot.add_command(chart_command)
 
-@bot.event
-async def on_ready():
-    print(f"Logged in as {bot.user.name}")
+@bot.command(name="refreshsheet", help="Download the spreadsheet now.")
+async def refresh_sheet(ctx):
+    allowed_roles = ["Admin", "Steward", "League Director"]
+    user_roles = [role.name for role in ctx.author.roles]
+
+    if not any(role in user_roles for role in allowed_roles):
+        await ctx.send("🚫 You do not have permission to use this command.")
+        return
+
+    global unchanged_downloads
+    if download_lock.locked():
+        await ctx.send(embed=discord.Embed(description="⏳ The spreadsheet is being downloaded already, try again in a moment.", color=discord.Color.orange()))
+        return
+    async with ctx.typing():
+        changed = await download_excel_file()
+    if changed:
+        unchanged_downloads = 0
+        minutes = next_poll_interval(datetime.now(dt_timezone.utc), scheduled_race_starts(), unchanged_downloads)
+        download_excel_file_loop.change_interval(minutes=minutes)
+        await ctx.send(embed=discord.Embed(description="✅ Spreadsheet refreshed with new data.", color=discord.Color.green()))
+    else:
+        await ctx.send(embed=discord.Embed(description="ℹ️ Spreadsheet downloaded, nothing changed.", color=discord.Color.blue()))
+
+async def register_cogs():
     await bot.add_cog(LapChecks(bot))
     await bot.add_cog(PenaltyCog(bot))
     await bot.add_cog(RaceAttendance(bot))
@@ -100,10 +242,35 @@ async def on_ready():
     await bot.add_cog(Poll(bot))
     await bot.add_cog(LapCount(bot))
 
-    # await download_excel_file()
+@bot.event
+async def setup_hook():
+    """Runs once before the gateway connects, unlike on_ready which fires on every reconnect."""
+    global prefetched
+    started = time.perf_counter()
+    # Warm start: serve commands from the last downloaded workbook while the new one downloads.
+    # Cogs restore their polls and attendance views in cog_load.
+    snapshot, _, prefetched = await asyncio.gather(
+        asyncio.to_thread(load_snapshot),
+        register_cogs(),
+        prefetch_workbook(),
+    )
+    if snapshot is not None:
+        await asyncio.to_thread(prewarm_render_cache, snapshot)
     download_excel_file_loop.start()
+    logger.info(f"Setup finished in {time.perf_counter() - started:.2f}s "
+                f"({'warm start from ' + snapshot.version[:8] if snapshot else 'no local snapshot'})")
+
+startup_logged = False
 
-    
+@bot.event
+async def on_ready():
+    global startup_logged
+    print(f"Logged in as {bot.user.name}")
+    if not startup_logged:
+        startup_logged = True
+        logger.info(f"First usable command after {time.perf_counter() - STARTED_AT:.2f}s")
 
-# Start the bot with the token from your .env file
-bot.run(os.getenv('DISCORD_TOKEN'))
+# Start the bot with the token from your .env file.
+# Guarded because chart worker processes re-import this module on spawn-based platforms.
+if __name__ == "__main__":
+    bot.run(os.getenv('DISCORD_TOKEN'))
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+from enum import Enum
+
+
+class PenaltyType(str, Enum):
+    """Everything a steward can hand out with !pen"""
+    TIME = "s"
+    GRID_DROP = "gd"
+    TRACK_LIMIT_WARNING = "TLW"
+    LAG_WARNING = "LW"
+    REPRIMAND = "REP"
+    DISQUALIFICATION = "DSQ"
+    BOTG = "BOTG"
+    NO_FURTHER_ACTION = "NFA"
+    NO_FURTHER_INVESTIGATION = "NFI"
+    LAG_INCIDENT = "LI"
+    RACING_INCIDENT = "RI"
+    NFH = "NFH"
+    SELF_SERVED = "SSIR"
+
+
+# Verdicts on the incident as a whole, without a driver
+VERDICT_TYPES = {
+    PenaltyType.NO_FURTHER_ACTION, PenaltyType.NO_FURTHER_INVESTIGATION, PenaltyType.LAG_INCIDENT,
+    PenaltyType.RACING_INCIDENT, PenaltyType.NFH, PenaltyType.SELF_SERVED,
+}
+
+
+# One decision out of a !pen command, e.g. 5s Max - Divebomb
+class Penalty:
+    def __init__(self, type_: PenaltyType, driver: str = None, amount: int = None, reason: str = None):
+        self.type = type_
+        self.driver = driver
+        self.amount = amount
+        self.reason = reason
+
+    @property
+    def short(self) -> str:
+        """The penalty without its reason, as shown in the thread name."""
+        if self.type in (PenaltyType.TIME, PenaltyType.GRID_DROP):
+            return f"{self.amount}{self.type.value} {self.driver}"
+        if self.type == PenaltyType.TRACK_LIMIT_WARNING and self.amount is not None:
+            return f"{self.amount} TLW {self.driver}"
+        return f"{self.type.value} {self.driver}" if self.driver else self.type.value
+
+    @property
+    def text(self) -> str:
+        return self.short + (f" - {self.reason}" if self.reason else "")
+
+
+# A parsed !pen: a POV request, a suggestion request, or a list of penalties
+class PenCommand:
+    POV = "pov"
+    SUGGESTION = "sug"
+    PENALTIES = "penalties"
+
+    def __init__(self, kind: str, penalties: list[Penalty] = None, pov_driver: str = None):
+        self.kind = kind
+        self.penalties = penalties or []
+        self.pov_driver = pov_driver
+
+
+# An open !rpo penalty submission window of one league in one channel
+class PenaltyWindow:
+    def __init__(self, league: str, channel_id: int, message_id: int, end_time: datetime, thread_counter: int = 1,
+                 opened_at: datetime = None):
+        self.league = league
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.end_time = end_time
+        self.thread_counter = thread_counter
+        self.opened_at = opened_at or datetime.now()
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.league, self.channel_id
+
+    def next_thread_number(self) -> int:
+        number = self.thread_counter
+        self.thread_counter += 1
+        return number
+
+    def to_dict(self) -> dict:
+        return {
+            "league": self.league,
+            "channel_id": self.channel_id,
+            "message_id": self.message_id,
+            "end_time": self.end_time.isoformat(),
+            "thread_counter": self.thread_counter,
+            "opened_at": self.opened_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PenaltyWindow":
+        end_time = datetime.fromisoformat(data["end_time"])
+        # Windows saved before opened_at was kept: a sprint window is the longest there is
+        opened_at = datetime.fromisoformat(data["opened_at"]) if "opened_at" in data else end_time - timedelta(minutes=90)
+        return cls(data["league"], data["channel_id"], data["message_id"], end_time, data["thread_counter"], opened_at)
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TimeStatus(str, Enum):
+    """What a lap or race time cell held once normalized"""
+    OK = "OK"
+    DNF = "DNF"
+    DNS = "DNS"
+    DSQ = "DSQ"
+    NA = "N/A"
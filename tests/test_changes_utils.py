@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("discord")
+
+from utils.changes_utils import diff_snapshots
+
+
+def snapshot(standings: dict[str, tuple[int, int]], constructors: dict[str, tuple[int, int]], races=()):
+    profiles = {
+        name.lower(): {"name": name, "standings": {"F1": standing}, "PP": {}, "LW": {}, "REP": {}}
+        for name, standing in standings.items()
+    }
+    return SimpleNamespace(
+        results=SimpleNamespace(races=list(races)),
+        drivers=SimpleNamespace(profiles=profiles),
+        constructors={"F1": constructors},
+    )
+
+
+def test_only_scorers_and_new_entries_are_listed():
+    old = snapshot({"Max": (1, 50), "Lewis": (2, 40), "Seb": (3, 30)}, {"Red Bull": (1, 80), "Mercedes": (2, 70)})
+    new = snapshot({"Seb": (1, 55), "Max": (2, 50), "Lewis": (3, 40), "Kimi": (4, 1)},
+                   {"Ferrari": (1, 90), "Red Bull": (2, 80), "Mercedes": (3, 70)}, races=["R1"])
+    assert diff_snapshots(old, new) == [
+        "🏁 New results: R1",
+        "📈 F1: **Seb** P3 → P1 (+25 pts)",
+        "🆕 F1: **Kimi** enters at P4 (1 pts)",
+        "🆕 F1 constructors: **Ferrari** enters at P1 (90 pts)",
+    ]
+
+
+def test_unchanged_snapshot_has_no_lines():
+    old = snapshot({"Max": (1, 50)}, {"Red Bull": (1, 80)})
+    assert diff_snapshots(old, old) == []
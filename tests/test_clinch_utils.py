@@ -0,0 +1,68 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from utils.clinch_utils import can_still_win, search_winning_scenario, title_contenders
+
+POINTS = [11, 10, 9]
+
+
+@pytest.fixture
+def standings():
+    # One race left: Carlos (24 at most) needs Lewis and Max to score nothing, but only
+    # Lando has room for a podium place, so Carlos is out even though the flow bound keeps him
+    return [("Max", 17), ("Lewis", 16), ("Carlos", 13), ("Lando", 9)]
+
+
+def brute_force(contender, points, remaining, points_system):
+    """Try every finishing order of every remaining race."""
+    orders = list(itertools.permutations(range(len(points))))
+    for races in itertools.product(orders, repeat=remaining):
+        totals = list(points)
+        for order in races:
+            for place, driver in enumerate(order[:len(points_system)]):
+                totals[driver] += points_system[place]
+        if totals[contender] == max(totals):
+            return True
+    return False
+
+
+def test_eliminated_contender_is_not_listed(standings):
+    points = [p for _, p in standings]
+    assert can_still_win(2, points, 1, points_system=POINTS)
+    assert search_winning_scenario(2, points, 1, points_system=POINTS) is False
+    names = [c["name"] for c in title_contenders(standings, 1, points_system=POINTS)]
+    assert names == ["Max", "Lewis"]
+
+
+def test_leader_needs_to_pass_the_runner_up_maximum():
+    contenders = title_contenders([("Max", 100), ("Lewis", 80), ("Seb", 10)], 2)
+    assert [(c["name"], c["max_points"], c["to_clinch"]) for c in contenders] == [("Max", 150, 31), ("Lewis", 130, 71)]
+    assert title_contenders([("Max", 100), ("Lewis", 40)], 2)[0]["to_clinch"] == 0
+
+
+def test_contenders_match_brute_force():
+    rng = random.Random(1)
+    for _ in range(500):
+        points_system = sorted(rng.sample(range(1, 12), 3), reverse=True)
+        standings = sorted(((f"D{i}", rng.randint(0, 30)) for i in range(rng.randint(2, 4))),
+                           key=lambda entry: -entry[1])
+        remaining = rng.randint(0, 2)
+        points = [p for _, p in standings]
+        expected = [name for i, (name, _) in enumerate(standings) if brute_force(i, points, remaining, points_system)]
+        assert [c["name"] for c in title_contenders(standings, remaining, points_system=points_system)] == expected
+
+
+def test_benchmark_title_contenders():
+    rng = random.Random(3)
+    fields = [sorted(((f"D{i}", rng.randint(100, 130)) for i in range(20)), key=lambda entry: -entry[1])
+              for _ in range(50)]
+    start = time.perf_counter()
+    for standings in fields:
+        title_contenders(standings, 4)
+        title_contenders(standings[:10], 4, slots=2)
+    elapsed = (time.perf_counter() - start) / len(fields) * 1000
+    print(f"title_contenders: {elapsed:.2f} ms per league (drivers + constructors)")
+    assert elapsed < 500
@@ -0,0 +1,31 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils import driver_utils
+from utils.driver_utils import DriverIndex
+
+
+@pytest.fixture
+def index(monkeypatch):
+    monkeypatch.setattr(driver_utils, "STANDINGS_RANGES", {"F1": None})
+    monkeypatch.setattr(driver_utils, "INFRACTION_ROWS", {"PP": None})
+    monkeypatch.setattr(driver_utils, "INFRACTION_COLUMNS", {"F1": None})
+    monkeypatch.setattr(driver_utils, "standings_table", lambda sheets, league: pd.DataFrame(
+        {"Name": ["Max", "Lewis"], "Points": [25, 18]}))
+    monkeypatch.setattr(driver_utils, "infraction_table", lambda sheets, category, league: pd.DataFrame(
+        {"Driver": ["Max", "Lewis", "Max"], "Value": [2, 1, 3]}))
+    monkeypatch.setattr(driver_utils, "number_table", lambda sheets: pd.DataFrame(
+        {"Number": [1, 44, 7], "Driver": ["Max", "Lewis", float("nan")]}))
+    return DriverIndex({})
+
+
+def test_duplicate_infraction_rows_add_up(index):
+    assert index.find("max")["PP"] == {"F1": 5}
+    assert index.find("Lewis")["PP"] == {"F1": 1}
+
+
+def test_free_numbers_create_no_profile(index):
+    assert index.find("Max")["number"] == 1
+    assert index.find("Max")["standings"] == {"F1": (1, 25)}
+    assert "nan" not in index.profiles
@@ -0,0 +1,86 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+
+import pytest
+
+from utils import export_utils
+from utils.export_utils import export_rows
+
+HEADER = ["league", "driver", "reason"]
+
+
+def rows(count: int):
+    for i in range(count):
+        yield ("F1", f"Driver {i}", f"Reason {i} " + os.urandom(8).hex())
+
+
+@pytest.fixture
+def cleanup():
+    directories = []
+    yield directories.append
+    for directory in directories:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_single_csv_part(cleanup):
+    directory, paths = export_rows(rows(3), HEADER, "csv", "penalties", 8 * 1024 * 1024)
+    cleanup(directory)
+    assert [os.path.basename(path) for path in paths] == ["penalties.csv.gz"]
+    with gzip.open(paths[0], "rt", encoding="utf-8", newline="") as f:
+        read = list(csv.reader(f))
+    assert read[0] == HEADER and len(read) == 4 and read[1][1] == "Driver 0"
+
+
+def test_json_is_split_into_parts_below_the_limit(cleanup, monkeypatch):
+    monkeypatch.setattr(export_utils, "SIZE_CHECK_ROWS", 50)
+    monkeypatch.setattr(export_utils, "SIZE_MARGIN", 0)
+    limit = 8 * 1024
+    directory, paths = export_rows(rows(2000), HEADER, "json", "penalties", limit)
+    cleanup(directory)
+    assert len(paths) > 1
+    assert os.path.basename(paths[0]) == "penalties_part1.json.gz"
+    exported = []
+    for path in paths:
+        # Each part is checked every 50 rows, so it may overshoot by at most one batch
+        assert os.path.getsize(path) < limit * 2
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            exported.extend(json.load(f))
+    assert [row["driver"] for row in exported] == [f"Driver {i}" for i in range(2000)]
+
+
+def test_no_rows_no_files(cleanup):
+    directory, paths = export_rows(iter(()), HEADER, "csv", "penalties", 1024)
+    cleanup(directory)
+    assert paths == []
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        export_rows(rows(1), HEADER, "xml", "penalties", 1024)
+
+
+def test_xlsx(cleanup):
+    openpyxl = pytest.importorskip("openpyxl")
+    directory, paths = export_rows(rows(3), HEADER, "xlsx", "penalties", 8 * 1024 * 1024)
+    cleanup(directory)
+    sheet = openpyxl.load_workbook(paths[0]).active
+    assert [cell.value for cell in sheet[1]] == HEADER and sheet.max_row == 4
+
+
+def test_xlsx_parts_are_split_again_when_too_big(cleanup, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+    monkeypatch.setattr(export_utils, "SIZE_MARGIN", 0)
+    limit = 16 * 1024
+    directory, paths = export_rows(rows(2000), HEADER, "xlsx", "penalties", limit)
+    cleanup(directory)
+    assert len(paths) > 1
+    assert os.path.basename(paths[0]) == "penalties_part1.xlsx"
+    exported = []
+    for path in paths:
+        assert os.path.getsize(path) <= limit
+        sheet = openpyxl.load_workbook(path, read_only=True).active
+        exported.extend(row[1] for row in sheet.iter_rows(min_row=2, values_only=True))
+    assert exported == [f"Driver {i}" for i in range(2000)]
@@ -0,0 +1,40 @@
+from models.penalty import Penalty, PenaltyType
+from utils.incident_utils import IncidentIndex, build_incident_index, tokenize
+
+
+def test_tokenize_drops_numbers_and_single_letters():
+    assert tokenize("T1 divebomb by Max, 2 cars a") == {"t1", "divebomb", "by", "max", "cars"}
+
+
+def test_search_by_title_driver_reason_and_prefix():
+    index = IncidentIndex()
+    index.add_thread(100, "F1", 1, "F1 1) Verstappen vs Hamilton T1")
+    index.add_thread(200, "F2", 1, "Crash at the chicane")
+    index.add_penalties(200, "F2", 1, [Penalty(PenaltyType.TIME, "Leclerc", 5, "Unsafe rejoin")])
+
+    assert [thread_id for thread_id, _ in index.search("hamilton")] == [100]
+    assert [thread_id for thread_id, _ in index.search("Verst")] == [100]
+    assert [thread_id for thread_id, _ in index.search("leclerc rejoin")] == [200]
+    assert index.search("leclerc hamilton") == []
+    assert index.threads[100]["title"] == "Verstappen vs Hamilton T1"
+    assert index.threads[200]["outcomes"] == ["5s Leclerc - Unsafe rejoin"]
+
+
+def test_search_fuzzy_and_league_filter():
+    index = IncidentIndex()
+    index.add_thread(100, "F1", 1, "Verstappen lag")
+    index.add_thread(300, "F2", 4, "Verstappen divebomb")
+    assert [thread_id for thread_id, _ in index.search("verstapen")] == [300, 100]
+    assert [thread_id for thread_id, _ in index.search("verstappen", "f1")] == [100]
+
+
+def test_renamed_threads_stay_searchable_by_every_title():
+    index = build_incident_index(
+        threads=[(100, "F1", 3)],
+        titles=[(100, "Turn 1 crash"), (100, "✅ F1 3) 5s Max")],
+        penalties=[(100, "F1", 3, "Max", "s", 5, "Divebomb")],
+    )
+    thread = index.threads[100]
+    assert (thread["league"], thread["thread"], thread["title"]) == ("F1", 3, "Turn 1 crash")
+    assert [thread_id for thread_id, _ in index.search("crash")] == [100]
+    assert [thread_id for thread_id, _ in index.search("divebomb")] == [100]
@@ -0,0 +1,32 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils import numbers_utils
+from utils.numbers_utils import NumberRoster
+
+
+@pytest.fixture
+def roster(monkeypatch):
+    table = pd.DataFrame({
+        "Number": [1, 2, 3, 5, 8, 13],
+        # Free numbers come back as None or NaN depending on the pandas version
+        "Driver": ["Max", None, float("nan"), "Lewis", pd.NA, "Seb"],
+    })
+    monkeypatch.setattr(numbers_utils, "number_table", lambda sheets: table)
+    return NumberRoster({})
+
+
+def test_free_numbers_include_nan_drivers(roster):
+    assert roster.free_numbers() == [2, 3, 8]
+    assert roster.owners == {1: "Max", 5: "Lewis", 13: "Seb"}
+    assert roster.is_listed(13) and not roster.is_free(13)
+
+
+def test_nearest_free(roster):
+    assert roster.nearest_free(4) == [3, 2, 8]
+    assert roster.nearest_free(8, count=1) == [8]
+
+
+def test_nearest_free_above_highest_listed(roster):
+    assert roster.nearest_free(99) == [8, 3, 2]
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.penalty import Penalty, PenaltyType
+from utils.penalty_log_utils import record_decision, decisions, clear_penalties, parse_thread_name, \
+    add_summary_line, thread_summary, SummaryCache, crossed_threshold, record_thread, record_thread_title, steward_stats, \
+    iter_penalties, window_report, import_legacy_log, rebuild_summaries, WAITING_FOR_POV
+from utils.penalty_utils import parse_pen_command
+
+TLW = PenaltyType.TRACK_LIMIT_WARNING
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "penalty_log.db")
+
+
+def pen(action: str) -> list[Penalty]:
+    return parse_pen_command(action).penalties
+
+
+def test_parse_thread_name():
+    assert parse_thread_name("✅ F2 12) 5s Max") == ("F2", 12)
+    assert parse_thread_name("Turn 1 crash", "F1") == ("F1", None)
+
+
+def test_decisions_group_one_pen_and_keep_the_latest(db):
+    record_decision(1, "F1", 1, 100, "Steward", pen("5s Max Divebomb, REP Lewis"), path=db)
+    record_decision(2, "F1", 1, 100, "Steward", pen("NFA"), path=db)
+    record_decision(3, "F2", 1, 200, "Steward", pen("3 TLW Seb"), path=db)
+    assert [row[:3] for row in decisions(path=db)] == [
+        ("F1", 1, "5s Max - Divebomb/REP Lewis"), ("F1", 1, "NFA"), ("F2", 1, "3 TLW Seb")]
+    assert [row[:3] for row in decisions("f1", latest_only=True, path=db)] == [("F1", 1, "NFA")]
+    assert clear_penalties(path=db) == 4
+    assert decisions(path=db) == []
+
+
+def test_clearing_drops_the_derived_tables(db):
+    record_decision(1, "F1", 1, 100, "Steward", pen("TLW Max, REP Lewis"), path=db,
+                    thread_created_at=datetime.now(timezone.utc))
+    add_summary_line(100, WAITING_FOR_POV.format(driver="Max"), path=db)
+    clear_penalties(path=db)
+    assert thread_summary(100, path=db) == []
+    assert steward_stats(path=db) == {"stewards": [], "turnaround": {}, "open": []}
+    assert record_decision(2, "F1", 2, 200, "Steward", pen("TLW Max"), path=db) == [("Max", TLW, 0, 1)]
+
+
+def test_legacy_csv_is_imported_once(db, tmp_path):
+    legacy = tmp_path / "penalty_log.csv"
+    legacy.write_text(
+        "F1,3,5s Max - Divebomb,Steward\n"
+        "F1,3,5s Max - Divebomb/REP Lewis,Steward\n"
+        "F2,?,NFA,Other\n"
+        "F1,3,NFA,Other\n",
+        encoding="utf-8"
+    )
+    assert import_legacy_log(str(legacy), path=db) == 4
+    assert [row[:4] for row in decisions(path=db)] == [
+        ("F1", 3, "5s Max - Divebomb/REP Lewis", "Steward"), ("F1", 3, "NFA", "Other"), ("F2", None, "NFA", "Other")]
+    assert rebuild_summaries(path=db) == 4
+
+    clear_penalties(path=db)
+    assert import_legacy_log(str(legacy), path=db) == 0
+    assert decisions(path=db) == []
+
+
+def test_summary_lines_follow_the_decisions(db):
+    record_decision(1, "F1", 1, 100, "Steward", pen("5s Max Divebomb"), path=db)
+    add_summary_line(100, "Waiting for POV Lewis", path=db)
+    assert thread_summary(100, path=db) == ["5s Max - Divebomb", "Waiting for POV Lewis"]
+
+
+def test_summary_cache_evicts_oldest():
+    cache = SummaryCache(maxsize=2)
+    cache.put(1, ["a"])
+    cache.put(2, ["b"])
+    cache.get(1)
+    cache.put(3, ["c"])
+    assert cache.get(2) is None
+    assert cache.get(1) == ["a"]
+    cache.extend(1, ["b"])
+    assert cache.get(1) == ["a", "b"]
+
+
+def test_counters_accumulate_across_threads(db):
+    assert record_decision(1, "F1", 1, 100, "Steward", pen("2 TLW Max"), path=db) == [("Max", TLW, 0, 2)]
+    assert record_decision(2, "F1", 2, 101, "Steward", pen("TLW max, REP Lewis"), path=db) == [
+        ("max", TLW, 2, 3), ("Lewis", PenaltyType.REPRIMAND, 0, 1)]
+    # Counters are per league and ignore penalties without a counted type
+    assert record_decision(3, "F2", 1, 102, "Steward", pen("TLW Max, 5s Max"), path=db) == [("Max", TLW, 0, 1)]
+
+
+def test_crossed_threshold():
+    assert crossed_threshold(TLW, 3, 4)
+    assert not crossed_threshold(TLW, 4, 5)
+    assert crossed_threshold(TLW, 7, 9)
+    assert crossed_threshold(PenaltyType.REPRIMAND, 2, 3) == "grid drop"
+
+
+def test_correction_replaces_the_previous_decision(db):
+    record_decision(1, "F1", 1, 100, "Steward", pen("3 TLW Max"), path=db)
+    assert record_decision(2, "F1", 1, 100, "Steward", pen("1 TLW Max"), path=db) == [("Max", TLW, 0, 1)]
+    assert record_decision(3, "F1", 1, 100, "Steward", pen("NFA"), path=db) == []
+    assert record_decision(4, "F1", 2, 101, "Steward", pen("TLW Max"), path=db) == [("Max", TLW, 0, 1)]
+
+
+def test_zero_amount_is_not_counted_as_one(db):
+    assert record_decision(1, "F1", 1, 100, "Steward", [Penalty(TLW, "Max", 0)], path=db) == [("Max", TLW, 0, 0)]
+
+
+def test_only_first_decision_counts_for_stewards_and_turnaround(db):
+    created = datetime.now(timezone.utc) - timedelta(hours=2)
+    record_decision(1, "F1", 1, 100, "Anna", pen("5s Max"), thread_created_at=created, path=db)
+    record_decision(2, "F1", 1, 100, "Ben", pen("10s Max"), thread_created_at=created, path=db)
+    record_thread(101, "F1", 2, created, path=db)
+
+    stats = steward_stats(path=db)
+    assert stats["stewards"] == [("Anna", 1)]
+    median, threads = stats["turnaround"]["F1"]
+    assert threads == 1 and median == pytest.approx(7200, abs=60)
+    assert [(league, thread) for league, thread, _, _ in stats["open"]] == [("F1", 2)]
+
+
+def test_threads_outside_windows_take_the_league_of_their_title(db):
+    created = datetime.now(timezone.utc) - timedelta(hours=1)
+    record_thread(100, "?", None, created, path=db)
+    record_thread(101, "?", None, created, path=db)
+    record_thread_title(100, "Turn 1 crash", path=db)
+    record_thread_title(100, "F2 4) Turn 1 crash", path=db)
+    record_thread_title(101, "Turn 1 crash", path=db)
+    assert [(league, thread) for league, thread, _, _ in steward_stats(path=db)["open"]] == [("F2", 4)]
+
+    record_thread_title(102, "F1 7) Lap 1", path=db)
+    record_decision(1, "?", None, 102, "Anna", pen("5s Max"), thread_created_at=created, path=db)
+    assert decisions(path=db)[0][:2] == ("F1", 7)
+    assert steward_stats("F1", path=db)["stewards"] == [("Anna", 1)]
+
+
+def test_iter_penalties_filters(db):
+    record_decision(1, "F1", 1, 100, "Steward", pen("5s Max, REP Lewis"), path=db)
+    record_decision(2, "F2", 1, 200, "Steward", pen("NFA"), path=db)
+    rows = list(iter_penalties("F1", path=db))
+    assert [(league, driver, type_) for league, _, driver, type_, *_ in rows] == [("F1", "Max", "s"), ("F1", "Lewis", "REP")]
+    assert list(iter_penalties(start="2999-01-01", path=db)) == []
+
+
+def test_window_report_reopens_waiting_threads(db):
+    opened = datetime.now(timezone.utc) - timedelta(hours=1)
+    for thread_id, number in ((100, 1), (101, 2), (102, 3)):
+        record_thread(thread_id, "F1", number, opened + timedelta(minutes=number), path=db)
+    record_decision(1, "F1", 1, 100, "Steward", pen("5s Max Divebomb"), path=db)
+    record_decision(2, "F1", 2, 101, "Steward", pen("NFA"), path=db)
+    add_summary_line(101, WAITING_FOR_POV.format(driver="Lewis"), path=db)
+
+    report = window_report("f1", opened, datetime.now(timezone.utc), path=db)
+    assert [(t["thread"], t["decided"]) for t in report] == [(1, True), (2, False), (3, False)]
+    assert report[0]["decisions"] == ["5s Max - Divebomb"]
+    assert report[1]["state"] == "Waiting for POV Lewis"
+    assert thread_summary(101, path=db) == ["NFA", "Waiting for POV Lewis"]
@@ -0,0 +1,89 @@
+import random
+import string
+import time
+
+import pytest
+
+from models.penalty import PenaltyType, PenCommand
+from utils.penalty_utils import PENALTY_PATTERN, parse_penalty, parse_pen_command
+
+# Characters stewards actually type, plus the ones that break naive parsers
+ALPHABET = string.ascii_letters + string.digits + " ,+-_.'()/\t\n✅ü"
+TOKENS = ["5s", "3gd", "+10s", "0s", "31gd", "3", "TLW", "LW", "REP", "DSQ", "BOTG", "NFA", "ssir",
+          "pov", "sug", "Max", ",", " ", "", "-", "s", "gd", "99999999999999999999s"]
+
+
+def random_valid_item(rng: random.Random) -> tuple[str, str]:
+    """A valid penalty item and the Penalty.text it must parse to."""
+    driver = "".join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(1, 12)))
+    reason = " ".join(
+        "".join(rng.choices(string.ascii_letters, k=rng.randint(1, 8))) for _ in range(rng.randint(0, 3))
+    )
+    kind = rng.choice(["s", "gd", "tlw_amount", "action", "verdict"])
+    if kind in ("s", "gd"):
+        short = f"{rng.randint(1, 30)}{kind} {driver}"
+    elif kind == "tlw_amount":
+        short = f"{rng.randint(1, 10)} TLW {driver}"
+    elif kind == "action":
+        short = f"{rng.choice(['TLW', 'LW', 'REP', 'DSQ', 'BOTG'])} {driver}"
+    else:
+        return rng.choice(["NFA", "NFI", "LI", "RI", "NFH", "SSIR"]), None
+    item = f"{short} {reason}" if reason else short
+    return item, (f"{short} - {reason}" if reason else short)
+
+
+def test_parses_every_grammar_form():
+    command = parse_pen_command("5s Max Divebomb, 3gd Lewis, 3 TLW Seb, REP Kimi Unsafe rejoin, NFA")
+    assert command.kind == PenCommand.PENALTIES
+    assert [p.text for p in command.penalties] == [
+        "5s Max - Divebomb", "3gd Lewis", "3 TLW Seb", "REP Kimi - Unsafe rejoin", "NFA",
+    ]
+    assert parse_pen_command("pov Max").pov_driver == "Max"
+    assert parse_pen_command("SUG").kind == PenCommand.SUGGESTION
+
+
+@pytest.mark.parametrize("action", ["", " , ", "pov", "pov   ", "5x Max", "31s Max", "0gd Max", "11 TLW Max", "NFA Max", "s Max"])
+def test_rejects_invalid_commands(action):
+    with pytest.raises(ValueError):
+        parse_pen_command(action)
+
+
+def test_fuzz_random_input_only_raises_value_error():
+    rng = random.Random(1234)
+    for _ in range(5000):
+        if rng.random() < 0.5:
+            action = "".join(rng.choices(ALPHABET, k=rng.randint(0, 40)))
+        else:
+            action = " ".join(rng.choices(TOKENS, k=rng.randint(0, 8)))
+        try:
+            command = parse_pen_command(action)
+        except ValueError:
+            continue
+        for penalty in command.penalties:
+            assert isinstance(penalty.type, PenaltyType)
+            assert PENALTY_PATTERN.match(penalty.short), penalty.short
+
+
+def test_fuzz_valid_items_round_trip():
+    rng = random.Random(42)
+    for _ in range(5000):
+        items = [random_valid_item(rng) for _ in range(rng.randint(1, 4))]
+        command = parse_pen_command(", ".join(item for item, _ in items))
+        assert [p.text for p in command.penalties] == [text or item for item, text in items]
+        # The thread name form parses back to the same penalty
+        for penalty in command.penalties:
+            assert parse_penalty(penalty.short).short == penalty.short
+
+
+def test_benchmark_parse_pen_command():
+    rng = random.Random(7)
+    actions = [", ".join(random_valid_item(rng)[0] for _ in range(3)) for _ in range(2000)]
+    start = time.perf_counter()
+    for _ in range(5):
+        for action in actions:
+            parse_pen_command(action)
+    elapsed = time.perf_counter() - start
+    per_command = elapsed / (5 * len(actions)) * 1e6
+    print(f"parse_pen_command: {per_command:.1f} µs per 3-item command")
+    # Generous bound: a regression to per-pattern scanning or backtracking shows up as orders of magnitude
+    assert per_command < 1000
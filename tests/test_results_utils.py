@@ -0,0 +1,73 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils.results_utils import RESULTS_BLOCK, ResultsIndex, normalize_times
+
+
+def race_sheet(rows: list[tuple]) -> pd.DataFrame:
+    """A header=None sheet with the results block (Position, Driver, Team, Pts, Race Time, Fast Lap, Penalty)."""
+    start_row, _, start_col, _ = RESULTS_BLOCK
+    sheet = pd.DataFrame(None, index=range(start_row + 25), columns=range(start_col + 8), dtype=object)
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            sheet.iat[start_row + i, start_col + j] = value
+    return sheet
+
+
+@pytest.fixture
+def results():
+    return ResultsIndex({
+        "F1_R1": race_sheet([(1, "Max", "Red Bull", 25, "45:01.500", "1:30.100", None),
+                             (2, "Lewis", "Mercedes", 18, "45:03.000", "1:29.900", "5s")]),
+        "F1_R2": race_sheet([(1, "Lewis", "Mercedes", 25, "1:02:00.000", "1:31.000", None),
+                             (2, "Max", "Red Bull", 18, "1:02:10.250", "1:31.500", None),
+                             (0, "Seb", "Ferrari", 0, "DNF", None, None)]),
+        "F2_R1": race_sheet([(1, "Oscar", "Prema", 25, "40:00.000", "1:40.000", None)]),
+        "Drivers": pd.DataFrame(),
+    })
+
+
+def test_race_sheets_are_indexed(results):
+    assert list(results.races) == ["F1_R1", "F1_R2", "F2_R1"]
+    assert results.find_race("f1 r2") == "F1_R2"
+    assert results.find_race("F1_R9") is None
+    name, races = results.find_driver("lew")
+    assert name == "Lewis" and [race for race, _ in races] == ["F1_R1", "F1_R2"]
+    assert results.races["F1_R2"]["Race Seconds"].tolist()[:2] == [3720.0, 3730.25]
+
+
+def test_completed_rounds(results):
+    assert results.completed_rounds("f1") == 2
+    assert results.completed_rounds("F3") == 0
+
+
+def test_points_progression(results):
+    progression = results.points_progression("F1")
+    assert progression["Max"].tolist() == [25, 43]
+    assert progression["Seb"].tolist() == [0, 0]
+
+
+def test_times_are_normalized(results):
+    race = results.races["F1_R2"]
+    assert race["Race Status"].tolist() == ["OK", "OK", "DNF"]
+    assert race["Race Display"].tolist() == ["1:02:00.000", "1:02:10.250", "DNF"]
+    assert race["Fastest Lap"].tolist() == [True, False, False]
+
+
+def test_normalize_times_column():
+    seconds, status = normalize_times(pd.Series(["1:30.500", "DSQ", "95.25", "+1 Lap"]))
+    assert seconds.tolist()[:1] == [90.5] and seconds[2] == 95.25
+    assert status.tolist() == ["OK", "DSQ", "OK", "N/A"]
+
+
+def test_head_to_head(results):
+    h2h = results.head_to_head("max", "lewis")
+    assert h2h["names"] == ("Max", "Lewis")
+    assert h2h["races"] == 2
+    assert h2h["ahead"] == (1, 1)
+    assert h2h["points"] == (43, 43)
+    assert h2h["fastest_laps"] == (0, 2)
+    assert h2h["penalties"] == (0, 1)
+    assert results.head_to_head("max", "oscar")["races"] == 0
+    assert results.head_to_head("max", "nobody at all") is None
@@ -0,0 +1,22 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils.standings_utils import STANDINGS_SHEET, STANDINGS_RANGES, INFRACTION_ROWS, INFRACTION_COLUMNS, \
+    standings_table, infraction_table
+
+
+def test_standings_and_infraction_tables():
+    sheet = pd.DataFrame(None, index=range(170), columns=range(140), dtype=object)
+    start_row, _, col, _ = STANDINGS_RANGES["F1"]["driver"]
+    for i, (name, points) in enumerate([(" Lewis ", 18), ("Max", "25"), ("Seb", None)]):
+        sheet.iat[start_row + 1 + i, col] = name
+        sheet.iat[start_row + 1 + i, col + 1] = points
+    pp_row, col = INFRACTION_ROWS["PP"][0], INFRACTION_COLUMNS["F1"]
+    sheet.iat[pp_row, col], sheet.iat[pp_row, col + 1] = "Max", "4"
+    sheets = {STANDINGS_SHEET: sheet}
+
+    table = standings_table(sheets, "F1")
+    assert list(zip(table["Name"], table["Points"])) == [("Max", 25), ("Lewis", 18)]
+    pp = infraction_table(sheets, "PP", "F1")
+    assert list(zip(pp["Driver"], pp["Value"])) == [("Max", 4)]
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from models.penalty import PenaltyWindow
+from utils.window_utils import WindowSchedule, load_windows, save_windows
+
+NOW = datetime(2025, 5, 1, 20, 0)
+
+
+def window(league: str, channel_id: int, minutes: int) -> PenaltyWindow:
+    return PenaltyWindow(league, channel_id, 1, NOW + timedelta(minutes=minutes), opened_at=NOW)
+
+
+def test_windows_close_in_deadline_order():
+    schedule = WindowSchedule([window("F1", 1, 60), window("F2", 1, 30), window("F3", 2, 90)])
+    assert schedule.next_deadline() == NOW + timedelta(minutes=30)
+    assert [w.league for w in schedule.pop_due(NOW + timedelta(minutes=60))] == ["F2", "F1"]
+    assert [w.league for w in schedule.windows.values()] == ["F3"]
+
+
+def test_reopened_and_cancelled_windows_leave_no_stale_deadline():
+    schedule = WindowSchedule([window("F1", 1, 60), window("F2", 1, 30)])
+    schedule.add(window("F1", 1, 120))
+    schedule.remove(("F2", 1))
+    assert schedule.next_deadline() == NOW + timedelta(minutes=120)
+    assert schedule.pop_due(NOW + timedelta(minutes=90)) == []
+    assert [w.league for w in schedule.in_channel(1)] == ["F1"]
+
+
+def test_in_channel_newest_first():
+    schedule = WindowSchedule([window("F1", 1, 60), window("F2", 1, 90), window("F3", 2, 30)])
+    assert [w.league for w in schedule.in_channel(1)] == ["F2", "F1"]
+
+
+def test_windows_round_trip_through_the_file(tmp_path):
+    path = str(tmp_path / "penalty_windows.json")
+    assert load_windows(path) == []
+    original = window("F1", 1, 60)
+    original.next_thread_number()
+    save_windows([original], path)
+    restored, = load_windows(path)
+    assert (restored.key, restored.end_time, restored.opened_at, restored.thread_counter) == \
+        (original.key, original.end_time, original.opened_at, 2)
+
+
+def test_threads_pick_the_window_of_their_league():
+    schedule = WindowSchedule([window("F1", 1, 60)])
+    assert schedule.for_thread(1, "Turn 1 crash").league == "F1"
+    assert schedule.for_thread(2, "Turn 1 crash") is None
+
+    schedule.add(window("F2", 1, 90))
+    assert schedule.for_thread(1, "F1 3) Turn 1 crash").league == "F1"
+    assert schedule.for_thread(1, "[f1] Turn 1 crash").league == "F1"
+    assert schedule.for_thread(1, "Turn 1 crash") is None
+    assert schedule.for_thread(1, "F1 and F2 drivers collide") is None
@@ -0,0 +1,66 @@
+import discord
+
+from utils.embed_utils import embeds_from_lines
+from utils.standings_utils import INFRACTION_ROWS
+
+INFRACTION_EMOJIS = {"PP": "🟥", "LW": "📶", "REP": "🟨"}
+
+
+def diff_snapshots(old, new) -> list[str]:
+    """
+    Compare two snapshots and describe what changed.
+    Only the indexes are compared, nothing is re-read from the sheets. Drivers and teams are
+    listed when their points changed; everyone a scorer passed only shifts, so gets no line.
+    :return: One line per change, empty if nothing relevant changed.
+    """
+    lines = []
+
+    new_races = [race for race in new.results.races if race not in old.results.races]
+    if new_races:
+        lines.append(f"🏁 New results: {', '.join(new_races)}")
+
+    old_profiles = old.drivers.profiles
+    for key, profile in new.drivers.profiles.items():
+        previous = old_profiles.get(key)
+        name = profile["name"]
+
+        for league, standing in profile["standings"].items():
+            line = standing_change(name, standing, previous["standings"].get(league) if previous else None)
+            if line:
+                lines.append(f"{line[0]} {league}: {line[1]}")
+
+        for category in INFRACTION_ROWS:
+            for league, count in profile[category].items():
+                before = previous[category].get(league, 0) if previous else 0
+                if count > before:
+                    lines.append(f"{INFRACTION_EMOJIS[category]} {league}: **{name}** {category} {before} → {count}")
+
+    old_constructors = old.constructors
+    for league, teams in new.constructors.items():
+        for name, standing in teams.items():
+            line = standing_change(name, standing, old_constructors.get(league, {}).get(name))
+            if line:
+                lines.append(f"{line[0]} {league} constructors: {line[1]}")
+
+    return lines
+
+
+def standing_change(name: str, standing: tuple[int, int], before: tuple[int, int] | None) -> tuple[str, str] | None:
+    """
+    Describe one entry's move between two standings, as (emoji, text).
+    :return: None unless the entry is new or its points changed.
+    """
+    position, points = standing
+    if before is None:
+        return "🆕", f"**{name}** enters at P{position} ({points} pts)"
+    old_position, old_points = before
+    if points == old_points:
+        return None
+    move = f"P{old_position} → P{position}" if old_position != position else f"P{position}"
+    delta = points - old_points
+    return "📈", f"**{name}** {move} ({'+' if delta >= 0 else ''}{delta} pts)"
+
+
+def build_change_embeds(lines: list[str], title: str = "📊 Spreadsheet updated") -> list[discord.Embed]:
+    """Pack change lines into as few embeds as the description limit allows."""
+    return embeds_from_lines(lines, title, discord.Color.gold())
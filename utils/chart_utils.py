@@ -0,0 +1,54 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+_chart_cache = {}  # (league, drivers, snapshot version) -> PNG bytes
+_executor = None
+
+
+def render_points_chart(title: str, rounds: list[int], series: dict[str, list[int]]) -> bytes:
+    """Plot cumulative points per round. Runs in a worker process, so it only takes plain data."""
+    import io
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for driver, points in series.items():
+        ax.plot(rounds, points, marker="o", label=driver)
+    ax.set_title(title)
+    ax.set_xlabel("Round")
+    ax.set_ylabel("Points")
+    ax.set_xticks(rounds)
+    ax.grid(alpha=0.3)
+    ax.legend(loc="upper left", fontsize="small")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=120, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+async def points_chart(snapshot, league: str, drivers: tuple[str, ...]) -> bytes:
+    """
+    PNG of cumulative points for the given drivers, cached per snapshot.
+    :param drivers: Column names of the league's points progression.
+    """
+    global _executor
+    key = (league, drivers, snapshot.version)
+    if key in _chart_cache:
+        return _chart_cache[key]
+
+    progression = snapshot.results.points_progression(league)[list(drivers)]
+    series = {driver: progression[driver].astype(int).tolist() for driver in drivers}
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=1)
+    png = await asyncio.get_running_loop().run_in_executor(
+        _executor, render_points_chart, f"{league} Points Progression", progression.index.tolist(), series
+    )
+
+    # Charts of older snapshots can never be requested again
+    for old_key in [k for k in _chart_cache if k[2] != snapshot.version]:
+        del _chart_cache[old_key]
+    _chart_cache[key] = png
+    return png
@@ -0,0 +1,174 @@
+# Points for P1, P2, ... in every remaining race
+POINTS_SYSTEM = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+# Results tried by search_winning_scenario before it gives up without an answer
+SEARCH_BUDGET = 50_000
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def can_still_win(contender: int, points: list[int], remaining: int, slots: int = 1,
+                  points_system: list[int] = POINTS_SYSTEM) -> bool:
+    """
+    Check whether a contender can still finish on top (ties count as still possible).
+
+    The contender takes the top `slots` places of every remaining race. Every other point
+    still has to go to someone, and nobody may pass the contender's best total. That is a
+    flow problem: source -> races (points left to award) -> rivals (at most the best `slots`
+    places left per race) -> sink (each rival's headroom below the contender). The contender
+    can still win only if the max flow awards every point. Cheap bounds settle most cases
+    before the flow is computed.
+    :param points: Current points of every driver (or team).
+    :param slots: Places one entry can take per race, 1 for drivers and 2 for constructors.
+    """
+    best = points[contender] + remaining * sum(points_system[:slots])
+    rivals = [p for i, p in enumerate(points) if i != contender]
+    if any(p > best for p in rivals):
+        return False
+    if remaining == 0:
+        return True
+
+    per_race_cap = sum(points_system[slots:2 * slots])
+    # Nobody can catch the contender even with the best places left in every race
+    if all(p + remaining * per_race_cap <= best for p in rivals):
+        return True
+
+    # Only as many places are scored as there are entries to fill them
+    to_award = sum(points_system[slots:slots * len(points)])
+    if to_award == 0:
+        return True
+
+    # Max flow = min cut. All races are identical, so a cut is fixed by how many races `a`
+    # stay on the source side: the other races cut their source edge, and each rival cuts
+    # either its headroom or its `a` race edges, whichever is smaller.
+    headroom = [best - p for p in rivals]
+    max_flow = min(
+        (remaining - a) * to_award + sum(min(h, a * per_race_cap) for h in headroom)
+        for a in range(remaining + 1)
+    )
+    return max_flow == remaining * to_award
+
+
+def winning_scenario_exists(contender: int, points: list[int], remaining: int, slots: int = 1,
+                            points_system: list[int] = POINTS_SYSTEM) -> bool:
+    """
+    Try to build an actual set of results where the contender wins: the contender takes the
+    top places, and the rival with the most headroom takes the best place left, race by race.
+    A success proves the contender is alive; a failure proves nothing.
+    """
+    best = points[contender] + remaining * sum(points_system[:slots])
+    headroom = [best - p for i, p in enumerate(points) if i != contender]
+    places = points_system[slots:slots * len(points)]
+    for _ in range(remaining):
+        taken = [0] * len(headroom)
+        for place_points in places:
+            rival = max((r for r in range(len(headroom)) if taken[r] < slots), key=lambda r: headroom[r])
+            headroom[rival] -= place_points
+            taken[rival] += 1
+            if headroom[rival] < 0:
+                return False
+    return True
+
+
+def search_winning_scenario(contender: int, points: list[int], remaining: int, slots: int = 1,
+                            points_system: list[int] = POINTS_SYSTEM, budget: int = SEARCH_BUDGET) -> bool | None:
+    """
+    Search every set of results for one where the contender wins; the elimination check for
+    contenders the flow bound lets through. The flow may split one place's points between
+    rivals, so it can keep alive a contender whose rivals cannot actually share out the places.
+    Rivals with the same headroom are interchangeable, and race orders are tried once each.
+    :return: True if a winning scenario exists, False if none does, None if the budget ran out.
+    """
+    best = points[contender] + remaining * sum(points_system[:slots])
+    start = tuple(sorted(best - p for i, p in enumerate(points) if i != contender))
+    if start and start[0] < 0:
+        return False
+    places = [p for p in points_system[slots:slots * len(points)] if p > 0]
+    failed = set()
+    tried = [0]
+
+    def race_outcomes(headroom: tuple):
+        """Headroom left after each way of handing out one race's places, nobody going below zero."""
+        heads, taken = list(headroom), [0] * len(headroom)
+
+        def assign(place: int):
+            tried[0] += 1
+            if tried[0] > budget:
+                raise _BudgetExceeded
+            if place == len(places):
+                yield tuple(sorted(heads))
+                return
+            seen = set()
+            for r in sorted(range(len(heads)), key=lambda r: -heads[r]):
+                if taken[r] >= slots or heads[r] < places[place] or (heads[r], taken[r]) in seen:
+                    continue
+                seen.add((heads[r], taken[r]))
+                heads[r] -= places[place]
+                taken[r] += 1
+                yield from assign(place + 1)
+                heads[r] += places[place]
+                taken[r] -= 1
+
+        return assign(0)
+
+    def survives(headroom: tuple, races: int) -> bool:
+        if races == 0:
+            return True
+        if (headroom, races) in failed:
+            return False
+        seen = set()
+        for outcome in race_outcomes(headroom):
+            if outcome not in seen:
+                seen.add(outcome)
+                if survives(outcome, races - 1):
+                    return True
+        failed.add((headroom, races))
+        return False
+
+    try:
+        return survives(start, remaining)
+    except _BudgetExceeded:
+        return None
+
+
+def title_contenders(standings: list[tuple[str, int]], remaining: int, slots: int = 1,
+                     points_system: list[int] = POINTS_SYSTEM) -> list[dict]:
+    """
+    Everyone who can still mathematically win the title and what they need.
+    :param standings: (name, points) sorted by points, leader first.
+    :return: One dict per contender with name, points, max_points, gap to the leader, the points
+        still needed to clinch (to finish above every rival's maximum) and whether a concrete
+        winning scenario was found.
+    """
+    if not standings:
+        return []
+    points = [p for _, p in standings]
+    leader_points = points[0]
+    per_race = sum(points_system[:slots])
+
+    contenders = []
+    for i, (name, p) in enumerate(standings):
+        # Sorted by points, so once the maximum falls short of the leader nobody below can win either
+        if p + remaining * per_race < leader_points:
+            break
+        if not can_still_win(i, points, remaining, slots, points_system):
+            continue
+        confirmed = winning_scenario_exists(i, points, remaining, slots, points_system)
+        if not confirmed:
+            found = search_winning_scenario(i, points, remaining, slots, points_system)
+            if found is False:
+                continue  # Eliminated after all
+            confirmed = bool(found)
+        contenders.append({
+            "name": name,
+            "points": p,
+            "max_points": p + remaining * per_race,
+            "gap": leader_points - p,
+            "confirmed": confirmed,
+        })
+
+    for contender in contenders:
+        rival_best = max((c["max_points"] for c in contenders if c is not contender), default=None)
+        contender["to_clinch"] = 0 if rival_best is None else max(rival_best + 1 - contender["points"], 0)
+    return contenders
@@ -1,4 +1,28 @@
+import difflib
+import re
+
+
 def hours_to_hhmm(hours: float) -> str:
     """Convert a floating-point hour value (e.g., 14.5) to HH:MM (e.g., '14:30')."""
     h, m = divmod(round(hours * 60), 60)
     return f"{h:02}:{m:02}"
+
+
+def normalize_key(value: str) -> str:
+    """Lowercase and strip everything but letters and digits (e.g. 'F1-R1' -> 'f1r1')."""
+    return re.sub(r"[^a-z0-9]", "", str(value).lower())
+
+
+def match_key(query: str, keys, cutoff: float = 0.75) -> str | None:
+    """
+    Match a query against normalized keys: exact, then unique prefix, then fuzzy.
+    :return: The matching key, or None.
+    """
+    key = normalize_key(query)
+    if key in keys:
+        return key
+    prefixed = [k for k in keys if k.startswith(key)] if key else []
+    if len(prefixed) == 1:
+        return prefixed[0]
+    close = difflib.get_close_matches(key, keys, n=1, cutoff=cutoff)
+    return close[0] if close else None
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from utils.common_utils import normalize_key, match_key
+from utils.standings_utils import STANDINGS_RANGES, INFRACTION_ROWS, INFRACTION_COLUMNS, \
+    standings_table, infraction_table, number_table
+
+
+class DriverIndex:
+    """Every driver's standings, infractions and car number across all leagues, keyed by normalized name."""
+
+    def __init__(self, sheets: dict[str, pd.DataFrame]):
+        self.profiles = {}
+
+        for league in STANDINGS_RANGES:
+            table = standings_table(sheets, league)
+            for position, (name, points) in enumerate(zip(table["Name"], table["Points"]), 1):
+                self._profile(name)["standings"][league] = (position, int(points))
+
+        for category in INFRACTION_ROWS:
+            for league in INFRACTION_COLUMNS:
+                table = infraction_table(sheets, category, league)
+                for name, value in zip(table["Driver"], table["Value"]):
+                    # A driver listed twice in a league has both rows added up
+                    counts = self._profile(name)[category]
+                    counts[league] = counts.get(league, 0) + int(value)
+
+        numbers = number_table(sheets)
+        for number, name in zip(numbers["Number"], numbers["Driver"]):
+            if pd.notna(name):
+                self._profile(name)["number"] = int(number)
+
+    def _profile(self, name: str) -> dict:
+        key = normalize_key(name)
+        if key not in self.profiles:
+            self.profiles[key] = {"name": name, "number": None, "standings": {}, "PP": {}, "LW": {}, "REP": {}}
+        return self.profiles[key]
+
+    def find(self, query: str) -> dict | None:
+        """Find a driver's profile by exact, unique-prefix or fuzzy name match."""
+        key = match_key(query, self.profiles)
+        return self.profiles[key] if key else None
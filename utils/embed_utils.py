@@ -0,0 +1,40 @@
+import discord
+
+EMBED_DESCRIPTION_LIMIT = 4000
+MESSAGE_EMBED_LIMIT = 10
+MESSAGE_EMBED_CHARS = 6000
+
+
+def embeds_from_lines(lines: list[str], title: str, color: discord.Color) -> list[discord.Embed]:
+    """Pack lines into as few embeds as the description limit allows."""
+    embeds = []
+    chunk = ""
+    for line in lines:
+        if chunk and len(chunk) + len(line) + 1 > EMBED_DESCRIPTION_LIMIT:
+            embeds.append(discord.Embed(title=title, description=chunk, color=color))
+            chunk = ""
+        chunk += ("\n" if chunk else "") + line
+    if chunk:
+        embeds.append(discord.Embed(title=title, description=chunk, color=color))
+    return embeds
+
+
+def group_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+    """Split embeds into messages of at most 10 embeds and 6000 characters each."""
+    messages = []
+    current, size = [], 0
+    for embed in embeds:
+        if current and (len(current) == MESSAGE_EMBED_LIMIT or size + len(embed) > MESSAGE_EMBED_CHARS):
+            messages.append(current)
+            current, size = [], 0
+        current.append(embed)
+        size += len(embed)
+    if current:
+        messages.append(current)
+    return messages
+
+
+async def send_embeds(destination, embeds: list[discord.Embed]):
+    """Send embeds in as few messages as Discord allows."""
+    for group in group_embeds(embeds):
+        await destination.send(embeds=group)
@@ -0,0 +1,161 @@
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import tempfile
+import zlib
+
+EXPORT_FORMATS = ("csv", "json", "xlsx")
+
+# Measure the compressed size every so many rows; each check flushes the compressor
+SIZE_CHECK_ROWS = 1000
+# Leave room for the rest of the upload next to the file itself
+SIZE_MARGIN = 256 * 1024
+# Spreadsheets are only sized when saved: they are cut by row count, and a saved part that is
+# still too big is split in half again
+XLSX_ROWS_PER_PART = 100_000
+
+
+class _GzipPart:
+    """One gzip-compressed CSV or JSON file on disk."""
+
+    def __init__(self, path: str, fmt: str, header: list[str]):
+        self.fmt = fmt
+        self.header = header
+        self.raw = open(path, "wb")
+        self.gz = gzip.GzipFile(fileobj=self.raw, mode="wb")
+        self.text = io.TextIOWrapper(self.gz, encoding="utf-8", newline="")
+        self.rows = 0
+        if fmt == "csv":
+            self.writer = csv.writer(self.text)
+            self.writer.writerow(header)
+        else:
+            self.text.write("[\n")
+
+    def write(self, row):
+        if self.fmt == "csv":
+            self.writer.writerow(row)
+        else:
+            self.text.write((",\n" if self.rows else "") + json.dumps(dict(zip(self.header, row)), ensure_ascii=False))
+        self.rows += 1
+
+    def size(self) -> int:
+        self.text.flush()
+        self.gz.flush(zlib.Z_SYNC_FLUSH)
+        return self.raw.tell()
+
+    def close(self):
+        if self.fmt == "json":
+            self.text.write("\n]\n")
+        self.text.close()
+        self.raw.close()
+
+
+class _XlsxPart:
+    """One write-only workbook; rows go straight to disk when it is saved."""
+
+    def __init__(self, path: str, header: list[str]):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Export")
+        self.sheet.append(header)
+        self.rows = 0
+
+    def write(self, row):
+        self.sheet.append(list(row))
+        self.rows += 1
+
+    def close(self):
+        self.workbook.save(self.path)
+
+    def size(self) -> int:
+        """Size of the saved workbook."""
+        return os.path.getsize(self.path)
+
+
+def _split_xlsx(path: str, header: list[str], rows: int, budget: int, new_path) -> list[str]:
+    """
+    Halve a saved workbook until every piece fits the budget (a single row is kept as it is).
+    :param new_path: Returns a fresh path for each piece.
+    :return: Paths of the pieces, in row order.
+    """
+    if rows <= 1 or os.path.getsize(path) <= budget:
+        return [path]
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    halves = [_XlsxPart(new_path(), header), _XlsxPart(new_path(), header)]
+    for i, row in enumerate(workbook.active.iter_rows(min_row=2, values_only=True)):
+        halves[i >= rows // 2].write(row)
+    workbook.close()
+    os.remove(path)
+
+    pieces = []
+    for half in halves:
+        half.close()
+        pieces.extend(_split_xlsx(half.path, header, half.rows, budget, new_path))
+    return pieces
+
+
+def export_rows(rows, header: list[str], fmt: str, basename: str, size_limit: int) -> tuple[str, list[str]]:
+    """
+    Stream rows into compressed files no bigger than the attachment limit.
+    Rows are consumed one at a time, so the export never holds the whole log in memory.
+    :param rows: Iterable of row tuples/lists matching the header.
+    :param fmt: 'csv' or 'json' (gzip-compressed) or 'xlsx'.
+    :param size_limit: Maximum size of one file in bytes.
+    :return: Paths of the written parts, in order, inside the returned temporary directory
+        (empty if there were no rows). The caller removes the directory when done.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format `{fmt}`")
+    directory = tempfile.mkdtemp(prefix="export_")
+    extension = "xlsx" if fmt == "xlsx" else f"{fmt}.gz"
+    budget = max(size_limit - SIZE_MARGIN, size_limit // 2)
+    written = []  # parts under working names, in row order
+    rows_per_part = XLSX_ROWS_PER_PART
+
+    numbers = itertools.count(1)
+
+    def new_path():
+        return os.path.join(directory, f"_{next(numbers)}.{extension}")
+
+    def finish(part):
+        nonlocal rows_per_part
+        part.close()
+        if fmt != "xlsx":
+            written.append(part.raw.name)
+            return
+        size = part.size()
+        written.extend(_split_xlsx(part.path, header, part.rows, budget, new_path))
+        # Cut the next parts at the row count that fitted this one
+        if size > budget:
+            rows_per_part = max(1, min(rows_per_part, part.rows * budget // size))
+
+    part = None
+    for row in rows:
+        if part is None:
+            part = _XlsxPart(new_path(), header) if fmt == "xlsx" else _GzipPart(new_path(), fmt, header)
+        part.write(row)
+        if fmt == "xlsx":
+            full = part.rows >= rows_per_part
+        else:
+            full = part.rows % SIZE_CHECK_ROWS == 0 and part.size() >= budget
+        if full:
+            finish(part)
+            part = None
+    if part is not None:
+        finish(part)
+
+    # A single file needs no part number
+    if len(written) == 1:
+        paths = [os.path.join(directory, f"{basename}.{extension}")]
+    else:
+        paths = [os.path.join(directory, f"{basename}_part{i}.{extension}") for i in range(1, len(written) + 1)]
+    for source, target in zip(written, paths):
+        os.replace(source, target)
+    return directory, paths
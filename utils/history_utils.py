@@ -0,0 +1,96 @@
+import hashlib
+import json
+import re
+import sqlite3
+import zlib
+from contextlib import closing
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from utils.standings_utils import STANDINGS_RANGES, standings_table
+
+HISTORY_DB = "standings_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    version TEXT PRIMARY KEY,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ranges (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_ranges (
+    version TEXT NOT NULL,
+    league TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL,
+    range_hash TEXT NOT NULL,
+    PRIMARY KEY (version, league, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshot_ranges_time ON snapshot_ranges (league, kind, ingested_at);
+CREATE INDEX IF NOT EXISTS idx_snapshot_ranges_round ON snapshot_ranges (league, kind, round, ingested_at);
+"""
+
+
+def connect(path: str = HISTORY_DB) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def ingest_snapshot(snapshot, path: str = HISTORY_DB) -> bool:
+    """
+    Store the standings of every league in the history store.
+    Ranges are content-addressed, so unchanged standings are stored only once.
+    :return: False if this snapshot version was already ingested.
+    """
+    now = datetime.now(dt_timezone.utc).isoformat(timespec="seconds")
+    with closing(connect(path)) as conn, conn:
+        if conn.execute("SELECT 1 FROM snapshots WHERE version = ?", (snapshot.version,)).fetchone():
+            return False
+        conn.execute("INSERT INTO snapshots (version, ingested_at) VALUES (?, ?)", (snapshot.version, now))
+
+        for league in STANDINGS_RANGES:
+            round_number = snapshot.results.completed_rounds(league)
+            for kind in ("driver", "constructor"):
+                table = standings_table(snapshot.sheets, league, kind)
+                rows = json.dumps([[name, int(points)] for name, points in zip(table["Name"], table["Points"])])
+                range_hash = hashlib.sha1(rows.encode("utf-8")).hexdigest()
+                conn.execute("INSERT OR IGNORE INTO ranges (hash, data) VALUES (?, ?)",
+                             (range_hash, zlib.compress(rows.encode("utf-8"))))
+                conn.execute(
+                    "INSERT INTO snapshot_ranges (version, league, kind, round, ingested_at, range_hash) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (snapshot.version, league, kind, round_number, now, range_hash)
+                )
+    return True
+
+
+def historical_standings(league: str, kind: str, at: str, path: str = HISTORY_DB) -> tuple[str, list] | None:
+    """
+    Look up past standings.
+    :param at: 'round5' for the standings after round 5, or an ISO date such as '2025-06-01'.
+    :return: (ingested_at, [(name, points), ...]) or None if nothing was stored for that point.
+    """
+    at = at.lstrip("@").lower()
+    round_match = re.fullmatch(r"r(?:ound)?(\d+)", at)
+    with closing(connect(path)) as conn, conn:
+        if round_match:
+            round_number = int(round_match.group(1))
+            row = conn.execute(
+                "SELECT ingested_at, range_hash FROM snapshot_ranges "
+                "WHERE league = ? AND kind = ? AND round <= ? ORDER BY round DESC, ingested_at DESC LIMIT 1",
+                (league, kind, round_number)
+            ).fetchone()
+        else:
+            next_day = (datetime.fromisoformat(at).date() + timedelta(days=1)).isoformat()
+            row = conn.execute(
+                "SELECT ingested_at, range_hash FROM snapshot_ranges "
+                "WHERE league = ? AND kind = ? AND ingested_at < ? ORDER BY ingested_at DESC LIMIT 1",
+                (league, kind, next_day)
+            ).fetchone()
+        if row is None:
+            return None
+        data = conn.execute("SELECT data FROM ranges WHERE hash = ?", (row[1],)).fetchone()[0]
+    return row[0], json.loads(zlib.decompress(data))
@@ -0,0 +1,103 @@
+import bisect
+import difflib
+import re
+
+from models.penalty import PenaltyType, Penalty
+from utils.common_utils import normalize_key
+
+# "✅ F1 3) " in front of a thread title
+THREAD_PREFIX_PATTERN = re.compile(r"^(?:✅\s*)?\w+\s+\d+\)\s*")
+
+
+def tokenize(text: str) -> set[str]:
+    """Searchable terms of a text: normalized words of two or more characters, bare numbers left out."""
+    return {key for key in map(normalize_key, str(text).split()) if len(key) > 1 and not key.isdigit()}
+
+
+class IncidentIndex:
+    """
+    Inverted index of penalty threads over their titles, driver names and penalty reasons.
+    Terms are also kept sorted, so prefix lookups are a bisect instead of a scan.
+    """
+
+    def __init__(self):
+        self.postings = {}  # term -> thread ids
+        self.terms = []     # every term, sorted
+        self.threads = {}   # thread id -> {"league", "thread", "title", "outcomes"}
+
+    def _thread(self, thread_id: int, league: str = None, number: int = None) -> dict:
+        thread = self.threads.setdefault(thread_id, {"league": "?", "thread": None, "title": "", "outcomes": []})
+        if league and league != "?":
+            thread["league"] = league
+        if number is not None:
+            thread["thread"] = number
+        return thread
+
+    def _index(self, thread_id: int, text: str):
+        for term in tokenize(text):
+            if term not in self.postings:
+                self.postings[term] = set()
+                bisect.insort(self.terms, term)
+            self.postings[term].add(thread_id)
+
+    def add_thread(self, thread_id: int, league: str, number: int | None, title: str):
+        """Index a new or renamed thread. The first title is kept for display; later ones stay searchable."""
+        thread = self._thread(thread_id, league, number)
+        title = THREAD_PREFIX_PATTERN.sub("", title)
+        if not thread["title"]:
+            thread["title"] = title
+        self._index(thread_id, title)
+
+    def add_penalties(self, thread_id: int, league: str, number: int | None, penalties: list[Penalty]):
+        thread = self._thread(thread_id, league, number)
+        for penalty in penalties:
+            thread["outcomes"].append(penalty.text)
+            self._index(thread_id, f"{penalty.driver or ''} {penalty.reason or ''}")
+
+    def lookup(self, term: str) -> set[int]:
+        """Threads with a term equal to or starting with the given one, or else a close spelling."""
+        found = set()
+        start = bisect.bisect_left(self.terms, term)
+        for candidate in self.terms[start:]:
+            if not candidate.startswith(term):
+                break
+            found |= self.postings[candidate]
+        if not found:
+            for candidate in difflib.get_close_matches(term, self.terms, n=3, cutoff=0.8):
+                found |= self.postings[candidate]
+        return found
+
+    def search(self, query: str, league: str = None) -> list[tuple[int, dict]]:
+        """
+        Threads matching every word of the query, newest first.
+        :param league: Only threads of this league.
+        """
+        terms = tokenize(query) or {normalize_key(query)}
+        matches = None
+        for term in terms:
+            found = self.lookup(term)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+        results = [(thread_id, self.threads[thread_id]) for thread_id in matches]
+        if league:
+            results = [(thread_id, thread) for thread_id, thread in results if thread["league"].lower() == league.lower()]
+        # Thread ids are snowflakes, so they sort by creation time
+        return sorted(results, key=lambda item: item[0], reverse=True)
+
+
+def build_incident_index(threads: list[tuple], titles: list[tuple], penalties: list[tuple]) -> IncidentIndex:
+    """
+    Rebuild the index from the penalty store (see penalty_log_utils.incident_documents).
+    :param threads: (thread_id, league, thread) rows.
+    :param titles: (thread_id, title) rows, oldest first.
+    :param penalties: (thread_id, league, thread, driver, type, amount, reason) rows, oldest first.
+    """
+    index = IncidentIndex()
+    known = {thread_id: (league, number) for thread_id, league, number in threads}
+    for thread_id, title in titles:
+        league, number = known.get(thread_id, (None, None))
+        index.add_thread(thread_id, league, number, title)
+    for thread_id, league, number, driver, type_, amount, reason in penalties:
+        index.add_penalties(thread_id, league, number, [Penalty(PenaltyType(type_), driver, amount, reason)])
+    return index
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from utils.standings_utils import number_table
+
+
+class NumberRoster:
+    """Driver numbers of the Drivers sheet as bitsets: bit n is set when number n is listed / free."""
+
+    def __init__(self, sheets: dict[str, pd.DataFrame]):
+        self.listed = 0
+        self.free = 0
+        self.owners = {}  # number -> driver
+
+        numbers = number_table(sheets)
+        for number, driver in zip(numbers["Number"], numbers["Driver"]):
+            if number < 0:
+                continue
+            self.listed |= 1 << number
+            if pd.isna(driver):
+                self.free |= 1 << number
+            else:
+                self.owners[number] = driver
+
+    def is_listed(self, number: int) -> bool:
+        return number >= 0 and bool(self.listed >> number & 1)
+
+    def is_free(self, number: int) -> bool:
+        return number >= 0 and bool(self.free >> number & 1)
+
+    def free_numbers(self) -> list[int]:
+        free, number, numbers = self.free, 0, []
+        while free:
+            if free & 1:
+                numbers.append(number)
+            free >>= 1
+            number += 1
+        return numbers
+
+    def nearest_free(self, preferred: int, count: int = 5) -> list[int]:
+        """The `count` free numbers closest to the preferred one, nearest first (lower wins ties)."""
+        found = []
+        # Far enough to reach every free number from either side, even above the highest listed one
+        limit = max(preferred, self.free.bit_length())
+        for distance in range(limit + 1):
+            for number in (preferred - distance, preferred + distance) if distance else (preferred,):
+                if self.is_free(number) and number not in found:
+                    found.append(number)
+                    if len(found) == count:
+                        return found
+        return found
@@ -0,0 +1,479 @@
+import csv
+import os
+import re
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from datetime import datetime, timedelta, timezone as dt_timezone
+from statistics import median
+
+from models.penalty import PenaltyType, Penalty
+from utils.penalty_utils import parse_penalty
+
+PENALTY_DB = "penalty_log.db"
+LEGACY_CSV = "penalty_log.csv"  # league, thread, actions joined with '/', steward; written before this store
+
+# Running infraction counters are kept per season
+CURRENT_SEASON = int(os.getenv("PENALTY_SEASON", "15"))
+
+# How many of each infraction earn a sanction (4th TLW = penalty, 3rd LW = penalty, 3rd REP = grid drop)
+INFRACTION_THRESHOLDS = {
+    PenaltyType.TRACK_LIMIT_WARNING: (4, "penalty"),
+    PenaltyType.LAG_WARNING: (3, "penalty"),
+    PenaltyType.REPRIMAND: (3, "grid drop"),
+}
+
+# One row per penalty; all rows of one !pen share its decision id (the command message id)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS penalties (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    decision INTEGER NOT NULL,
+    league TEXT NOT NULL,
+    thread INTEGER,
+    thread_id INTEGER NOT NULL,
+    driver TEXT,
+    type TEXT NOT NULL,
+    amount INTEGER,
+    reason TEXT,
+    steward TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_penalties_thread ON penalties (league, thread);
+CREATE INDEX IF NOT EXISTS idx_penalties_driver ON penalties (driver COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_penalties_decision ON penalties (decision);
+CREATE INDEX IF NOT EXISTS idx_penalties_time ON penalties (created_at);
+CREATE TABLE IF NOT EXISTS summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    thread_id INTEGER NOT NULL,
+    line TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_thread ON summaries (thread_id, id);
+CREATE TABLE IF NOT EXISTS infraction_counts (
+    driver TEXT NOT NULL COLLATE NOCASE,
+    league TEXT NOT NULL COLLATE NOCASE,
+    season INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (driver, league, season, type)
+);
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id INTEGER PRIMARY KEY,
+    league TEXT NOT NULL,
+    thread INTEGER,
+    created_at TEXT NOT NULL,
+    decided_at TEXT,
+    turnaround REAL
+);
+CREATE INDEX IF NOT EXISTS idx_threads_decided ON threads (league, decided_at);
+CREATE INDEX IF NOT EXISTS idx_threads_open ON threads (decided_at, created_at);
+CREATE TABLE IF NOT EXISTS thread_titles (
+    thread_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (thread_id, title)
+);
+CREATE TABLE IF NOT EXISTS steward_daily (
+    day TEXT NOT NULL,
+    league TEXT NOT NULL,
+    steward TEXT NOT NULL,
+    decisions INTEGER NOT NULL,
+    PRIMARY KEY (day, league, steward)
+);
+"""
+
+# Summary lines of a thread waiting on the drivers; one of them after the last decision reopens it
+WAITING_PREFIX = "Waiting for"
+WAITING_FOR_POV = WAITING_PREFIX + " POV {driver}"
+WAITING_FOR_SUGGESTION = WAITING_PREFIX + " a suggestion"
+
+# Threads are named "F1 3) Incident" (with a ✅ once decided)
+THREAD_NAME_PATTERN = re.compile(r"(\w+)\s+(\d+)\)")
+
+
+def connect(path: str = PENALTY_DB) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def parse_thread_name(thread_name: str, league: str = "?") -> tuple[str, int | None]:
+    """Read league and thread number from a penalty thread name, falling back to the given league."""
+    match = THREAD_NAME_PATTERN.search(thread_name)
+    return (match.group(1), int(match.group(2))) if match else (league, None)
+
+
+def record_decision(decision: int, league: str, thread: int | None, thread_id: int, steward: str,
+                    penalties: list[Penalty], season: int = CURRENT_SEASON, thread_created_at: datetime = None,
+                    path: str = PENALTY_DB) -> list[tuple]:
+    """
+    Store every penalty of one !pen, its lines of the thread summary and the drivers' running
+    infraction counters in a single transaction. A later !pen in the same thread is a correction:
+    the infractions counted for the thread's previous decision are taken back first.
+    :param decision: Id shared by the rows of this decision (the command message id).
+    :param thread_created_at: When the thread was opened, to time threads no window has recorded.
+    :return: (driver, type, count before, count after) for every counted infraction (TLW, LW, REP).
+    """
+    now = datetime.now(dt_timezone.utc).isoformat(timespec="seconds")
+    with closing(connect(path)) as conn, conn:
+        if league == "?":
+            league, thread = _league_from_titles(conn, thread_id) or (league, thread)
+        previous, = conn.execute("SELECT MAX(decision) FROM penalties WHERE thread_id = ?", (thread_id,)).fetchone()
+        if previous is not None:
+            for row_league, driver, type_, amount in conn.execute(
+                "SELECT league, driver, type, amount FROM penalties WHERE decision = ? AND driver IS NOT NULL",
+                (previous,)
+            ).fetchall():
+                if PenaltyType(type_) not in INFRACTION_THRESHOLDS:
+                    continue
+                conn.execute(
+                    "UPDATE infraction_counts SET count = MAX(count - ?, 0) "
+                    "WHERE driver = ? AND league = ? AND season = ? AND type = ?",
+                    (1 if amount is None else amount, driver, row_league, season, type_)
+                )
+
+        conn.executemany(
+            "INSERT INTO penalties (decision, league, thread, thread_id, driver, type, amount, reason, steward, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(decision, league, thread, thread_id, p.driver, p.type.value, p.amount, p.reason, steward, now)
+             for p in penalties]
+        )
+        conn.executemany("INSERT INTO summaries (thread_id, line) VALUES (?, ?)", [(thread_id, p.text) for p in penalties])
+
+        # Workload and turnaround aggregates: the first decision closes the thread's clock,
+        # corrections count towards neither
+        if thread_created_at is not None:
+            conn.execute(
+                "INSERT OR IGNORE INTO threads (thread_id, league, thread, created_at) VALUES (?, ?, ?, ?)",
+                (thread_id, league, thread, thread_created_at.astimezone(dt_timezone.utc).isoformat(timespec="seconds"))
+            )
+        conn.execute(
+            "UPDATE threads SET decided_at = ?, turnaround = (julianday(?) - julianday(created_at)) * 86400 "
+            "WHERE thread_id = ? AND decided_at IS NULL",
+            (now, now, thread_id)
+        )
+        if previous is None:
+            conn.execute(
+                "INSERT INTO steward_daily (day, league, steward, decisions) VALUES (date(?), ?, ?, 1) "
+                "ON CONFLICT (day, league, steward) DO UPDATE SET decisions = decisions + 1",
+                (now, league, steward)
+            )
+
+        counters = []
+        for p in penalties:
+            if p.type not in INFRACTION_THRESHOLDS or not p.driver:
+                continue
+            added = 1 if p.amount is None else p.amount  # "3 TLW Max" counts three warnings
+            conn.execute(
+                "INSERT INTO infraction_counts (driver, league, season, type, count) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (driver, league, season, type) DO UPDATE SET count = count + excluded.count",
+                (p.driver, league, season, p.type.value, added)
+            )
+            count, = conn.execute(
+                "SELECT count FROM infraction_counts WHERE driver = ? AND league = ? AND season = ? AND type = ?",
+                (p.driver, league, season, p.type.value)
+            ).fetchone()
+            counters.append((p.driver, p.type, count - added, count))
+        return counters
+
+
+def decisions(league: str = None, latest_only: bool = False, path: str = PENALTY_DB) -> list[tuple]:
+    """
+    Logged decisions, one row per !pen, ordered by league and thread number.
+    :param latest_only: Keep only the most recent decision of every thread.
+    :return: (league, thread, actions, steward, created_at) rows; actions joined with '/'.
+    """
+    conditions, params = [], []
+    if league:
+        conditions.append("league = ? COLLATE NOCASE")
+        params.append(league)
+    if latest_only:
+        conditions.append("decision IN (SELECT MAX(decision) FROM penalties GROUP BY league, COALESCE(thread, thread_id))")
+    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+    with closing(connect(path)) as conn:
+        rows = conn.execute(
+            "SELECT decision, league, thread, type, driver, amount, reason, steward, created_at "
+            f"FROM penalties {where} ORDER BY league, thread, decision, id",
+            params
+        ).fetchall()
+
+    grouped = {}
+    for decision, league, thread, type_, driver, amount, reason, steward, created_at in rows:
+        entry = grouped.setdefault(decision, [league, thread, [], steward, created_at])
+        entry[2].append(Penalty(PenaltyType(type_), driver, amount, reason).text)
+    return [(league, thread, "/".join(actions), steward, created_at)
+            for league, thread, actions, steward, created_at in grouped.values()]
+
+
+EXPORT_COLUMNS = ["League", "Thread", "Driver", "Type", "Amount", "Reason", "Steward", "Time"]
+
+
+def iter_penalties(league: str = None, start: str = None, end: str = None, path: str = PENALTY_DB):
+    """
+    Yield penalty rows (EXPORT_COLUMNS order) straight from the cursor, oldest first.
+    :param start: ISO date or time, inclusive.
+    :param end: ISO date or time, exclusive.
+    """
+    conditions, params = [], []
+    if league:
+        conditions.append("league = ? COLLATE NOCASE")
+        params.append(league)
+    if start:
+        conditions.append("created_at >= ?")
+        params.append(start)
+    if end:
+        conditions.append("created_at < ?")
+        params.append(end)
+    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    with closing(connect(path)) as conn:
+        yield from conn.execute(
+            f"SELECT league, thread, driver, type, amount, reason, steward, created_at FROM penalties {where} ORDER BY created_at, id",
+            params
+        )
+
+
+def clear_penalties(path: str = PENALTY_DB) -> int:
+    """
+    Delete every logged penalty together with everything derived from them (summaries, counters,
+    steward and thread aggregates, thread titles) in one transaction.
+    :return: Number of penalties removed.
+    """
+    with closing(connect(path)) as conn, conn:
+        removed = conn.execute("DELETE FROM penalties").rowcount
+        for table in ("summaries", "infraction_counts", "steward_daily", "threads", "thread_titles"):
+            conn.execute(f"DELETE FROM {table}")
+        return removed
+
+
+def import_legacy_log(csv_path: str = LEGACY_CSV, path: str = PENALTY_DB) -> int:
+    """
+    Copy the penalty_log.csv written before this store into it, once: the store remembers the attempt
+    (PRAGMA user_version), so a cleared log is not filled again. The CSV has no thread ids, times or
+    seasons, so rows get negative ids, the file's modification time, and no infraction counters.
+    :return: Number of penalties imported.
+    """
+    with closing(connect(path)) as conn, conn:
+        version, = conn.execute("PRAGMA user_version").fetchone()
+        if version >= 1:
+            return 0
+        conn.execute("PRAGMA user_version = 1")
+        if not os.path.exists(csv_path) or conn.execute("SELECT 1 FROM penalties LIMIT 1").fetchone():
+            return 0
+
+        created_at = datetime.fromtimestamp(os.path.getmtime(csv_path), dt_timezone.utc).isoformat(timespec="seconds")
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = [row for row in csv.reader(f) if len(row) >= 4]
+
+        # The old logger wrote a row after every item of a !pen ("5s Max", then "5s Max/REP Lewis"): keep the last
+        merged = []
+        for league, thread, actions, steward, *_ in rows:
+            previous = merged[-1] if merged else None
+            if previous and previous[:2] == (league, thread) and previous[3] == steward \
+                    and actions.startswith(previous[2] + "/"):
+                merged[-1] = (league, thread, actions, steward)
+            else:
+                merged.append((league, thread, actions, steward))
+
+        thread_ids, imported = {}, []
+        for decision, (league, thread, actions, steward) in enumerate(merged, start=1):
+            number = int(thread) if thread.isdigit() else None
+            key = (league.lower(), number) if number is not None else ("?", -decision)
+            thread_id = thread_ids.setdefault(key, -(len(thread_ids) + 1))
+            for action in filter(None, (part.strip() for part in actions.split("/"))):
+                try:
+                    p = parse_penalty(action.replace(" - ", " ", 1))
+                except ValueError:
+                    continue
+                # Negative ids stay clear of message ids and keep the CSV's order
+                imported.append((decision - len(merged) - 1, league, number, thread_id, p.driver, p.type.value, p.amount, p.reason,
+                                 steward, created_at))
+        conn.executemany(
+            "INSERT INTO penalties (decision, league, thread, thread_id, driver, type, amount, reason, steward, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            imported
+        )
+        return len(imported)
+
+
+def record_thread(thread_id: int, league: str, thread: int | None, created_at: datetime, path: str = PENALTY_DB):
+    """Start the turnaround clock of a new penalty thread."""
+    with closing(connect(path)) as conn, conn:
+        conn.execute(
+            "INSERT OR IGNORE INTO threads (thread_id, league, thread, created_at) VALUES (?, ?, ?, ?)",
+            (thread_id, league, thread, created_at.astimezone(dt_timezone.utc).isoformat(timespec="seconds"))
+        )
+
+
+def record_thread_title(thread_id: int, title: str, path: str = PENALTY_DB):
+    """
+    Remember every title a penalty thread had, for the incident index. A thread opened outside any
+    window takes its league from the first title that is tagged with one.
+    """
+    league, thread = parse_thread_name(title)
+    with closing(connect(path)) as conn, conn:
+        conn.execute("INSERT OR IGNORE INTO thread_titles (thread_id, title) VALUES (?, ?)", (thread_id, title))
+        if league != "?":
+            conn.execute("UPDATE threads SET league = ?, thread = COALESCE(thread, ?) WHERE thread_id = ? AND league = '?'",
+                         (league, thread, thread_id))
+
+
+def _league_from_titles(conn: sqlite3.Connection, thread_id: int) -> tuple[str, int | None] | None:
+    """League and number of the first of a thread's titles that is tagged with a league."""
+    for title, in conn.execute("SELECT title FROM thread_titles WHERE thread_id = ? ORDER BY rowid", (thread_id,)):
+        league, thread = parse_thread_name(title)
+        if league != "?":
+            return league, thread
+    return None
+
+
+def incident_documents(path: str = PENALTY_DB) -> tuple[list, list, list]:
+    """Everything the incident index is built from: threads, their titles and their penalties."""
+    with closing(connect(path)) as conn:
+        threads = conn.execute("SELECT thread_id, league, thread FROM threads").fetchall()
+        titles = conn.execute("SELECT thread_id, title FROM thread_titles ORDER BY rowid").fetchall()
+        penalties = conn.execute(
+            "SELECT thread_id, league, thread, driver, type, amount, reason FROM penalties ORDER BY id"
+        ).fetchall()
+    return threads, titles, penalties
+
+
+def window_report(league: str, opened_at: datetime, closed_at: datetime, path: str = PENALTY_DB) -> list[dict]:
+    """
+    State of every thread opened in a penalty window, read in one pass over the store.
+    :param opened_at: Window start; naive times are local time.
+    :param closed_at: Window end.
+    :return: One dict per thread, by thread number: thread_id, thread, title, decisions (texts of
+        the latest !pen), state (last summary line) and decided.
+    """
+    start = opened_at.astimezone(dt_timezone.utc).isoformat(timespec="seconds")
+    end = closed_at.astimezone(dt_timezone.utc).isoformat(timespec="seconds")
+    in_window = "SELECT thread_id FROM threads WHERE league = ? COLLATE NOCASE AND created_at >= ? AND created_at <= ?"
+
+    with closing(connect(path)) as conn:
+        threads = conn.execute(
+            "SELECT t.thread_id, t.thread, "
+            "(SELECT title FROM thread_titles tt WHERE tt.thread_id = t.thread_id ORDER BY rowid LIMIT 1), "
+            "(SELECT line FROM summaries s WHERE s.thread_id = t.thread_id ORDER BY id DESC LIMIT 1) "
+            f"FROM threads t WHERE t.thread_id IN ({in_window}) ORDER BY t.thread, t.created_at",
+            (league, start, end)
+        ).fetchall()
+        latest = conn.execute(
+            "SELECT thread_id, type, driver, amount, reason FROM penalties WHERE decision IN "
+            f"(SELECT MAX(decision) FROM penalties WHERE thread_id IN ({in_window}) GROUP BY thread_id) ORDER BY id",
+            (league, start, end)
+        ).fetchall()
+
+    decisions = {}
+    for thread_id, type_, driver, amount, reason in latest:
+        decisions.setdefault(thread_id, []).append(Penalty(PenaltyType(type_), driver, amount, reason).text)
+    return [
+        {
+            "thread_id": thread_id,
+            "thread": number,
+            "title": title or "",
+            "decisions": decisions.get(thread_id, []),
+            "state": state,
+            # A POV or suggestion request after the last decision reopens the thread
+            "decided": thread_id in decisions and not (state or "").startswith(WAITING_PREFIX),
+        }
+        for thread_id, number, title, state in threads
+    ]
+
+
+def steward_stats(league: str = None, days: int = 30, path: str = PENALTY_DB) -> dict:
+    """
+    Steward workload and turnaround over the last days. Threads no league could be found for are left out.
+    :return: Dict with 'stewards' [(steward, decisions)], 'turnaround' {league: (median seconds, threads)}
+        and 'open' [(league, thread, thread_id, age seconds)], oldest first.
+    """
+    now = datetime.now(dt_timezone.utc)
+    since = (now - timedelta(days=days)).isoformat(timespec="seconds")
+    league_filter, params = ("AND league = ? COLLATE NOCASE", [league]) if league else ("", [])
+
+    with closing(connect(path)) as conn:
+        stewards = conn.execute(
+            f"SELECT steward, SUM(decisions) FROM steward_daily WHERE day >= date(?) {league_filter} "
+            "GROUP BY steward ORDER BY SUM(decisions) DESC, steward",
+            [since] + params
+        ).fetchall()
+
+        turnarounds = {}
+        for row_league, seconds in conn.execute(
+            f"SELECT league, turnaround FROM threads WHERE decided_at >= ? AND league != '?' {league_filter} "
+            "ORDER BY league, turnaround",
+            [since] + params
+        ):
+            turnarounds.setdefault(row_league, []).append(seconds)
+
+        open_threads = conn.execute(
+            "SELECT league, thread, thread_id, (julianday(?) - julianday(created_at)) * 86400 FROM threads "
+            f"WHERE decided_at IS NULL AND created_at >= ? AND league != '?' {league_filter} ORDER BY created_at",
+            [now.isoformat(timespec="seconds"), since] + params
+        ).fetchall()
+
+    return {
+        "stewards": stewards,
+        "turnaround": {row_league: (median(values), len(values)) for row_league, values in turnarounds.items()},
+        "open": open_threads,
+    }
+
+
+def add_summary_line(thread_id: int, line: str, path: str = PENALTY_DB):
+    """Add a line that is not a penalty (e.g. 'Waiting for POV Max') to a thread's summary."""
+    with closing(connect(path)) as conn, conn:
+        conn.execute("INSERT INTO summaries (thread_id, line) VALUES (?, ?)", (thread_id, line))
+
+
+def thread_summary(thread_id: int, path: str = PENALTY_DB) -> list[str]:
+    with closing(connect(path)) as conn:
+        return [line for line, in conn.execute("SELECT line FROM summaries WHERE thread_id = ? ORDER BY id", (thread_id,))]
+
+
+def rebuild_summaries(path: str = PENALTY_DB) -> int:
+    """
+    Fill the summaries from the penalty log if they are empty, e.g. on the first start with this store.
+    :return: Number of lines restored.
+    """
+    with closing(connect(path)) as conn, conn:
+        if conn.execute("SELECT 1 FROM summaries LIMIT 1").fetchone():
+            return 0
+        rows = conn.execute("SELECT thread_id, type, driver, amount, reason FROM penalties ORDER BY id").fetchall()
+        conn.executemany(
+            "INSERT INTO summaries (thread_id, line) VALUES (?, ?)",
+            [(thread_id, Penalty(PenaltyType(type_), driver, amount, reason).text)
+             for thread_id, type_, driver, amount, reason in rows]
+        )
+        return len(rows)
+
+
+class SummaryCache:
+    """Thread summaries of the most recently used threads; everything else is one indexed read away."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()  # thread id -> summary lines
+
+    def get(self, thread_id: int) -> list[str] | None:
+        if thread_id not in self.entries:
+            return None
+        self.entries.move_to_end(thread_id)
+        return self.entries[thread_id]
+
+    def put(self, thread_id: int, lines: list[str]):
+        self.entries[thread_id] = lines
+        self.entries.move_to_end(thread_id)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def extend(self, thread_id: int, lines: list[str]):
+        """Add lines already written to the store; uncached threads are read fresh on the next get."""
+        cached = self.get(thread_id)
+        if cached is not None:
+            cached.extend(lines)
+
+
+def crossed_threshold(type_: PenaltyType, before: int, after: int) -> str | None:
+    """The sanction earned if a counter passed a multiple of its threshold (4th, 8th TLW...)."""
+    threshold, sanction = INFRACTION_THRESHOLDS[type_]
+    return sanction if after // threshold > before // threshold else None
@@ -0,0 +1,69 @@
+import re
+
+from models.penalty import PenaltyType, Penalty, PenCommand
+
+# One comma-separated item of !pen, matched in a single pass
+PENALTY_PATTERN = re.compile(r"""
+    ^(?:
+        (?P<amount>\+?\d+)(?P<unit>s|gd)\s+(?P<driver>\S+)(?:\s+(?P<reason>.+))?      # 5s Max Divebomb, 3gd Max
+      | (?P<tlw_amount>\d+)\s+TLW\s+(?P<tlw_driver>\S+)(?:\s+(?P<tlw_reason>.+))?    # 3 TLW Max
+      | (?P<action>TLW|LW|REP|DSQ|BOTG)\s+(?P<action_driver>\S+)(?:\s+(?P<action_reason>.+))?  # REP Max Unsafe rejoin
+      | (?P<verdict>NFA|NFI|LI|RI|NFH|SSIR)                                            # NFA
+    )$
+""", re.IGNORECASE | re.VERBOSE)
+POV_PATTERN = re.compile(r"^pov(?:\s+(?P<driver>.+))?$", re.IGNORECASE)
+
+# Allowed amount per type: (min, max, message)
+AMOUNT_LIMITS = {
+    PenaltyType.TIME: (1, 30, "Time penalty for {driver} must be between 1 and 30 seconds."),
+    PenaltyType.GRID_DROP: (1, 30, "Grid drop for {driver} must be between 1 and 30 positions."),
+    PenaltyType.TRACK_LIMIT_WARNING: (1, 10, "TLW penalty for {driver} must be between 1 and 10."),
+}
+
+
+def parse_penalty(item: str) -> Penalty:
+    """
+    Parse one penalty item.
+    :raises ValueError: With a message for the steward if the item is invalid.
+    """
+    match = PENALTY_PATTERN.match(item)
+    if match is None:
+        raise ValueError(f"Invalid penalty format: `{item}`")
+
+    if match["unit"]:
+        penalty = Penalty(PenaltyType(match["unit"].lower()), match["driver"], int(match["amount"].lstrip("+")), match["reason"])
+    elif match["tlw_amount"]:
+        penalty = Penalty(PenaltyType.TRACK_LIMIT_WARNING, match["tlw_driver"], int(match["tlw_amount"]), match["tlw_reason"])
+    elif match["action"]:
+        penalty = Penalty(PenaltyType(match["action"].upper()), match["action_driver"], reason=match["action_reason"])
+    else:
+        return Penalty(PenaltyType(match["verdict"].upper()))
+
+    limits = AMOUNT_LIMITS.get(penalty.type)
+    if limits and penalty.amount is not None and not (limits[0] <= penalty.amount <= limits[1]):
+        raise ValueError(limits[2].format(driver=penalty.driver))
+    if penalty.reason:
+        penalty.reason = penalty.reason.strip()
+    return penalty
+
+
+def parse_pen_command(action: str) -> PenCommand:
+    """
+    Parse and validate a whole !pen command before anything is renamed or logged.
+    Grammar: `pov <name>`, `sug`, or comma-separated penalties
+    (`5s Name reason`, `3gd Name`, `3 TLW Name`, `REP Name reason`, `NFA`).
+    :raises ValueError: With a message for the steward on the first invalid part.
+    """
+    action = action.strip()
+    pov = POV_PATTERN.match(action)
+    if pov:
+        if not pov["driver"] or not pov["driver"].strip():
+            raise ValueError("Invalid format. Use `!pen pov <name>`.")
+        return PenCommand(PenCommand.POV, pov_driver=pov["driver"].strip())
+    if action.lower() == "sug":
+        return PenCommand(PenCommand.SUGGESTION)
+
+    items = [item.strip() for item in action.split(",") if item.strip()]
+    if not items:
+        raise ValueError("Invalid format. Use `!pen 5s Name reason`, `!pen REP Name`, `!pen NFA`, ...")
+    return PenCommand(PenCommand.PENALTIES, [parse_penalty(item) for item in items])
@@ -0,0 +1,27 @@
+from datetime import datetime, timedelta
+
+# Results land in the spreadsheet in the hours after a race
+POST_RACE_WINDOW = timedelta(hours=6)
+POST_RACE_INTERVAL = 5  # minutes
+BASE_INTERVAL = 30  # minutes, doubled for every unchanged download
+MAX_INTERVAL = 240  # minutes
+
+
+def next_poll_interval(now: datetime, race_starts: list[datetime], unchanged_downloads: int) -> float:
+    """
+    Minutes until the next spreadsheet download.
+    Poll every few minutes after a scheduled race, otherwise back off exponentially while
+    downloads come back unchanged, but never sleep past the start of the next race.
+    :param race_starts: Scheduled race start times, sorted.
+    :param unchanged_downloads: Consecutive downloads whose content hash did not change.
+    """
+    for start in race_starts:
+        if start <= now <= start + POST_RACE_WINDOW:
+            return POST_RACE_INTERVAL
+
+    interval = min(BASE_INTERVAL * 2 ** unchanged_downloads, MAX_INTERVAL)
+    upcoming = next((start for start in race_starts if start > now), None)
+    if upcoming is not None:
+        until_race = (upcoming - now).total_seconds() / 60
+        interval = min(interval, max(until_race, POST_RACE_INTERVAL))
+    return interval
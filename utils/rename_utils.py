@@ -0,0 +1,90 @@
+import asyncio
+import time
+from collections import deque
+
+import discord
+
+# Discord allows two name changes per thread every ten minutes
+RENAME_LIMIT = 2
+RENAME_WINDOW = 600
+
+
+class RenameScheduler:
+    """
+    Per-thread rename queue. Only the latest requested name is kept, and it is applied as soon
+    as the thread's rename budget allows, so commands never wait on Discord's rate limit.
+    """
+
+    def __init__(self, limit: int = RENAME_LIMIT, window: float = RENAME_WINDOW):
+        self.limit = limit
+        self.window = window
+        self.pending = {}  # thread id -> (thread, latest wanted name)
+        self.history = {}  # thread id -> times of the last renames
+        self.workers = {}  # thread id -> task applying the pending name
+
+    def desired_name(self, thread: discord.Thread) -> str:
+        """The name the thread will end up with: the pending one, or its current name."""
+        return self.pending[thread.id][1] if thread.id in self.pending else thread.name
+
+    def delay(self, thread_id: int) -> float:
+        """Seconds until the thread may be renamed again."""
+        history = self.history.get(thread_id)
+        if not history or len(history) < self.limit:
+            return 0
+        return max(0.0, history[0] + self.window - time.monotonic())
+
+    def request(self, thread: discord.Thread, name: str) -> float:
+        """
+        Queue a rename, replacing any name still waiting for this thread.
+        :return: Seconds until it can be applied (0 if right away).
+        """
+        name = name[:100]  # Discord's thread name limit
+        self._forget_idle()
+        if thread.id not in self.pending and thread.name == name:
+            return 0
+        self.pending[thread.id] = (thread, name)
+        if thread.id not in self.workers:
+            self.workers[thread.id] = asyncio.create_task(self._apply(thread.id))
+        return self.delay(thread.id)
+
+    def _forget_idle(self):
+        """Drop the history of threads whose budget has fully recovered."""
+        cutoff = time.monotonic() - self.window
+        for thread_id in [t for t, history in self.history.items() if history[-1] < cutoff and t not in self.workers]:
+            del self.history[thread_id]
+
+    async def _apply(self, thread_id: int):
+        try:
+            while thread_id in self.pending:
+                wait = self.delay(thread_id)
+                if wait:
+                    await asyncio.sleep(wait)
+                thread, name = self.pending.pop(thread_id)
+                if thread.name == name:
+                    continue
+                try:
+                    await thread.edit(name=name)
+                except discord.HTTPException as e:
+                    if e.status != 429:
+                        print(f"[!] Could not rename thread {thread_id}: {e}")
+                        continue
+                    # Out of budget after all (e.g. renamed by hand): retry once Discord allows it
+                    self.pending.setdefault(thread_id, (thread, name))
+                    retry_after = getattr(e, "retry_after", None) or self.window / self.limit
+                    await asyncio.sleep(retry_after)
+                    continue
+                self.history.setdefault(thread_id, deque(maxlen=self.limit)).append(time.monotonic())
+        finally:
+            del self.workers[thread_id]
+
+
+rename_scheduler = RenameScheduler()
+
+
+def rename_thread(thread: discord.Thread, name: str) -> float:
+    """Queue a thread rename; see RenameScheduler.request."""
+    return rename_scheduler.request(thread, name)
+
+
+def desired_thread_name(thread: discord.Thread) -> str:
+    return rename_scheduler.desired_name(thread)
@@ -0,0 +1,29 @@
+# Rendered command output, rebuilt only when the data behind it changes.
+# A payload is a list of messages, each one the keyword arguments for ctx.send.
+
+_render_cache = {}  # (command, args) -> (version, payload)
+
+
+def cached_render(command: str, args: tuple, version: str, build) -> list[dict]:
+    """
+    Return the cached payload for a command, building it if the data version changed.
+    :param version: Snapshot version or file revision the payload depends on.
+    :param build: Callable producing the payload.
+    """
+    entry = _render_cache.get((command, args))
+    if entry and entry[0] == version:
+        return entry[1]
+    payload = build()
+    _render_cache[(command, args)] = (version, payload)
+    return payload
+
+
+def invalidate(command: str = None):
+    """Drop cached payloads of one command, or of every command."""
+    for key in [key for key in _render_cache if command is None or key[0] == command]:
+        del _render_cache[key]
+
+
+async def send_payload(ctx, payload: list[dict]):
+    for message in payload:
+        await ctx.send(**message)
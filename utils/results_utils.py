@@ -0,0 +1,191 @@
+import difflib
+import re
+
+import pandas as pd
+
+from models.results import TimeStatus
+from utils.common_utils import normalize_key, match_key
+from utils.stats_utils import season_stats
+
+# Race results block (AR78:AX98). Sheets are parsed with header=None, so this is
+# one row lower than the iloc[76:97] used when the first row was the header.
+RESULTS_BLOCK = (77, 98, 43, 50)
+RESULT_COLUMNS = ["Position", "Driver", "Team", "Pts", "Race Time", "Fast Lap", "Penalty"]
+
+RACE_SHEET_PATTERN = re.compile(r"^(.+)_R(\d+)$", re.IGNORECASE)
+
+# Per-driver columns kept for head-to-head comparisons, indexed by race sheet
+H2H_COLUMNS = ["League", "Round", "Position", "Pts", "Fastest Lap", "Penalized"]
+
+
+# h:mm:ss.sss / m:ss.sss, after any date or "0 days" prefix that Timestamps and Timedeltas print
+TIME_PATTERN = r"^(?:.*\s)?(?:(?P<h>\d+):)?(?P<m>\d+):(?P<s>\d+(?:\.\d+)?)$"
+NUMBER_PATTERN = r"^\d+(?:\.\d+)?$"
+
+
+def normalize_times(column: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    Convert a whole column of lap or race times to float seconds in one pass.
+    :param column: Cells holding datetime.time, Timestamp, Timedelta, 'm:ss.sss' strings or numbers.
+    :return: (seconds, status); seconds is NaN wherever the status is not OK.
+    """
+    text = column.astype(str).str.strip()
+    parts = text.str.extract(TIME_PATTERN)
+    seconds = parts["h"].astype(float).fillna(0) * 3600 + parts["m"].astype(float) * 60 + parts["s"].astype(float)
+    seconds = seconds.fillna(pd.to_numeric(text.where(text.str.match(NUMBER_PATTERN)), errors="coerce"))
+
+    status = pd.Series(TimeStatus.NA.value, index=column.index)
+    status[seconds.notna()] = TimeStatus.OK.value
+    upper = text.str.upper()
+    for flag in (TimeStatus.DNF, TimeStatus.DNS, TimeStatus.DSQ):
+        status[upper == flag.value] = flag.value
+    return seconds, status
+
+
+def format_times(seconds: pd.Series, status: pd.Series, raw: pd.Series) -> pd.Series:
+    """
+    Format a column of seconds as m:ss.sss (h:mm:ss.sss past an hour).
+    Cells without a time show their status, or their original text if it was something else (e.g. '+1 Lap').
+    """
+    display = raw.where(raw.notna() & (status == TimeStatus.NA.value), status).astype(str)
+
+    valid = seconds.round(3).dropna()
+    whole_minutes = (valid // 60).astype(int)
+    secs = (valid - whole_minutes * 60).map("{:06.3f}".format)
+    hours, minutes = whole_minutes // 60, whole_minutes % 60
+    clock = (minutes.astype(str) + ":" + secs).where(
+        hours == 0, hours.astype(str) + ":" + minutes.astype(str).str.zfill(2) + ":" + secs
+    )
+    display[clock.index] = clock
+    return display
+
+
+def parse_race_block(df: pd.DataFrame) -> pd.DataFrame:
+    """Cut the results block out of a race sheet and normalize its times column-wise."""
+    start_row, end_row, start_col, end_col = RESULTS_BLOCK
+    block = df.iloc[start_row:end_row, start_col:end_col].copy()
+    block.columns = RESULT_COLUMNS[:block.shape[1]]
+    block = block.reindex(columns=RESULT_COLUMNS)  # narrow sheets have no Penalty column
+
+    block = block.dropna(subset=["Driver", "Team"])
+    block["Driver"] = block["Driver"].astype(str).str.strip()
+    block["Position"] = pd.to_numeric(block["Position"], errors="coerce").fillna(0).astype(int)
+    block["Pts"] = pd.to_numeric(block["Pts"], errors="coerce").fillna(0).astype(int)
+
+    block["Race Seconds"], block["Race Status"] = normalize_times(block["Race Time"])
+    block["Lap Seconds"], block["Lap Status"] = normalize_times(block["Fast Lap"])
+    block["Race Display"] = format_times(block["Race Seconds"], block["Race Status"], block["Race Time"])
+    block["Lap Display"] = format_times(block["Lap Seconds"], block["Lap Status"], block["Fast Lap"])
+    block["Gap Seconds"] = block["Race Seconds"] - block["Race Seconds"].min()
+    block["Fastest Lap"] = block["Lap Seconds"].eq(block["Lap Seconds"].min())
+    return block.reset_index(drop=True)
+
+
+class ResultsIndex:
+    """All race result sheets of a snapshot, keyed by sheet and by driver."""
+
+    def __init__(self, sheets: dict[str, pd.DataFrame]):
+        self.races = {}    # sheet name -> parsed results
+        self.keys = {}     # normalized sheet name -> sheet name
+        self._stats = {}   # 'Driver' / 'Team' -> season stats, built on first use
+        self.drivers = {}  # normalized driver name -> (display name, [(sheet name, row), ...])
+        frames = []
+
+        race_sheets = []
+        for name in sheets:
+            match = RACE_SHEET_PATTERN.match(str(name).strip())
+            if match:
+                race_sheets.append((match.group(1).upper(), int(match.group(2)), name))
+
+        for league, round_number, name in sorted(race_sheets):
+            results = parse_race_block(sheets[name])
+            if results.empty:
+                continue
+            self.races[name] = results
+            self.keys[normalize_key(name)] = name
+            frames.append(results.assign(League=league, Round=round_number, Race=name))
+            for row in results.to_dict("records"):
+                key = normalize_key(row["Driver"])
+                if not key:
+                    continue
+                self.drivers.setdefault(key, (row["Driver"], []))[1].append((name, row))
+
+        # Every race of every league in one columnar table
+        self.table = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            columns=RESULT_COLUMNS + ["Race Seconds", "Race Status", "Lap Seconds", "Fastest Lap", "League", "Round", "Race"])
+
+        # One small array per driver, so a head-to-head is an aligned comparison of two of them
+        penalty = self.table["Penalty"].astype(str).str.strip()
+        arrays = self.table.assign(Penalized=self.table["Penalty"].notna() & (penalty != ""))
+        self.arrays = {
+            key: frame.drop_duplicates("Race").set_index("Race")[H2H_COLUMNS]
+            for key, frame in arrays.groupby(arrays["Driver"].map(normalize_key))
+            if key
+        }
+
+    def completed_rounds(self, league: str) -> int:
+        """Number of result sheets of a league (F1_R1, F1_R2, ... -> 2)."""
+        prefix = f"{league.upper()}_R"
+        return sum(1 for race in self.races if race.upper().startswith(prefix))
+
+    def points_progression(self, league: str) -> pd.DataFrame:
+        """Cumulative points per round (rows) and driver (columns) for one league."""
+        league_results = self.table[self.table["League"] == league.upper()]
+        return (
+            league_results.pivot_table(index="Round", columns="Driver", values="Pts", aggfunc="sum", fill_value=0)
+            .sort_index()
+            .cumsum()
+        )
+
+    def season_stats(self, league: str, by: str = "Driver") -> pd.DataFrame:
+        """Season stats of one league per driver or team. All leagues are aggregated once per snapshot."""
+        if by not in self._stats:
+            self._stats[by] = season_stats(self.table, by)
+        stats = self._stats[by]
+        return stats[stats["League"] == league.upper()]
+
+    def find_race(self, query: str) -> str | None:
+        """Find a race sheet by case-insensitive or fuzzy name (F1_R1, f1 r1, F1-R1)."""
+        key = normalize_key(query)
+        if key in self.keys:
+            return self.keys[key]
+        # Only fuzz the league part, never the round number
+        match = re.match(r"^(.*?)r(\d+)$", key)
+        if not match:
+            return None
+        same_round = [k for k in self.keys if k.endswith(f"r{match.group(2)}")]
+        close = difflib.get_close_matches(key, same_round, n=1, cutoff=0.8)
+        return self.keys[close[0]] if close else None
+
+    def head_to_head(self, query_a: str, query_b: str, league: str = None) -> dict | None:
+        """
+        Compare two drivers over every race they both started.
+        :param league: Only count races of this league.
+        :return: Names plus per-driver totals, or None if either driver has no results.
+        """
+        key_a, key_b = match_key(query_a, self.arrays), match_key(query_b, self.arrays)
+        if key_a is None or key_b is None:
+            return None
+        a, b = self.arrays[key_a], self.arrays[key_b]
+        if league:
+            a, b = a[a["League"] == league.upper()], b[b["League"] == league.upper()]
+
+        # Align both arrays on the races they share
+        a, b = a.align(b, join="inner", axis=0)
+        classified = (a["Position"] > 0) & (b["Position"] > 0)
+        return {
+            "names": (self.drivers[key_a][0], self.drivers[key_b][0]),
+            "races": len(a),
+            "ahead": (int((classified & (a["Position"] < b["Position"])).sum()),
+                      int((classified & (b["Position"] < a["Position"])).sum())),
+            "best": (int(a["Position"][a["Position"] > 0].min()) if (a["Position"] > 0).any() else None,
+                     int(b["Position"][b["Position"] > 0].min()) if (b["Position"] > 0).any() else None),
+            "points": (int(a["Pts"].sum()), int(b["Pts"].sum())),
+            "fastest_laps": (int(a["Fastest Lap"].sum()), int(b["Fastest Lap"].sum())),
+            "penalties": (int(a["Penalized"].sum()), int(b["Penalized"].sum())),
+        }
+
+    def find_driver(self, query: str) -> tuple[str, list] | None:
+        """Find a driver's season by exact, unique-prefix or fuzzy name match."""
+        key = match_key(query, self.drivers)
+        return self.drivers[key] if key else None
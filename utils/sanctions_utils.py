@@ -0,0 +1,76 @@
+import json
+import os
+
+import pandas as pd
+
+from utils.standings_utils import INFRACTION_ROWS, INFRACTION_COLUMNS, infraction_table
+
+SANCTIONS_STATE_FILE = "sanctions_state.json"
+
+# Totals across all leagues at or above the threshold earn the sanction
+SANCTION_RULES = {
+    "PP": {"threshold": 12, "sanction": "SHOULD BE BANNED 🚨"},
+    "LW": {"threshold": 3, "sanction": "SHOULD GET A 5s PENALTY ⏱️"},
+    "REP": {"threshold": 3, "sanction": "SHOULD GET 10 GD PENALTY 🔟"},
+}
+
+
+def infraction_totals(sheets: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Total PP, LW and REP per driver across all leagues in a single group-by."""
+    infractions = pd.concat([
+        infraction_table(sheets, category, league).assign(Category=category)
+        for category in INFRACTION_ROWS
+        for league in INFRACTION_COLUMNS
+    ])
+    if infractions.empty:
+        return pd.DataFrame(columns=list(INFRACTION_ROWS), dtype=int)
+    return (
+        infractions.groupby(["Driver", "Category"])["Value"].sum()
+        .unstack(fill_value=0)
+        .reindex(columns=list(INFRACTION_ROWS), fill_value=0)
+    )
+
+
+def evaluate_sanctions(totals: pd.DataFrame) -> dict[str, list[str]]:
+    """
+    Apply every rule to the totals at once.
+    :return: Driver -> categories whose threshold the driver has reached, worst first.
+    """
+    flags = pd.DataFrame({category: totals[category] >= rule["threshold"] for category, rule in SANCTION_RULES.items()})
+    flagged = flags[flags.any(axis=1)]
+    order = totals.loc[flagged.index].sort_values(by=list(SANCTION_RULES), ascending=False).index
+    return {driver: [category for category in SANCTION_RULES if flagged.at[driver, category]] for driver in order}
+
+
+def load_announced() -> set[str]:
+    if os.path.exists(SANCTIONS_STATE_FILE):
+        with open(SANCTIONS_STATE_FILE, "r") as f:
+            return set(json.load(f))
+    return set()
+
+
+def sanction_line(totals: pd.DataFrame, driver: str, category: str) -> str:
+    """One alert line for a driver who reached a category's threshold, shared by the alerts and !pp/!lw/!rep."""
+    return f"**{driver}** {SANCTION_RULES[category]['sanction']} ({category}: {totals.at[driver, category]})"
+
+
+def new_crossings(sanctions: dict[str, list[str]]) -> list[tuple[str, str]]:
+    """
+    Compare the sanctions of a snapshot with those already announced. Nothing is saved here;
+    call mark_announced once the alert has actually been posted.
+    :return: (driver, category) pairs that crossed a threshold since the last announcement.
+    """
+    current = {f"{driver}|{category}" for driver, categories in sanctions.items() for category in categories}
+    return [tuple(key.split("|", 1)) for key in sorted(current - load_announced())]
+
+
+def mark_announced(sanctions: dict[str, list[str]], posted: list[tuple[str, str]]):
+    """
+    Remember the crossings that were posted. Drivers who dropped back below a threshold are
+    forgotten, so crossing it again alerts again; crossings that were not posted stay new.
+    """
+    current = {f"{driver}|{category}" for driver, categories in sanctions.items() for category in categories}
+    announced = (load_announced() & current) | {f"{driver}|{category}" for driver, category in posted}
+    with open(f"{SANCTIONS_STATE_FILE}.part", "w") as f:
+        json.dump(sorted(announced), f, indent=4)
+    os.replace(f"{SANCTIONS_STATE_FILE}.part", SANCTIONS_STATE_FILE)
@@ -0,0 +1,63 @@
+import hashlib
+import io
+import os
+import threading
+
+import pandas as pd
+
+from utils.driver_utils import DriverIndex
+from utils.numbers_utils import NumberRoster
+from utils.results_utils import ResultsIndex
+from utils.sanctions_utils import infraction_totals, evaluate_sanctions
+from utils.standings_utils import STANDINGS_RANGES, standings_table
+
+EXCEL_FILE_NAME = "Formula V SuperLicense.xlsx"
+
+_current_snapshot = None
+_load_lock = threading.Lock()
+
+
+class Snapshot:
+    """One parsed copy of the spreadsheet and the indexes built from it."""
+
+    def __init__(self, version: str, sheets: dict[str, pd.DataFrame]):
+        self.version = version  # sha1 of the workbook bytes
+        self.sheets = sheets
+        self.results = ResultsIndex(sheets)
+        self.drivers = DriverIndex(sheets)
+        self.constructors = {
+            league: {name: (position, int(points)) for position, (name, points) in enumerate(
+                zip(table["Name"], table["Points"]), 1)}
+            for league, table in ((league, standings_table(sheets, league, "constructor")) for league in STANDINGS_RANGES)
+        }  # league -> team -> (position, points)
+        self.numbers = NumberRoster(sheets)
+        self.infraction_totals = infraction_totals(sheets)
+        self.sanctions = evaluate_sanctions(self.infraction_totals)
+
+
+def load_snapshot(path: str = EXCEL_FILE_NAME) -> Snapshot | None:
+    """
+    Parse the workbook into a new snapshot if its content changed since the last load.
+    Blocking, run it in a thread from async code.
+    :return: The current snapshot, or None if the workbook does not exist yet.
+    """
+    global _current_snapshot
+    with _load_lock:
+        if not os.path.exists(path):
+            return _current_snapshot
+
+        with open(path, "rb") as f:
+            content = f.read()
+        version = hashlib.sha1(content).hexdigest()
+        if _current_snapshot and _current_snapshot.version == version:
+            return _current_snapshot
+
+        sheets = pd.read_excel(io.BytesIO(content), sheet_name=None, header=None, engine="openpyxl")
+        _current_snapshot = Snapshot(version, sheets)
+        print(f"[✓] Snapshot {version[:8]} loaded ({len(sheets)} sheets)")
+        return _current_snapshot
+
+
+def get_snapshot() -> Snapshot | None:
+    """Return the current snapshot, loading it from disk on first use."""
+    return _current_snapshot or load_snapshot()
@@ -0,0 +1,98 @@
+import pandas as pd
+
+STANDINGS_SHEET = "Calendar and Standings"
+DRIVERS_SHEET = "Drivers"
+
+# Driver and constructor standings ranges (start_row, end_row, start_col, end_col).
+# Rows are measured on a frame that used the first sheet row as header.
+STANDINGS_RANGES = {
+    "F1": {
+        "driver": (46, 77, 20, 22),   # U47:V77
+        "constructor": (28, 40, 20, 22)  # U30:V39
+    },
+    "F2": {
+        "driver": (46, 77, 35, 37),   # AJ47:AK77
+        "constructor": (28, 40, 35, 37)  # AJ30:AK40
+    },
+    "F3": {
+        "driver": (46, 77, 48, 50),   # AJ47:AK77
+        "constructor": (28, 40, 48, 50)  # AJ30:AK40
+    },
+    "INDY": {
+        "driver": (46, 77, 107, 109),  # DD48:DE76
+        "constructor": (28, 39, 107, 109)  # DD30:DE39
+    },
+    "S80": {
+        "driver": (46, 77, 96, 98),   # CS48:CT77
+        "constructor": (28, 40, 96, 98)  # CS30:CT38
+    },
+    "MOTOVGP": {
+        "driver": (46, 77, 119, 121),      # DP48:DQ64
+        "constructor": (28, 40, 119, 121)  # DP30:DQ38
+    },
+    "DUNE": {
+        "driver": (46, 77, 130, 132),      # EA48:EB73
+        "constructor": (28, 40, 130, 132)  # EA30:EB36
+    }
+}
+
+# PP / LW / REP tables (inclusive start_row, end_row on a header=None frame) and the
+# driver column of each league; the value sits in the column next to it.
+INFRACTION_ROWS = {
+    "PP": (86, 105),    # U87:V105
+    "LW": (113, 131),   # U114:V132
+    "REP": (140, 158),  # U141:V159
+}
+INFRACTION_COLUMNS = {"F1": 20, "F2": 35, "F3": 48}
+
+# Driver numbers (AK8:AL106 on the Drivers sheet)
+NUMBER_ROWS = (7, 106)
+NUMBER_COLUMN = 36
+NUMBER_NAME_COLUMN = 37
+
+
+def standings_table(sheets: dict[str, pd.DataFrame], league: str, kind: str = "driver") -> pd.DataFrame:
+    """
+    Read a league's standings, sorted by points.
+    :param kind: 'driver' or 'constructor'.
+    :return: DataFrame with 'Name' and 'Points' columns.
+    """
+    start_row, end_row, start_col, end_col = STANDINGS_RANGES[league][kind]
+    table = sheets[STANDINGS_SHEET].iloc[start_row + 1:end_row + 1, start_col:end_col].copy()
+    table.columns = ["Name", "Points"]
+    table["Points"] = pd.to_numeric(table["Points"], errors="coerce")
+    table = table.dropna()
+    table["Name"] = table["Name"].astype(str).str.strip()
+    table["Points"] = table["Points"].astype(int)
+    return table.sort_values(by="Points", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def infraction_table(sheets: dict[str, pd.DataFrame], category: str, league: str) -> pd.DataFrame:
+    """
+    Read a league's PP, LW or REP table.
+    :return: DataFrame with 'Driver' and 'Value' columns.
+    """
+    start_row, end_row = INFRACTION_ROWS[category]
+    col = INFRACTION_COLUMNS[league]
+    table = sheets[STANDINGS_SHEET].iloc[start_row:end_row + 1, col:col + 2].copy()
+    table.columns = ["Driver", "Value"]
+    table = table.dropna()
+    table["Driver"] = table["Driver"].astype(str).str.strip()
+    table["Value"] = pd.to_numeric(table["Value"], errors="coerce").fillna(0).astype(int)
+    return table.reset_index(drop=True)
+
+
+def number_table(sheets: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Read the driver number roster from the Drivers sheet.
+    :return: DataFrame with 'Number' and 'Driver' columns; Driver is missing for free numbers
+        (None, or NaN once pandas stores the column as strings), so test it with pd.isna.
+    """
+    start_row, end_row = NUMBER_ROWS
+    table = sheets[DRIVERS_SHEET].iloc[start_row:end_row, [NUMBER_COLUMN, NUMBER_NAME_COLUMN]].copy()
+    table.columns = ["Number", "Driver"]
+    table["Number"] = pd.to_numeric(table["Number"], errors="coerce")
+    table = table.dropna(subset=["Number"])
+    table["Number"] = table["Number"].astype(int)
+    table["Driver"] = table["Driver"].map(lambda name: str(name).strip() if pd.notna(name) and str(name).strip() else None)
+    return table.reset_index(drop=True)
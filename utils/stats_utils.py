@@ -0,0 +1,42 @@
+import pandas as pd
+
+from models.results import TimeStatus
+
+# !seasonstats sort keys -> (column, ascending)
+STAT_SORTS = {
+    "points": ("Points", False),
+    "wins": ("Wins", False),
+    "podiums": ("Podiums", False),
+    "avg": ("Avg Finish", True),
+    "dnf": ("DNFs", False),
+    "fl": ("Fastest Laps", False),
+    "ppr": ("Pts/Race", False),
+}
+
+
+def season_stats(table: pd.DataFrame, by: str) -> pd.DataFrame:
+    """
+    Aggregate every race result of every league in one group-by pass.
+    :param table: The columnar results table of a snapshot (ResultsIndex.table).
+    :param by: 'Driver' or 'Team'.
+    :return: One row per (League, Driver/Team) with races, wins, podiums, average finish,
+        DNFs, fastest laps, points and points per race.
+    """
+    classified = table["Position"] > 0
+    frame = table.assign(
+        Win=classified & (table["Position"] == 1),
+        Podium=classified & (table["Position"] <= 3),
+        Finish=table["Position"].where(classified),
+        DNF=table["Race Status"] == TimeStatus.DNF.value,
+    )
+    stats = frame.groupby(["League", by]).agg(
+        Races=("Race", "nunique"),
+        Wins=("Win", "sum"),
+        Podiums=("Podium", "sum"),
+        **{"Avg Finish": ("Finish", "mean")},
+        DNFs=("DNF", "sum"),
+        **{"Fastest Laps": ("Fastest Lap", "sum")},
+        Points=("Pts", "sum"),
+    )
+    stats["Pts/Race"] = stats["Points"] / stats["Races"]
+    return stats.reset_index()
@@ -0,0 +1,84 @@
+import heapq
+import json
+import os
+import re
+from datetime import datetime
+
+from models.penalty import PenaltyWindow
+
+WINDOWS_FILE = "penalty_windows.json"
+# Closed windows whose penalty report has not been posted yet
+REPORTS_FILE = "penalty_reports.json"
+
+
+def load_windows(path: str = WINDOWS_FILE) -> list[PenaltyWindow]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [PenaltyWindow.from_dict(data) for data in json.load(f)]
+
+
+def save_windows(windows: list[PenaltyWindow], path: str = WINDOWS_FILE):
+    """Write the open windows atomically, so a crash never leaves a half-written file."""
+    with open(path + ".part", "w", encoding="utf-8") as f:
+        json.dump([window.to_dict() for window in windows], f, indent=4)
+    os.replace(path + ".part", path)
+
+
+class WindowSchedule:
+    """
+    Open penalty windows keyed by (league, channel), with their closing times in one heap.
+    Reopening or cancelling a window leaves its old heap entry behind; stale entries are
+    skipped when they come up.
+    """
+
+    def __init__(self, windows: list[PenaltyWindow] = ()):
+        self.windows = {}  # (league, channel id) -> window
+        self.heap = []     # (end time, league, channel id)
+        for window in windows:
+            self.add(window)
+
+    def add(self, window: PenaltyWindow):
+        self.windows[window.key] = window
+        heapq.heappush(self.heap, (window.end_time, window.league, window.channel_id))
+
+    def remove(self, key: tuple[str, int]) -> PenaltyWindow | None:
+        return self.windows.pop(key, None)
+
+    def in_channel(self, channel_id: int) -> list[PenaltyWindow]:
+        """Open windows of a channel, the most recently opened (latest closing) first."""
+        return sorted((w for w in self.windows.values() if w.channel_id == channel_id),
+                      key=lambda w: w.end_time, reverse=True)
+
+    def for_thread(self, channel_id: int, thread_name: str) -> PenaltyWindow | None:
+        """
+        The open window a thread belongs to: the channel's only window, or the one whose league
+        the thread name is tagged with ("F2 3) ...", "[F2] Lap 1"). None if there is none, or if
+        several leagues are open and the name does not pick exactly one of them.
+        """
+        windows = self.in_channel(channel_id)
+        if len(windows) <= 1:
+            return windows[0] if windows else None
+        words = set(re.findall(r"[a-z0-9]+", thread_name.lower()))
+        tagged = [w for w in windows if w.league.lower() in words]
+        return tagged[0] if len(tagged) == 1 else None
+
+    def next_deadline(self) -> datetime | None:
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: datetime) -> list[PenaltyWindow]:
+        """Remove and return every window whose closing time has passed."""
+        due = []
+        while self.next_deadline() is not None and self.heap[0][0] <= now:
+            _, league, channel_id = heapq.heappop(self.heap)
+            due.append(self.windows.pop((league, channel_id)))
+        return due
+
+    def _drop_stale(self):
+        while self.heap:
+            end_time, league, channel_id = self.heap[0]
+            window = self.windows.get((league, channel_id))
+            if window is not None and window.end_time == end_time:
+                return
+            heapq.heappop(self.heap)